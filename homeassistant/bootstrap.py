@@ -2,6 +2,8 @@
 from __future__ import annotations
 
 import asyncio
+from collections import deque
+from collections.abc import Iterable
 import contextlib
 from datetime import datetime, timedelta
 import logging
@@ -27,6 +29,7 @@ from .const import (
 from .exceptions import HomeAssistantError
 from .helpers import (
     area_registry,
+    config_per_platform,
     device_registry,
     entity,
     entity_registry,
@@ -38,6 +41,7 @@ from .helpers import (
 from .helpers.dispatcher import async_dispatcher_send
 from .helpers.typing import ConfigType
 from .setup import (
+    BASE_PLATFORMS,
     DATA_SETUP,
     DATA_SETUP_STARTED,
     DATA_SETUP_TIME,
@@ -46,7 +50,7 @@ from .setup import (
 )
 from .util import dt as dt_util
 from .util.logging import async_activate_log_queue_handler
-from .util.package import async_get_user_site, is_virtual_env
+from .util.package import async_get_user_site, is_installed, is_virtual_env
 
 if TYPE_CHECKING:
     from .runner import RuntimeConfig
@@ -60,6 +64,8 @@ DATA_LOGGING = "logging"
 DATA_REGISTRIES_LOADED = "bootstrap_registries_loaded"
 
 LOG_SLOW_STARTUP_INTERVAL = 60
+PRELOAD_MAX_WORKERS = 8
+PRELOAD_TIMEOUT = 60
 SLOW_STARTUP_CHECK_INTERVAL = 1
 
 STAGE_1_TIMEOUT = 120
@@ -513,6 +519,71 @@ async def _async_watch_pending_setups(hass: core.HomeAssistant) -> None:
         _LOGGER.debug("Running timeout Zones: %s", hass.timeout.zones)
 
 
+async def _async_preload_integrations(
+    hass: core.HomeAssistant,
+    integrations: dict[str, loader.Integration],
+    config: dict[str, Any],
+) -> None:
+    """Import the component and platform modules of integrations in the executor.
+
+    Importing the modules from several threads overlaps the disk and bytecode
+    loading latency of the imports, so they are cached when the integrations
+    are set up.
+    """
+    platforms: dict[str, set[str]] = {}
+    if not hass.config.safe_mode:
+        for domain in hass.config_entries.async_domains():
+            if domain in integrations:
+                platforms[domain] = set(BASE_PLATFORMS)
+    for domain in integrations.keys() & BASE_PLATFORMS:
+        for p_name, _ in config_per_platform(config, domain):
+            if p_name is not None:
+                platforms.setdefault(p_name, set()).add(domain)
+
+    to_preload = dict(integrations)
+    if missing := platforms.keys() - to_preload.keys():
+        for domain, int_or_exc in (
+            await loader.async_get_integrations(hass, missing)
+        ).items():
+            if isinstance(int_or_exc, loader.Integration):
+                to_preload[domain] = int_or_exc
+
+    queue = deque(
+        (integration, platforms.get(domain, ()))
+        for domain, integration in to_preload.items()
+    )
+    _LOGGER.debug("Preloading integrations: %s", to_preload)
+    await asyncio.gather(
+        *(
+            hass.async_add_executor_job(_preload_integrations, queue)
+            for _ in range(min(PRELOAD_MAX_WORKERS, len(queue)))
+        )
+    )
+
+
+def _preload_integrations(
+    queue: deque[tuple[loader.Integration, Iterable[str]]]
+) -> None:
+    """Import the modules of the integrations in the queue until it is empty.
+
+    Integrations with requirements which are not installed are skipped. Their
+    modules are imported by the setup once it processed the requirements, so
+    the version of a library which is being upgraded is not imported first.
+    """
+    while True:
+        try:
+            integration, platform_names = queue.popleft()
+        except IndexError:
+            return
+        if not all(is_installed(req) for req in integration.requirements):
+            _LOGGER.debug(
+                "Not preloading %s, its requirements are not installed",
+                integration.domain,
+            )
+            continue
+        integration.import_modules(platform_names)
+
+
 async def async_setup_multi_components(
     hass: core.HomeAssistant,
     domains: set[str],
@@ -583,6 +654,41 @@ async def _async_set_up_integrations(
 
     _LOGGER.info("Domains to be set up: %s", domains_to_setup)
 
+    # calculate what components to setup in what stage
+    stage_1_domains: set[str] = set()
+
+    # Find all dependencies of any dependency of any stage 1 integration that
+    # we plan on loading and promote them to stage 1. This is done only to not
+    # get misleading log messages
+    deps_promotion: set[str] = STAGE_1_INTEGRATIONS
+    while deps_promotion:
+        old_deps_promotion = deps_promotion
+        deps_promotion = set()
+
+        for domain in old_deps_promotion:
+            if domain not in domains_to_setup or domain in stage_1_domains:
+                continue
+
+            stage_1_domains.add(domain)
+
+            if (dep_itg := integration_cache.get(domain)) is None:
+                continue
+
+            deps_promotion.update(dep_itg.all_dependencies)
+
+    # Import the modules of the stage 1 integrations while the first ones are set up
+    stage_1_preload_task = asyncio.create_task(
+        _async_preload_integrations(
+            hass,
+            {
+                domain: integration
+                for domain, integration in integration_cache.items()
+                if domain in stage_1_domains
+            },
+            config,
+        )
+    )
+
     # Initialize recorder
     if "recorder" in domains_to_setup:
         recorder.async_initialize_recorder(hass)
@@ -607,28 +713,6 @@ async def _async_set_up_integrations(
         _LOGGER.debug("Setting up debuggers: %s", debuggers)
         await async_setup_multi_components(hass, debuggers, config)
 
-    # calculate what components to setup in what stage
-    stage_1_domains: set[str] = set()
-
-    # Find all dependencies of any dependency of any stage 1 integration that
-    # we plan on loading and promote them to stage 1. This is done only to not
-    # get misleading log messages
-    deps_promotion: set[str] = STAGE_1_INTEGRATIONS
-    while deps_promotion:
-        old_deps_promotion = deps_promotion
-        deps_promotion = set()
-
-        for domain in old_deps_promotion:
-            if domain not in domains_to_setup or domain in stage_1_domains:
-                continue
-
-            stage_1_domains.add(domain)
-
-            if (dep_itg := integration_cache.get(domain)) is None:
-                continue
-
-            deps_promotion.update(dep_itg.all_dependencies)
-
     stage_2_domains = (
         domains_to_setup
         - logging_domains
@@ -638,6 +722,10 @@ async def _async_set_up_integrations(
         - stage_1_domains
     )
 
+    _, pending = await asyncio.wait({stage_1_preload_task}, timeout=PRELOAD_TIMEOUT)
+    if pending:
+        _LOGGER.warning("Preloading integrations timed out - moving forward")
+
     # Enables after dependencies when setting up stage 1 domains
     async_set_domains_to_be_loaded(hass, stage_1_domains)
 
@@ -656,6 +744,20 @@ async def _async_set_up_integrations(
     async_set_domains_to_be_loaded(hass, stage_2_domains)
 
     if stage_2_domains:
+        # Import the modules of the stage 2 integrations while they are set up. This
+        # is only done once stage 1 updated the requirements they may share.
+        hass.async_create_task(
+            _async_preload_integrations(
+                hass,
+                {
+                    domain: integration
+                    for domain, integration in integration_cache.items()
+                    if domain in stage_2_domains
+                },
+                config,
+            ),
+            "preload stage 2 integrations",
+        )
         _LOGGER.info("Setting up stage 2: %s", stage_2_domains)
         try:
             async with hass.timeout.async_timeout(
@@ -302,6 +302,7 @@ class SensorFilter(SensorEntity):
         """Register callbacks."""
 
         if "recorder" in self.hass.config.components:
+            instance = get_instance(self.hass)
             history_list = []
             largest_window_items = 0
             largest_window_time = timedelta(0)
@@ -321,7 +322,7 @@ class SensorFilter(SensorEntity):
 
             # Retrieve the largest window_size of each type
             if largest_window_items > 0:
-                filter_history = await get_instance(self.hass).async_add_executor_job(
+                filter_history = await instance.async_add_read_executor_job(
                     partial(
                         history.get_last_state_changes,
                         self.hass,
@@ -333,7 +334,7 @@ class SensorFilter(SensorEntity):
                     history_list.extend(filter_history[self._entity])
             if largest_window_time > timedelta(seconds=0):
                 start = dt_util.utcnow() - largest_window_time
-                filter_history = await get_instance(self.hass).async_add_executor_job(
+                filter_history = await instance.async_add_read_executor_job(
                     partial(
                         history.state_changes_during_period,
                         self.hass,
@@ -5,3 +5,7 @@ DOMAIN = "history"
 EVENT_COALESCE_TIME = 0.35
 
 MAX_PENDING_HISTORY_STATES = 2048
+
+# The smallest number of states which are streamed in one message, smaller
+# chunks send so many messages for long periods that the client falls behind
+MIN_HISTORY_CHUNK_SIZE = 100
@@ -1,9 +1,12 @@
 """Helpers for the history integration."""
 from __future__ import annotations
 
-from collections.abc import Iterable
+from collections.abc import Iterable, Iterator
 from datetime import datetime as dt
+import math
+from typing import Any
 
+from homeassistant.const import COMPRESSED_STATE_LAST_UPDATED, COMPRESSED_STATE_STATE
 from homeassistant.core import HomeAssistant
 
 
@@ -21,3 +24,59 @@ def entities_may_have_state_changes_after(
             return True
 
     return False
+
+
+def downsample_compressed_states(
+    states: Iterable[dict[str, Any]], start_ts: float, end_ts: float, max_points: int
+) -> Iterator[dict[str, Any]]:
+    """Downsample compressed states with min/max buckets.
+
+    The time range is split in max_points // 4 buckets and only the first,
+    minimum, maximum and last numeric state of each bucket are kept, which
+    preserves the shape of the series when it is drawn as a line. States
+    which are not numeric are always kept.
+
+    The states must be sorted by last_updated and are consumed lazily.
+    """
+    bucket_width = (end_ts - start_ts) / max(max_points // 4, 1)
+    if bucket_width <= 0:
+        yield from states
+        return
+
+    bucket_idx = 0
+    # (position, value, state) of the first, minimum, maximum
+    # and last numeric state in the current bucket
+    bucket: list[tuple[int, float, dict[str, Any]]] = []
+
+    for position, state in enumerate(states):
+        try:
+            value = float(state[COMPRESSED_STATE_STATE])
+        except (ValueError, TypeError):
+            value = math.nan
+        if not math.isfinite(value):
+            yield from _bucket_states(bucket)
+            bucket = []
+            yield state
+            continue
+        point = (position, value, state)
+        idx = int((state[COMPRESSED_STATE_LAST_UPDATED] - start_ts) // bucket_width)
+        if not bucket or idx != bucket_idx:
+            yield from _bucket_states(bucket)
+            bucket_idx = idx
+            bucket = [point, point, point, point]
+            continue
+        if value < bucket[1][1]:
+            bucket[1] = point
+        elif value > bucket[2][1]:
+            bucket[2] = point
+        bucket[3] = point
+
+    yield from _bucket_states(bucket)
+
+
+def _bucket_states(
+    bucket: list[tuple[int, float, dict[str, Any]]]
+) -> Iterator[dict[str, Any]]:
+    """Return the states of a bucket in order without duplicates."""
+    states = {position: state for position, _, state in bucket}
+    return (states[position] for position in sorted(states))
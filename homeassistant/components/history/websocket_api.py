@@ -2,16 +2,20 @@
 from __future__ import annotations
 
 import asyncio
-from collections.abc import Callable, Iterable, MutableMapping
+from collections.abc import Callable, Iterable, Iterator, MutableMapping
 from dataclasses import dataclass
 from datetime import datetime as dt
+from itertools import chain, groupby, islice
 import logging
+from operator import itemgetter
+import threading
 from typing import Any, cast
 
 import voluptuous as vol
 
 from homeassistant.components import websocket_api
 from homeassistant.components.recorder import get_instance, history
+from homeassistant.components.recorder.util import session_scope
 from homeassistant.components.websocket_api import messages
 from homeassistant.components.websocket_api.connection import ActiveConnection
 from homeassistant.const import (
@@ -36,10 +40,15 @@ from homeassistant.helpers.event import (
 )
 from homeassistant.helpers.json import JSON_DUMP
 from homeassistant.helpers.typing import EventType
+from homeassistant.util.async_ import run_callback_threadsafe
 import homeassistant.util.dt as dt_util
 
-from .const import EVENT_COALESCE_TIME, MAX_PENDING_HISTORY_STATES
-from .helpers import entities_may_have_state_changes_after
+from .const import (
+    EVENT_COALESCE_TIME,
+    MAX_PENDING_HISTORY_STATES,
+    MIN_HISTORY_CHUNK_SIZE,
+)
+from .helpers import downsample_compressed_states, entities_may_have_state_changes_after
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -72,27 +81,144 @@ def _ws_get_significant_states(
     significant_changes_only: bool,
     minimal_response: bool,
     no_attributes: bool,
+    max_points: int | None = None,
 ) -> str:
     """Fetch history significant_states and convert them to json in the executor."""
-    return JSON_DUMP(
-        messages.result_message(
-            msg_id,
-            history.get_significant_states(
-                hass,
-                start_time,
-                end_time,
-                entity_ids,
-                None,
-                include_start_time_state,
-                significant_changes_only,
-                minimal_response,
-                no_attributes,
-                True,
-            ),
+    states = history.get_significant_states(
+        hass,
+        start_time,
+        end_time,
+        entity_ids,
+        None,
+        include_start_time_state,
+        significant_changes_only,
+        minimal_response,
+        no_attributes,
+        True,
+    )
+    if max_points:
+        start_ts = dt_util.utc_to_timestamp(start_time)
+        end_ts = dt_util.utc_to_timestamp(end_time or dt_util.utcnow())
+        states = {
+            entity_id: list(
+                downsample_compressed_states(
+                    cast(list[dict[str, Any]], entity_states),
+                    start_ts,
+                    end_ts,
+                    max_points,
+                )
+            )
+            if len(entity_states) > max_points
+            else entity_states
+            for entity_id, entity_states in states.items()
+        }
+    return JSON_DUMP(messages.result_message(msg_id, states))
+
+
+def _downsample_chunks(
+    chunks: Iterable[tuple[str, list[Any]]],
+    start_time: dt,
+    end_time: dt | None,
+    max_points: int,
+    chunk_size: int,
+) -> Iterator[tuple[str, list[Any]]]:
+    """Downsample the states of each entity in a stream of chunks."""
+    start_ts = dt_util.utc_to_timestamp(start_time)
+    end_ts = dt_util.utc_to_timestamp(end_time or dt_util.utcnow())
+    for entity_id, entity_chunks in groupby(chunks, itemgetter(0)):
+        entity_states = downsample_compressed_states(
+            chain.from_iterable(states for _, states in entity_chunks),
+            start_ts,
+            end_ts,
+            max_points,
+        )
+        while states := list(islice(entity_states, chunk_size)):
+            yield entity_id, states
+
+
+def _generate_history_chunk_message(
+    msg_id: int, states: MutableMapping[str, list[Any]], partial: bool
+) -> str:
+    """Generate a history chunk websocket message."""
+    message: dict[str, Any] = {"states": states}
+    if partial:
+        message["partial"] = True
+    return JSON_DUMP(messages.event_message(msg_id, message))
+
+
+def _ws_stream_significant_states(
+    hass: HomeAssistant,
+    connection: ActiveConnection,
+    msg_id: int,
+    start_time: dt,
+    end_time: dt | None,
+    entity_ids: list[str],
+    include_start_time_state: bool,
+    significant_changes_only: bool,
+    minimal_response: bool,
+    no_attributes: bool,
+    chunk_size: int,
+    max_points: int | None,
+    cancel: threading.Event,
+) -> None:
+    """Fetch history significant_states and send them to the client in chunks.
+
+    Each message holds at most chunk_size states and is sent as soon as it
+    is full. All messages except the last one are marked as partial. The
+    next chunk is only fetched once the event loop has sent the previous
+    one so the chunks do not pile up in memory.
+    """
+    states: dict[str, list[Any]] = {}
+    states_count = 0
+    with session_scope(hass=hass, read_only=True) as session:
+        chunks = history.get_significant_state_chunks_with_session(
+            hass,
+            session,
+            start_time,
+            end_time,
+            entity_ids,
+            include_start_time_state,
+            significant_changes_only,
+            minimal_response,
+            no_attributes,
+            True,
+            chunk_size,
         )
+        if max_points:
+            chunks = _downsample_chunks(
+                chunks, start_time, end_time, max_points, chunk_size
+            )
+        for entity_id, entity_states in chunks:
+            if cancel.is_set():
+                return
+            if states_count + len(entity_states) > chunk_size:
+                run_callback_threadsafe(
+                    hass.loop,
+                    connection.send_message,
+                    _generate_history_chunk_message(msg_id, states, True),
+                ).result()
+                states = {}
+                states_count = 0
+            states.setdefault(entity_id, []).extend(entity_states)
+            states_count += len(entity_states)
+    hass.loop.call_soon_threadsafe(
+        connection.send_message,
+        _generate_history_chunk_message(msg_id, states, False),
     )
 
 
+@callback
+def _async_send_empty_history_response(
+    connection: ActiveConnection, msg_id: int, chunked: bool
+) -> None:
+    """Send an empty response when we know all results are filtered away."""
+    if not chunked:
+        connection.send_result(msg_id, {})
+        return
+    connection.send_result(msg_id)
+    connection.send_message(_generate_history_chunk_message(msg_id, {}, False))
+
+
 @websocket_api.websocket_command(
     {
         vol.Required("type"): "history/history_during_period",
@@ -103,15 +229,26 @@ def _ws_get_significant_states(
         vol.Optional("significant_changes_only", default=True): bool,
         vol.Optional("minimal_response", default=False): bool,
         vol.Optional("no_attributes", default=False): bool,
+        vol.Optional("chunk_size"): vol.All(int, vol.Range(min=MIN_HISTORY_CHUNK_SIZE)),
+        vol.Optional("max_points"): vol.All(int, vol.Range(min=1)),
     }
 )
 @websocket_api.async_response
 async def ws_get_history_during_period(
     hass: HomeAssistant, connection: websocket_api.ActiveConnection, msg: dict[str, Any]
 ) -> None:
-    """Handle history during period websocket command."""
+    """Handle history during period websocket command.
+
+    If chunk_size is set the states are streamed as event messages with
+    up to chunk_size states each after the result has been sent.
+
+    If max_points is set numeric series with more states are downsampled
+    to about max_points states.
+    """
     start_time_str = msg["start_time"]
     end_time_str = msg.get("end_time")
+    chunk_size: int | None = msg.get("chunk_size")
+    max_points: int | None = msg.get("max_points")
 
     if start_time := dt_util.parse_datetime(start_time_str):
         start_time = dt_util.as_utc(start_time)
@@ -129,7 +266,7 @@ async def ws_get_history_during_period(
         end_time = None
 
     if start_time > dt_util.utcnow():
-        connection.send_result(msg["id"], {})
+        _async_send_empty_history_response(connection, msg["id"], bool(chunk_size))
         return
 
     entity_ids: list[str] = msg["entity_ids"]
@@ -148,14 +285,45 @@ async def ws_get_history_during_period(
             hass, entity_ids, start_time, no_attributes
         )
     ):
-        connection.send_result(msg["id"], {})
+        _async_send_empty_history_response(connection, msg["id"], bool(chunk_size))
         return
 
     significant_changes_only = msg["significant_changes_only"]
     minimal_response = msg["minimal_response"]
 
+    if chunk_size:
+        cancel = threading.Event()
+
+        @callback
+        def _cancel() -> None:
+            """Stop streaming the history."""
+            cancel.set()
+
+        connection.subscriptions[msg["id"]] = _cancel
+        connection.send_result(msg["id"])
+        try:
+            await get_instance(hass).async_add_read_executor_job(
+                _ws_stream_significant_states,
+                hass,
+                connection,
+                msg["id"],
+                start_time,
+                end_time,
+                entity_ids,
+                include_start_time_state,
+                significant_changes_only,
+                minimal_response,
+                no_attributes,
+                chunk_size,
+                max_points,
+                cancel,
+            )
+        finally:
+            connection.subscriptions.pop(msg["id"], None)
+        return
+
     connection.send_message(
-        await get_instance(hass).async_add_executor_job(
+        await get_instance(hass).async_add_read_executor_job(
             _ws_get_significant_states,
             hass,
             msg["id"],
@@ -166,6 +334,7 @@ async def ws_get_history_during_period(
             significant_changes_only,
             minimal_response,
             no_attributes,
+            max_points,
         )
     )
 
@@ -278,7 +447,7 @@ async def _async_send_historical_states(
 ) -> dt | None:
     """Fetch history significant_states and send them to the client."""
     instance = get_instance(hass)
-    last_time_ts, last_time_dt, payload = await instance.async_add_executor_job(
+    last_time_ts, last_time_dt, payload = await instance.async_add_read_executor_job(
         _generate_historical_response,
         hass,
         msg_id,
@@ -145,7 +145,7 @@ class HistoryStats:
     ) -> None:
         """Update history data for the current period from the database."""
         instance = get_instance(self.hass)
-        states = await instance.async_add_executor_job(
+        states = await instance.async_add_read_executor_job(
             self._state_changes_during_period,
             current_period_start_timestamp,
             current_period_end_timestamp,
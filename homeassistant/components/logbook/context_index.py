@@ -0,0 +1,129 @@
+"""Index of the events which originated contexts for the logbook."""
+from __future__ import annotations
+
+from collections import OrderedDict
+from collections.abc import Callable, Container
+
+from homeassistant.const import ATTR_ENTITY_ID, EVENT_CALL_SERVICE, EVENT_STATE_CHANGED
+from homeassistant.core import Event, callback
+import homeassistant.util.dt as dt_util
+
+from .models import EventAsRow, async_event_to_row
+
+# The number of context origins to keep in memory
+#
+# Based on:
+# - The number of automation, script and service call contexts
+#   fired in a week on a busy instance
+# - How much memory our low end hardware has
+MAX_CONTEXT_ORIGINS = 65536
+
+# The number of recent events which are kept until another event
+# with the same context or parent context shows they originated
+# a context which spans more than one row.
+MAX_RECENT_CONTEXTS = 4096
+
+
+class ContextOriginIndex:
+    """Map context ids to the row of the event which originated the context.
+
+    The logbook needs the origin of a context to describe what caused
+    an entry. Without the index it has to union the rows of all the
+    contexts in the window into the query.
+
+    Events which are described by the logbook and service calls are
+    indexed as they are fired. Other events are only indexed once
+    another event shares their context or uses it as parent context,
+    which keeps the state changes of devices out of the index.
+
+    The index only covers the contexts which originated after it started
+    or after the origins and recent events it evicted, older windows are
+    still queried with the context rows.
+    """
+
+    __slots__ = (
+        "covered_since",
+        "_origins",
+        "_recent",
+        "_external_events",
+        "_entity_filter",
+        "_exclude_event_types",
+    )
+
+    def __init__(
+        self,
+        external_events: Container[str],
+        entity_filter: Callable[[str], bool],
+        exclude_event_types: Container[str],
+    ) -> None:
+        """Initialize the index."""
+        self.covered_since = dt_util.utcnow().timestamp()
+        self._origins: OrderedDict[str, EventAsRow] = OrderedDict()
+        self._recent: OrderedDict[str, Event] = OrderedDict()
+        self._external_events = external_events
+        self._entity_filter = entity_filter
+        self._exclude_event_types = exclude_event_types
+
+    def covers(self, start_time_ts: float) -> bool:
+        """Return if the origins of the contexts after the start time are indexed."""
+        return start_time_ts >= self.covered_since
+
+    def get(self, context_id: str | None) -> EventAsRow | None:
+        """Return the row which originated a context."""
+        return self._origins.get(context_id)
+
+    def _add_origin(self, context_id: str, row: EventAsRow) -> None:
+        """Add the row which originated a context and evict the oldest origin."""
+        origins = self._origins
+        origins[context_id] = row
+        if len(origins) > MAX_CONTEXT_ORIGINS:
+            _, evicted = origins.popitem(last=False)
+            self.covered_since = max(self.covered_since, evicted.time_fired_ts)
+
+    def _promote_recent(self, context_id: str) -> None:
+        """Index a recent event once it is known to originate a shared context."""
+        if event := self._recent.pop(context_id, None):
+            self._add_origin(context_id, async_event_to_row(event))
+
+    @callback
+    def async_index_event(self, event: Event) -> None:
+        """Index the context of an event which is recorded."""
+        if not self._is_recorded(event):
+            return
+        context = event.context
+        context_id = context.id
+        if context_id in self._origins:
+            return
+        if (parent_id := context.parent_id) is not None:
+            self._promote_recent(parent_id)
+        if context_id in self._recent:
+            self._promote_recent(context_id)
+            return
+        event_type = event.event_type
+        if event_type == EVENT_CALL_SERVICE or event_type in self._external_events:
+            self._add_origin(context_id, async_event_to_row(event))
+            return
+        recent = self._recent
+        recent[context_id] = event
+        if len(recent) > MAX_RECENT_CONTEXTS:
+            # The evicted event can no longer be promoted when its context
+            # turns out to be shared, so it is not covered anymore
+            _, evicted = recent.popitem(last=False)
+            self.covered_since = max(
+                self.covered_since, dt_util.utc_to_timestamp(evicted.time_fired)
+            )
+
+    def _is_recorded(self, event: Event) -> bool:
+        """Return if the recorder records the event the same way it filters events."""
+        if event.event_type in self._exclude_event_types:
+            return False
+        if event.event_type == EVENT_STATE_CHANGED and event.data["new_state"] is None:
+            # Removed entities do not have a new state to describe
+            return False
+        if (entity_id := event.data.get(ATTR_ENTITY_ID)) is None:
+            return True
+        if isinstance(entity_id, str):
+            return self._entity_filter(entity_id)
+        if isinstance(entity_id, list):
+            return any(self._entity_filter(eid) for eid in entity_id)
+        return True
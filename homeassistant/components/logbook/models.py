@@ -3,7 +3,7 @@ from __future__ import annotations
 
 from collections.abc import Callable
 from dataclasses import dataclass
-from typing import Any, cast
+from typing import TYPE_CHECKING, Any, cast
 
 from sqlalchemy.engine.row import Row
 
@@ -11,6 +11,7 @@ from homeassistant.components.recorder.filters import Filters
 from homeassistant.components.recorder.models import (
     bytes_to_ulid_or_none,
     bytes_to_uuid_hex_or_none,
+    decompress_shared_json,
     ulid_to_bytes_or_none,
     uuid_hex_to_bytes_or_none,
 )
@@ -20,6 +21,9 @@ import homeassistant.util.dt as dt_util
 from homeassistant.util.json import json_loads
 from homeassistant.util.ulid import ulid_to_bytes
 
+if TYPE_CHECKING:
+    from .context_index import ContextOriginIndex
+
 
 @dataclass(slots=True)
 class LogbookConfig:
@@ -30,6 +34,28 @@ class LogbookConfig:
     ]
     sqlalchemy_filter: Filters | None = None
     entity_filter: Callable[[str], bool] | None = None
+    context_index: ContextOriginIndex | None = None
+
+
+@dataclass(slots=True, frozen=True)
+class LogbookCursor:
+    """The position of the oldest row of a page of logbook rows.
+
+    The row_id is the state_id of the rows of states and the event_id
+    of the rows of events, so is_state tells them apart.
+    """
+
+    time_fired_ts: float
+    row_id: int
+    is_state: bool
+
+    def as_dict(self) -> dict[str, float | int | bool]:
+        """Return the cursor as a dict for the websocket api."""
+        return {
+            "time_fired_ts": self.time_fired_ts,
+            "row_id": self.row_id,
+            "is_state": self.is_state,
+        }
 
 
 class LazyEventPartialState:
@@ -77,7 +103,7 @@ class LazyEventPartialState:
             self.data = event_data
         else:
             self.data = self._event_data_cache[source] = cast(
-                dict[str, Any], json_loads(source)
+                dict[str, Any], json_loads(decompress_shared_json(source))
             )
 
     @property
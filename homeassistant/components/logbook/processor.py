@@ -10,10 +10,13 @@ from typing import Any
 
 from sqlalchemy.engine import Result
 from sqlalchemy.engine.row import Row
+from sqlalchemy.orm import Session
 
 from homeassistant.components.recorder import get_instance
+from homeassistant.components.recorder.const import SQLITE_MAX_BIND_VARS
 from homeassistant.components.recorder.filters import Filters
 from homeassistant.components.recorder.models import (
+    bytes_to_ulid_or_none,
     bytes_to_uuid_hex_or_none,
     extract_event_type_ids,
     extract_metadata_ids,
@@ -21,6 +24,7 @@ from homeassistant.components.recorder.models import (
     process_timestamp_to_utc_isoformat,
 )
 from homeassistant.components.recorder.util import (
+    chunked,
     execute_stmt_lambda_element,
     session_scope,
 )
@@ -60,10 +64,18 @@ from .const import (
     LOGBOOK_ENTRY_STATE,
     LOGBOOK_ENTRY_WHEN,
 )
+from .context_index import ContextOriginIndex
 from .helpers import is_sensor_continuous
-from .models import EventAsRow, LazyEventPartialState, LogbookConfig, async_event_to_row
+from .models import (
+    EventAsRow,
+    LazyEventPartialState,
+    LogbookConfig,
+    LogbookCursor,
+    async_event_to_row,
+)
 from .queries import statement_for_request
 from .queries.common import PSEUDO_EVENT_STATE_CHANGED
+from .queries.contexts import contexts_stmt
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -108,6 +120,7 @@ class EventProcessor:
         self.context_id = context_id
         logbook_config: LogbookConfig = hass.data[DOMAIN]
         self.filters: Filters | None = logbook_config.sqlalchemy_filter
+        self.context_index = logbook_config.context_index
         format_time = (
             _row_time_fired_timestamp if timestamp else _row_time_fired_isoformat
         )
@@ -142,32 +155,98 @@ class EventProcessor:
     ) -> list[dict[str, Any]]:
         """Get events for a period of time."""
         with session_scope(hass=self.hass, read_only=True) as session:
-            metadata_ids: list[int] | None = None
-            instance = get_instance(self.hass)
-            if self.entity_ids:
-                metadata_ids = extract_metadata_ids(
-                    instance.states_meta_manager.get_many(
-                        self.entity_ids, session, False
-                    )
-                )
-            event_type_ids = tuple(
-                extract_event_type_ids(
-                    instance.event_type_manager.get_many(self.event_types, session)
+            return self.humanify(self._get_rows(session, start_day, end_day))
+
+    def get_events_page(
+        self,
+        start_day: dt,
+        end_day: dt,
+        limit: int,
+        cursor: LogbookCursor | None = None,
+    ) -> tuple[list[dict[str, Any]], LogbookCursor | None]:
+        """Get the events of a page of the newest rows before the cursor.
+
+        The events are in the same order as get_events. Returns the
+        cursor of the next page or None when there are no older rows.
+        """
+        with session_scope(hass=self.hass, read_only=True) as session:
+            rows = list(self._get_rows(session, start_day, end_day, limit, cursor))
+            next_cursor: LogbookCursor | None = None
+            if len(rows) == limit:
+                oldest = rows[-1]
+                next_cursor = LogbookCursor(
+                    oldest.time_fired_ts,
+                    oldest.row_id,
+                    oldest.event_type is PSEUDO_EVENT_STATE_CHANGED,
                 )
+            rows.reverse()
+            if self.context_augmenter.context_index is None:
+                # The origins of the contexts can be on older pages so the
+                # rows of the contexts of the page are selected by their ids
+                context_id_bins = {row.context_id_bin for row in rows}
+                context_id_bins.discard(None)
+                context_rows: list[Row] = []
+                for context_id_bins_chunk in chunked(
+                    context_id_bins, SQLITE_MAX_BIND_VARS // 2
+                ):
+                    context_rows.extend(
+                        execute_stmt_lambda_element(
+                            session,
+                            contexts_stmt(context_id_bins_chunk),
+                            orm_rows=False,
+                        )
+                    )
+                rows = [*context_rows, *rows]
+            # The rows are humanified oldest first as the origins
+            # of the contexts have to be seen before their rows
+            return self.humanify(rows), next_cursor
+
+    def _get_rows(
+        self,
+        session: Session,
+        start_day: dt,
+        end_day: dt,
+        limit: int | None = None,
+        cursor: LogbookCursor | None = None,
+    ) -> Sequence[Row] | Result:
+        """Select the rows for a period of time."""
+        metadata_ids: list[int] | None = None
+        instance = get_instance(self.hass)
+        if self.entity_ids:
+            metadata_ids = extract_metadata_ids(
+                instance.states_meta_manager.get_many(self.entity_ids, session, False)
             )
-            stmt = statement_for_request(
-                start_day,
-                end_day,
-                event_type_ids,
-                self.entity_ids,
-                metadata_ids,
-                self.device_ids,
-                self.filters,
-                self.context_id,
-            )
-            return self.humanify(
-                execute_stmt_lambda_element(session, stmt, orm_rows=False)
+        event_type_ids = tuple(
+            extract_event_type_ids(
+                instance.event_type_manager.get_many(self.event_types, session)
             )
+        )
+        # The origins of the contexts of the entities and devices are
+        # looked up in the context index instead of selecting the rows
+        # of the contexts when the index covers the whole window
+        context_index = self.context_index
+        if not (
+            context_index is not None
+            and (self.entity_ids or self.device_ids)
+            and context_index.covers(start_day.timestamp())
+        ):
+            context_index = None
+        self.context_augmenter.context_index = context_index
+        stmt = statement_for_request(
+            start_day,
+            end_day,
+            event_type_ids,
+            self.entity_ids,
+            metadata_ids,
+            self.device_ids,
+            self.filters,
+            self.context_id,
+            # The rows of the contexts of a page are selected separately
+            context_rows=context_index is None and limit is None,
+            limit=limit,
+            cursor=cursor,
+        )
+        return execute_stmt_lambda_element(session, stmt, orm_rows=False)
 
     def humanify(
         self, rows: Generator[EventAsRow, None, None] | Sequence[Row] | Result
@@ -281,21 +360,39 @@ class ContextAugmenter:
         self.external_events = logbook_run.external_events
         self.event_cache = logbook_run.event_cache
         self.include_entity_name = logbook_run.include_entity_name
+        self.context_index: ContextOriginIndex | None = None
 
     def _get_context_row(
         self, context_id_bin: bytes | None, row: Row | EventAsRow
     ) -> Row | EventAsRow | None:
         """Get the context row from the id or row context."""
-        if context_id_bin is not None and (
-            context_row := self.context_lookup.get(context_id_bin)
-        ):
-            return context_row
+        if context_id_bin is not None:
+            if (context_index := self.context_index) is not None and (
+                context_row := context_index.get(bytes_to_ulid_or_none(context_id_bin))
+            ):
+                return context_row
+            if context_row := self.context_lookup.get(context_id_bin):
+                return context_row
         if (context := getattr(row, "context", None)) is not None and (
             origin_event := context.origin_event
         ) is not None:
             return async_event_to_row(origin_event)
         return None
 
+    def _is_origin(self, row: Row | EventAsRow, context_row: Row | EventAsRow) -> bool:
+        """Check if the row is the context row."""
+        if _rows_match(row, context_row):
+            return True
+        # The rows of the context index are not read from the database
+        # so they are matched by the event they were created from
+        return (
+            self.context_index is not None
+            and type(context_row) is EventAsRow  # noqa: E721
+            and row.time_fired_ts == context_row.time_fired_ts
+            and row.event_type == context_row.event_type
+            and row.entity_id == context_row.entity_id
+        )
+
     def augment(
         self, data: dict[str, Any], row: Row | EventAsRow, context_id_bin: bytes | None
     ) -> None:
@@ -306,7 +403,7 @@ class ContextAugmenter:
         if not (context_row := self._get_context_row(context_id_bin, row)):
             return
 
-        if _rows_match(row, context_row):
+        if self._is_origin(row, context_row):
             # This is the first event with the given ID. Was it directly caused by
             # a parent event?
             context_parent_id_bin = row.context_parent_id_bin
@@ -322,7 +419,7 @@ class ContextAugmenter:
                 return
             # Ensure the (parent) context_event exists and is not the root cause of
             # this log entry.
-            if _rows_match(row, context_row):
+            if self._is_origin(row, context_row):
                 return
         event_type = context_row.event_type
         # State change
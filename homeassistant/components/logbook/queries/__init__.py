@@ -3,6 +3,7 @@ from __future__ import annotations
 
 from collections.abc import Collection
 from datetime import datetime as dt
+import math
 
 from sqlalchemy.sql.lambdas import StatementLambdaElement
 
@@ -11,7 +12,9 @@ from homeassistant.components.recorder.models import ulid_to_bytes_or_none
 from homeassistant.helpers.json import json_dumps
 from homeassistant.util import dt as dt_util
 
+from ..models import LogbookCursor
 from .all import all_stmt
+from .common import select_newest_rows, select_rows_before
 from .devices import devices_stmt
 from .entities import entities_stmt
 from .entities_and_devices import entities_devices_stmt
@@ -26,10 +29,63 @@ def statement_for_request(
     device_ids: list[str] | None = None,
     filters: Filters | None = None,
     context_id: str | None = None,
+    context_rows: bool = True,
+    limit: int | None = None,
+    cursor: LogbookCursor | None = None,
 ) -> StatementLambdaElement:
-    """Generate the logbook statement for a logbook request."""
+    """Generate the logbook statement for a logbook request.
+
+    The rows of the contexts of the entities and devices are only
+    selected with context_rows, without them the origins of the
+    contexts have to be found in the context index.
+
+    With a limit only a page of the newest rows before the cursor
+    is selected, newest first. The rows of the contexts of a page
+    are selected with contexts_stmt.
+    """
     start_day = dt_util.utc_to_timestamp(start_day_dt)
     end_day = dt_util.utc_to_timestamp(end_day_dt)
+    if cursor is not None:
+        # The window ends right after the cursor as the rows
+        # fired at the time of the cursor are selected by their id
+        end_day = min(end_day, math.nextafter(cursor.time_fired_ts, math.inf))
+    stmt = _statement_for_window(
+        start_day,
+        end_day,
+        event_type_ids,
+        entity_ids,
+        states_metadata_ids,
+        device_ids,
+        filters,
+        context_id,
+        context_rows,
+    )
+    if limit is None:
+        return stmt
+    if cursor is None:
+        stmt += lambda s: select_newest_rows(s, limit)
+        return stmt
+    cursor_time_fired_ts = cursor.time_fired_ts
+    cursor_row_id = cursor.row_id
+    cursor_is_state = int(cursor.is_state)
+    stmt += lambda s: select_rows_before(
+        s, limit, cursor_time_fired_ts, cursor_row_id, cursor_is_state
+    )
+    return stmt
+
+
+def _statement_for_window(
+    start_day: float,
+    end_day: float,
+    event_type_ids: tuple[int, ...],
+    entity_ids: list[str] | None,
+    states_metadata_ids: Collection[int] | None,
+    device_ids: list[str] | None,
+    filters: Filters | None,
+    context_id: str | None,
+    context_rows: bool,
+) -> StatementLambdaElement:
+    """Generate the logbook statement for the rows of a window."""
     # No entities: logbook sends everything for the timeframe
     # limited by the context_id and the yaml configured filter
     if not entity_ids and not device_ids:
@@ -56,6 +112,7 @@ def statement_for_request(
             states_metadata_ids or [],
             [json_dumps(entity_id) for entity_id in entity_ids],
             [json_dumps(device_id) for device_id in device_ids],
+            context_rows,
         )
 
     # entities: logbook sends everything for the timeframe for the entities
@@ -66,6 +123,7 @@ def statement_for_request(
             event_type_ids,
             states_metadata_ids or [],
             [json_dumps(entity_id) for entity_id in entity_ids],
+            context_rows,
         )
 
     # devices: logbook sends everything for the timeframe for the devices
@@ -75,4 +133,5 @@ def statement_for_request(
         end_day,
         event_type_ids,
         [json_dumps(device_id) for device_id in device_ids],
+        context_rows,
     )
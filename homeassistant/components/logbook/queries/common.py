@@ -7,7 +7,7 @@ import sqlalchemy
 from sqlalchemy import select
 from sqlalchemy.sql.elements import BooleanClauseList, ColumnElement
 from sqlalchemy.sql.expression import literal
-from sqlalchemy.sql.selectable import Select
+from sqlalchemy.sql.selectable import CompoundSelect, Select, Subquery
 
 from homeassistant.components.recorder.db_schema import (
     EVENTS_CONTEXT_ID_BIN_INDEX,
@@ -251,6 +251,67 @@ def _not_uom_attributes_matcher() -> BooleanClauseList:
     ) | ~States.attributes.like(UNIT_OF_MEASUREMENT_JSON_LIKE)
 
 
+def _row_is_state(rows: Subquery) -> ColumnElement[int]:
+    """Return 1 for the rows of states and 0 for the rows of events.
+
+    The row_id of a row is the state_id or the event_id, so the same id
+    can be used by a state and an event.
+    """
+    return sqlalchemy.case(
+        (rows.c.event_type.is_(PSEUDO_EVENT_STATE_CHANGED), 1), else_=0
+    )
+
+
+def select_newest_rows(sel: Select | CompoundSelect, limit: int) -> Select:
+    """Select the newest rows of a logbook select, newest first."""
+    rows = sel.order_by(None).subquery()
+    return (
+        select(rows)
+        .order_by(
+            rows.c.time_fired_ts.desc(),
+            _row_is_state(rows).desc(),
+            rows.c.row_id.desc(),
+        )
+        .limit(limit)
+    )
+
+
+def select_rows_before(
+    sel: Select | CompoundSelect,
+    limit: int,
+    cursor_time_fired_ts: float,
+    cursor_row_id: int,
+    cursor_is_state: int,
+) -> Select:
+    """Select the newest rows of a logbook select before a cursor, newest first.
+
+    The time, the table and the id of a row are the key of the pages
+    as rows which were fired at the same time can be split across pages.
+    """
+    rows = sel.order_by(None).subquery()
+    row_is_state = _row_is_state(rows)
+    return (
+        select(rows)
+        .where(
+            (rows.c.time_fired_ts < cursor_time_fired_ts)
+            | (
+                (rows.c.time_fired_ts == cursor_time_fired_ts)
+                & (
+                    (row_is_state < cursor_is_state)
+                    | (
+                        (row_is_state == cursor_is_state)
+                        & (rows.c.row_id < cursor_row_id)
+                    )
+                )
+            )
+        )
+        .order_by(
+            rows.c.time_fired_ts.desc(), row_is_state.desc(), rows.c.row_id.desc()
+        )
+        .limit(limit)
+    )
+
+
 def apply_states_context_hints(sel: Select) -> Select:
     """Force mysql to use the right index on large context_id selects."""
     return sel.with_hint(
@@ -0,0 +1,42 @@
+"""Contexts queries for logbook."""
+from __future__ import annotations
+
+from collections.abc import Collection
+
+from sqlalchemy import lambda_stmt
+from sqlalchemy.sql.lambdas import StatementLambdaElement
+
+from homeassistant.components.recorder.db_schema import (
+    EventData,
+    Events,
+    EventTypes,
+    States,
+    StatesMeta,
+)
+
+from .common import (
+    apply_events_context_hints,
+    apply_states_context_hints,
+    select_events_context_only,
+    select_states_context_only,
+)
+
+
+def contexts_stmt(context_id_bins: Collection[bytes]) -> StatementLambdaElement:
+    """Generate a logbook query for the rows of the contexts of a page of rows."""
+    return lambda_stmt(
+        lambda: apply_events_context_hints(
+            select_events_context_only()
+            .where(Events.context_id_bin.in_(context_id_bins))
+            .outerjoin(EventTypes, (Events.event_type_id == EventTypes.event_type_id))
+            .outerjoin(EventData, (Events.data_id == EventData.data_id))
+        )
+        .union_all(
+            apply_states_context_hints(
+                select_states_context_only()
+                .where(States.context_id_bin.in_(context_id_bins))
+                .outerjoin(StatesMeta, (States.metadata_id == StatesMeta.metadata_id))
+            )
+        )
+        .order_by(Events.time_fired_ts)
+    )
@@ -25,7 +25,7 @@ from .helpers import (
     async_filter_entities,
     async_subscribe_events,
 )
-from .models import LogbookConfig, async_event_to_row
+from .models import LogbookConfig, LogbookCursor, async_event_to_row
 from .processor import EventProcessor
 
 MAX_PENDING_LOGBOOK_EVENTS = 2048
@@ -34,6 +34,17 @@ EVENT_COALESCE_TIME = 0.35
 BIG_QUERY_HOURS = 25
 # how many hours to deliver in the first chunk when we split the query
 BIG_QUERY_RECENT_HOURS = 24
+# the maximum number of rows of a page
+MAX_PAGE_SIZE = 1000
+
+PAGE_LIMIT_SCHEMA = vol.All(int, vol.Range(min=1, max=MAX_PAGE_SIZE))
+PAGE_CURSOR_SCHEMA = vol.Schema(
+    {
+        vol.Required("time_fired_ts"): vol.Coerce(float),
+        vol.Required("row_id"): int,
+        vol.Required("is_state"): bool,
+    }
+)
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -83,6 +94,7 @@ async def _async_send_historical_events(
     event_processor: EventProcessor,
     partial: bool,
     force_send: bool = False,
+    limit: int | None = None,
 ) -> dt | None:
     """Select historical data from the database and deliver it to the websocket.
 
@@ -92,11 +104,15 @@ async def _async_send_historical_events(
     they are not stuck at a loading screen and can start looking at
     the data right away.
 
+    With a limit only the newest page of rows is delivered with the
+    cursor to fetch the older pages.
+
     This function returns the time of the most recent event we sent to the
     websocket.
     """
     is_big_query = (
-        not event_processor.entity_ids
+        limit is None
+        and not event_processor.entity_ids
         and not event_processor.device_ids
         and ((end_time - start_time) > timedelta(hours=BIG_QUERY_HOURS))
     )
@@ -110,6 +126,7 @@ async def _async_send_historical_events(
             formatter,
             event_processor,
             partial,
+            limit,
         )
         # If there is no last_event_time, there are no historical
         # results, but we still send an empty message
@@ -165,9 +182,10 @@ async def _async_get_ws_stream_events(
     formatter: Callable[[int, Any], dict[str, Any]],
     event_processor: EventProcessor,
     partial: bool,
+    limit: int | None = None,
 ) -> tuple[str, dt | None]:
     """Async wrapper around _ws_formatted_get_events."""
-    return await get_instance(hass).async_add_executor_job(
+    return await get_instance(hass).async_add_read_executor_job(
         _ws_stream_get_events,
         msg_id,
         start_time,
@@ -175,6 +193,7 @@ async def _async_get_ws_stream_events(
         formatter,
         event_processor,
         partial,
+        limit,
     )
 
 
@@ -196,13 +215,22 @@ def _ws_stream_get_events(
     formatter: Callable[[int, Any], dict[str, Any]],
     event_processor: EventProcessor,
     partial: bool,
+    limit: int | None,
 ) -> tuple[str, dt | None]:
     """Fetch events and convert them to json in the executor."""
-    events = event_processor.get_events(start_day, end_day)
+    cursor: LogbookCursor | None = None
+    if limit is None:
+        events = event_processor.get_events(start_day, end_day)
+    else:
+        events, cursor = event_processor.get_events_page(start_day, end_day, limit)
     last_time = None
     if events:
         last_time = dt_util.utc_from_timestamp(events[-1]["when"])
     message = _generate_stream_message(events, start_day, end_day)
+    if limit is not None:
+        # The cursor of the older rows which can be
+        # fetched with logbook/get_events
+        message["cursor"] = cursor.as_dict() if cursor else None
     if partial:
         # This is a hint to consumers of the api that
         # we are about to send a another block of historical
@@ -254,6 +282,7 @@ async def _async_events_consumer(
         vol.Optional("end_time"): str,
         vol.Optional("entity_ids"): [str],
         vol.Optional("device_ids"): [str],
+        vol.Optional("limit"): PAGE_LIMIT_SCHEMA,
     }
 )
 @websocket_api.async_response
@@ -316,6 +345,7 @@ async def ws_event_stream(
             messages.event_message,
             event_processor,
             partial=False,
+            limit=msg.get("limit"),
         )
         return
 
@@ -388,6 +418,7 @@ async def ws_event_stream(
         # we want to make sure the client is not still spinning
         # because it is waiting for the first message
         force_send=True,
+        limit=msg.get("limit"),
     )
 
     if msg_id not in connection.subscriptions:
@@ -444,6 +475,36 @@ def _ws_formatted_get_events(
     )
 
 
+def _ws_formatted_get_events_page(
+    msg_id: int,
+    start_time: dt,
+    end_time: dt,
+    event_processor: EventProcessor,
+    limit: int,
+    cursor: LogbookCursor | None,
+) -> str:
+    """Fetch a page of events and convert it to json in the executor."""
+    events, next_cursor = event_processor.get_events_page(
+        start_time, end_time, limit, cursor
+    )
+    return JSON_DUMP(
+        messages.result_message(
+            msg_id,
+            {
+                "events": events,
+                "cursor": next_cursor.as_dict() if next_cursor else None,
+            },
+        )
+    )
+
+
+def _empty_result(limit: int | None) -> list[Any] | dict[str, Any]:
+    """Return the result of a request without events."""
+    if limit is None:
+        return []
+    return {"events": [], "cursor": None}
+
+
 @websocket_api.websocket_command(
     {
         vol.Required("type"): "logbook/get_events",
@@ -452,17 +513,37 @@ def _ws_formatted_get_events(
         vol.Optional("entity_ids"): [str],
         vol.Optional("device_ids"): [str],
         vol.Optional("context_id"): str,
+        vol.Optional("limit"): PAGE_LIMIT_SCHEMA,
+        vol.Optional("cursor"): PAGE_CURSOR_SCHEMA,
     }
 )
 @websocket_api.async_response
 async def ws_get_events(
     hass: HomeAssistant, connection: websocket_api.ActiveConnection, msg: dict[str, Any]
 ) -> None:
-    """Handle logbook get events websocket command."""
+    """Handle logbook get events websocket command.
+
+    With a limit the result is a page of the newest events with the
+    cursor to pass to get the page of the older events.
+    """
     start_time_str = msg["start_time"]
     end_time_str = msg.get("end_time")
+    limit: int | None = msg.get("limit")
     utc_now = dt_util.utcnow()
 
+    cursor: LogbookCursor | None = None
+    if cursor_dict := msg.get("cursor"):
+        if limit is None:
+            connection.send_error(
+                msg["id"], "invalid_cursor", "A cursor requires a limit"
+            )
+            return
+        cursor = LogbookCursor(
+            cursor_dict["time_fired_ts"],
+            cursor_dict["row_id"],
+            cursor_dict["is_state"],
+        )
+
     if start_time := dt_util.parse_datetime(start_time_str):
         start_time = dt_util.as_utc(start_time)
     else:
@@ -478,7 +559,7 @@ async def ws_get_events(
         return
 
     if start_time > utc_now:
-        connection.send_result(msg["id"], [])
+        connection.send_result(msg["id"], _empty_result(limit))
         return
 
     device_ids = msg.get("device_ids")
@@ -488,7 +569,7 @@ async def ws_get_events(
         entity_ids = async_filter_entities(hass, entity_ids)
         if not entity_ids and not device_ids:
             # Everything has been filtered away
-            connection.send_result(msg["id"], [])
+            connection.send_result(msg["id"], _empty_result(limit))
             return
 
     event_types = async_determine_event_types(hass, entity_ids, device_ids)
@@ -503,8 +584,22 @@ async def ws_get_events(
         include_entity_name=False,
     )
 
+    if limit is not None:
+        connection.send_message(
+            await get_instance(hass).async_add_read_executor_job(
+                _ws_formatted_get_events_page,
+                msg["id"],
+                start_time,
+                end_time,
+                event_processor,
+                limit,
+                cursor,
+            )
+        )
+        return
+
     connection.send_message(
-        await get_instance(hass).async_add_executor_job(
+        await get_instance(hass).async_add_read_executor_job(
             _ws_formatted_get_events,
             msg["id"],
             start_time,
@@ -120,7 +120,7 @@ def setup(hass: HomeAssistant, config: ConfigType) -> bool:
         default_metric,
     )
 
-    hass.bus.listen(EVENT_STATE_CHANGED, metrics.handle_state_changed_event)
+    hass.bus.listen_batched(EVENT_STATE_CHANGED, metrics.handle_state_changed_events)
     hass.bus.listen(
         EVENT_ENTITY_REGISTRY_UPDATED, metrics.handle_entity_registry_updated
     )
@@ -167,6 +167,11 @@ class PrometheusMetrics:
         self._metrics = {}
         self._climate_units = climate_units
 
+    def handle_state_changed_events(self, events):
+        """Handle a batch of state changed events from the bus."""
+        for event in events:
+            self.handle_state_changed_event(event)
+
     def handle_state_changed_event(self, event):
         """Handle new messages from the bus."""
         if (state := event.data.get("new_state")) is None:
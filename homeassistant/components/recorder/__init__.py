@@ -54,6 +54,8 @@ CONF_DB_MAX_RETRIES = "db_max_retries"
 CONF_DB_RETRY_WAIT = "db_retry_wait"
 CONF_PURGE_KEEP_DAYS = "purge_keep_days"
 CONF_PURGE_INTERVAL = "purge_interval"
+CONF_PURGE_BY_DAY = "purge_by_day"
+CONF_COMPRESS_SHARED_DATA = "compress_shared_data"
 CONF_EVENT_TYPES = "event_types"
 CONF_COMMIT_INTERVAL = "commit_interval"
 
@@ -95,6 +97,8 @@ CONFIG_SCHEMA = vol.Schema(
                         vol.Coerce(int), vol.Range(min=1)
                     ),
                     vol.Optional(CONF_PURGE_INTERVAL, default=1): cv.positive_int,
+                    vol.Optional(CONF_PURGE_BY_DAY, default=False): cv.boolean,
+                    vol.Optional(CONF_COMPRESS_SHARED_DATA, default=False): cv.boolean,
                     vol.Optional(CONF_DB_URL): vol.All(cv.string, validate_db_url),
                     vol.Optional(
                         CONF_COMMIT_INTERVAL, default=DEFAULT_COMMIT_INTERVAL
@@ -157,7 +161,10 @@ async def async_setup(hass: HomeAssistant, config: ConfigType) -> bool:
         db_retry_wait=db_retry_wait,
         entity_filter=entity_filter,
         exclude_event_types=exclude_event_types,
+        purge_by_day=conf[CONF_PURGE_BY_DAY],
+        compress_shared_data=conf[CONF_COMPRESS_SHARED_DATA],
     )
+    await hass.async_add_executor_job(instance.spool.load)
     instance.async_initialize()
     instance.async_register()
     instance.start()
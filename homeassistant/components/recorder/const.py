@@ -22,6 +22,16 @@ MAX_QUEUE_BACKLOG_MIN_VALUE = 65000
 ESTIMATED_QUEUE_ITEM_SIZE = 10240
 QUEUE_PERCENTAGE_ALLOWED_AVAILABLE_MEMORY = 0.65
 
+# Events are serialized in a separate thread ahead of the
+# recorder thread once the queue backlog reaches this size
+SERIALIZER_QUEUE_BACKLOG = 10
+
+# Events are spooled to disk instead of being kept in
+# memory once the queue backlog reaches this size
+SPOOL_QUEUE_BACKLOG = 30000
+SPOOL_REPLAY_BATCH_SIZE = 1000
+SPOOL_DIR = ".recorder_spool"
+
 # The maximum number of rows (events) we purge in one delete statement
 
 # sqlite3 has a limit of 999 until version 3.32.0
@@ -31,6 +41,7 @@ QUEUE_PERCENTAGE_ALLOWED_AVAILABLE_MEMORY = 0.65
 SQLITE_MAX_BIND_VARS = 998
 
 DB_WORKER_PREFIX = "DbWorker"
+DB_READER_PREFIX = "DbReader"
 
 ALL_DOMAIN_EXCLUDE_ATTRS = {ATTR_ATTRIBUTION, ATTR_RESTORED, ATTR_SUPPORTED_FEATURES}
 
@@ -43,6 +43,7 @@ from homeassistant.util.enum import try_parse_enum
 from . import migration, statistics
 from .const import (
     CONTEXT_ID_AS_BINARY_SCHEMA_VERSION,
+    DB_READER_PREFIX,
     DB_WORKER_PREFIX,
     DOMAIN,
     ESTIMATED_QUEUE_ITEM_SIZE,
@@ -55,6 +56,10 @@ from .const import (
     MYSQLDB_PYMYSQL_URL_PREFIX,
     MYSQLDB_URL_PREFIX,
     QUEUE_PERCENTAGE_ALLOWED_AVAILABLE_MEMORY,
+    SERIALIZER_QUEUE_BACKLOG,
+    SPOOL_DIR,
+    SPOOL_QUEUE_BACKLOG,
+    SPOOL_REPLAY_BATCH_SIZE,
     SQLITE_URL_PREFIX,
     STATES_META_SCHEMA_VERSION,
     STATISTICS_ROWS_SCHEMA_VERSION,
@@ -72,18 +77,27 @@ from .db_schema import (
     StateAttributes,
     States,
     StatesMeta,
+    StatesRow,
     Statistics,
     StatisticsShortTerm,
 )
 from .executor import DBInterruptibleThreadPoolExecutor
-from .models import DatabaseEngine, StatisticData, StatisticMetaData, UnsupportedDialect
-from .pool import POOL_SIZE, MutexPool, RecorderPool
+from .models import (
+    DatabaseEngine,
+    ReadQueryStats,
+    StatisticData,
+    StatisticMetaData,
+    UnsupportedDialect,
+)
+from .pool import POOL_SIZE, READ_POOL_SIZE, MutexPool, RecorderPool
 from .queries import (
     has_entity_ids_to_migrate,
     has_event_type_to_migrate,
     has_events_context_ids_to_migrate,
     has_states_context_ids_to_migrate,
 )
+from .serializer import EventSerializer, PreparedEvent
+from .spool import EventSpool
 from .table_managers.event_data import EventDataManager
 from .table_managers.event_types import EventTypeManager
 from .table_managers.recorder_runs import RecorderRunsManager
@@ -110,6 +124,7 @@ from .tasks import (
     PerodicCleanupTask,
     PurgeTask,
     RecorderTask,
+    ReplaySpooledEventsTask,
     StatesContextIDMigrationTask,
     StatisticsTask,
     StopTask,
@@ -128,6 +143,8 @@ from .util import (
     move_away_broken_database,
     session_scope,
     setup_connection_for_dialect,
+    setup_read_only_connection_for_dialect,
+    supports_bulk_state_writes,
     validate_or_move_away_sqlite_database,
     write_lock_db_sqlite,
 )
@@ -158,6 +175,7 @@ CONNECTIVITY_ERR = "Error in database connectivity during commit"
 
 # Pool size must accommodate Recorder thread + All db executors
 MAX_DB_EXECUTOR_WORKERS = POOL_SIZE - 1
+MAX_DB_READ_EXECUTOR_WORKERS = READ_POOL_SIZE
 
 
 class Recorder(threading.Thread):
@@ -177,6 +195,8 @@ class Recorder(threading.Thread):
         db_retry_wait: int,
         entity_filter: Callable[[str], bool],
         exclude_event_types: set[str],
+        purge_by_day: bool = False,
+        compress_shared_data: bool = False,
     ) -> None:
         """Initialize the recorder."""
         threading.Thread.__init__(self, name="Recorder")
@@ -186,9 +206,14 @@ class Recorder(threading.Thread):
         self.auto_purge = auto_purge
         self.auto_repack = auto_repack
         self.keep_days = keep_days
+        self.purge_by_day = purge_by_day
+        self.compress_shared_data = compress_shared_data
         self._hass_started: asyncio.Future[object] = hass.loop.create_future()
         self.commit_interval = commit_interval
         self._queue: queue.SimpleQueue[RecorderTask] = queue.SimpleQueue()
+        self.spool = EventSpool(hass.config.path(SPOOL_DIR))
+        self._spooling = False
+        self._serializer: EventSerializer | None = None
         self.db_url = uri
         self.db_max_retries = db_max_retries
         self.db_retry_wait = db_retry_wait
@@ -202,6 +227,8 @@ class Recorder(threading.Thread):
         self.async_recorder_ready = asyncio.Event()
         self._queue_watch = threading.Event()
         self.engine: Engine | None = None
+        # Separate engine for reads if the database is not SQLite
+        self._read_engine: Engine | None = None
         self.max_backlog: int = MAX_QUEUE_BACKLOG_MIN_VALUE
         self._psutil: ha_psutil.PsutilWrapper | None = None
 
@@ -214,6 +241,8 @@ class Recorder(threading.Thread):
         self.schema_version = 0
         self._commits_without_expire = 0
         self._event_session_has_pending_writes = False
+        # The objects added to the event session since the last commit
+        self._event_session_pending_objects: list[object] = []
 
         self.recorder_runs_manager = RecorderRunsManager()
         self.states_manager = StatesManager()
@@ -225,6 +254,7 @@ class Recorder(threading.Thread):
 
         self.event_session: Session | None = None
         self._get_session: Callable[[], Session] | None = None
+        self._get_read_session: Callable[[], Session] | None = None
         self._completed_first_database_setup: bool | None = None
         self.async_migration_event = asyncio.Event()
         self.migration_in_progress = False
@@ -232,6 +262,9 @@ class Recorder(threading.Thread):
         self.use_legacy_events_index = False
         self._database_lock_task: DatabaseLockTask | None = None
         self._db_executor: DBInterruptibleThreadPoolExecutor | None = None
+        self._db_read_executor: DBInterruptibleThreadPoolExecutor | None = None
+        self._read_query_stats: dict[str, ReadQueryStats] = {}
+        self._read_query_stats_lock = threading.Lock()
 
         self._event_listener: CALLBACK_TYPE | None = None
         self._queue_watcher: CALLBACK_TYPE | None = None
@@ -240,6 +273,7 @@ class Recorder(threading.Thread):
         self._periodic_listener: CALLBACK_TYPE | None = None
         self._nightly_listener: CALLBACK_TYPE | None = None
         self._dialect_name: SupportedDialect | None = None
+        self._bulk_state_writes = False
         self.enabled = True
 
     @property
@@ -247,6 +281,11 @@ class Recorder(threading.Thread):
         """Return the number of items in the recorder backlog."""
         return self._queue.qsize()
 
+    @property
+    def spooled_backlog(self) -> int:
+        """Return the number of events in the backlog spooled to disk."""
+        return self.spool.backlog
+
     @property
     def dialect_name(self) -> SupportedDialect | None:
         """Return the dialect the recorder uses."""
@@ -265,9 +304,16 @@ class Recorder(threading.Thread):
         return self._event_listener is not None
 
     def get_session(self) -> Session:
-        """Get a new sqlalchemy session."""
+        """Get a new sqlalchemy session.
+
+        Jobs of the read executor get a session with a read only connection.
+        """
         if self._get_session is None:
             raise RuntimeError("The database connection has not been established")
+        if self._get_read_session and threading.current_thread().name.startswith(
+            DB_READER_PREFIX
+        ):
+            return self._get_read_session()
         return self._get_session()
 
     def queue_task(self, task: RecorderTask) -> None:
@@ -286,6 +332,11 @@ class Recorder(threading.Thread):
             max_workers=MAX_DB_EXECUTOR_WORKERS,
             shutdown_hook=self._shutdown_pool,
         )
+        self._db_read_executor = DBInterruptibleThreadPoolExecutor(
+            thread_name_prefix=DB_READER_PREFIX,
+            max_workers=MAX_DB_READ_EXECUTOR_WORKERS,
+            shutdown_hook=self._shutdown_pool,
+        )
 
     def _shutdown_pool(self) -> None:
         """Close the dbpool connections in the current thread."""
@@ -297,8 +348,28 @@ class Recorder(threading.Thread):
         """Initialize the recorder."""
         entity_filter = self.entity_filter
         exclude_event_types = self.exclude_event_types
-        queue_put = self._queue.put_nowait
+        queue_put_nowait = self._queue.put_nowait
+        queue_size = self._queue.qsize
         event_task = EventTask
+        spool_queue_backlog = SPOOL_QUEUE_BACKLOG
+        serializer_queue_backlog = SERIALIZER_QUEUE_BACKLOG
+
+        @callback
+        def queue_put(task: EventTask) -> None:
+            """Put an event task in the queue or spool it to disk."""
+            if self._spooling or (size := queue_size()) >= spool_queue_backlog:
+                self._async_spool_event(task.event)
+                return
+            queue_put_nowait(task)
+            # Once the recorder thread falls behind, serialize
+            # the event before the recorder thread reaches it
+            if size >= serializer_queue_backlog and (serializer := self._serializer):
+                serializer.queue_task(task)
+
+        if self.spool.backlog and not self._spooling:
+            # Replay the events spooled before the last
+            # shutdown before the events of this run
+            self._async_start_spooling()
 
         @callback
         def _event_listener(event: Event) -> None:
@@ -337,6 +408,38 @@ class Recorder(threading.Thread):
             name="Recorder queue watcher",
         )
 
+    @callback
+    def _async_spool_event(self, event: Event) -> None:
+        """Spool an event to disk while the backlog is too large."""
+        if not self._spooling:
+            if self.spool.failed:
+                self._queue.put_nowait(EventTask(event))
+                return
+            _LOGGER.warning(
+                "The recorder backlog queue reached %s events; new events will "
+                "be spooled to disk until the database catches up",
+                self.backlog,
+            )
+            self._async_start_spooling()
+        if not self.spool.put(event):
+            self._queue.put_nowait(EventTask(event))
+
+    @callback
+    def _async_start_spooling(self) -> None:
+        """Start spooling events and queue replaying them."""
+        self._spooling = True
+        self._queue.put_nowait(ReplaySpooledEventsTask())
+
+    @callback
+    def _async_stop_spooling(self) -> None:
+        """Stop spooling events once the spooled events have been replayed.
+
+        The events which are spooled until now are replayed before
+        the events which are put in the queue from now on.
+        """
+        self._spooling = False
+        self._queue.put_nowait(ReplaySpooledEventsTask(self.spool.put_count))
+
     @callback
     def _async_keep_alive(self, now: datetime) -> None:
         """Queue a keep alive."""
@@ -360,8 +463,44 @@ class Recorder(threading.Thread):
         """Add an executor job from within the event loop."""
         return self.hass.loop.run_in_executor(self._db_executor, target, *args)
 
+    @callback
+    def async_add_read_executor_job(
+        self, target: Callable[..., T], *args: Any
+    ) -> asyncio.Future[T]:
+        """Add a job which only reads from the database from within the event loop.
+
+        Read jobs have their own executor and connections so they do not
+        wait for other database jobs or block the writes of the recorder.
+        """
+        return self.hass.loop.run_in_executor(
+            self._db_read_executor, self._run_read_job, target, args
+        )
+
+    def _run_read_job(self, target: Callable[..., T], args: tuple[Any, ...]) -> T:
+        """Run a read job and record how long it took."""
+        start = time.monotonic()
+        try:
+            return target(*args)
+        finally:
+            seconds = time.monotonic() - start
+            name = getattr(getattr(target, "func", target), "__qualname__", "unknown")
+            with self._read_query_stats_lock:
+                if (stats := self._read_query_stats.get(name)) is None:
+                    stats = self._read_query_stats[name] = ReadQueryStats()
+                stats.add(seconds)
+
+    def get_read_query_stats(self) -> dict[str, dict[str, float]]:
+        """Return the timing of the read jobs by function."""
+        with self._read_query_stats_lock:
+            return {
+                name: stats.as_dict() for name, stats in self._read_query_stats.items()
+            }
+
     def _stop_executor(self) -> None:
         """Stop the executor."""
+        if self._db_read_executor is not None:
+            self._db_read_executor.shutdown()
+            self._db_read_executor = None
         if self._db_executor is None:
             return
         self._db_executor.shutdown()
@@ -373,8 +512,11 @@ class Recorder(threading.Thread):
 
         The queue grows during migration or if something really goes wrong.
         """
-        size = self.backlog
-        _LOGGER.debug("Recorder queue size is: %s", size)
+        _LOGGER.debug(
+            "Recorder queue size is: %s (%s spooled to disk)",
+            self.backlog,
+            self.spooled_backlog,
+        )
         if not self._reached_max_backlog_percentage(100):
             return
         _LOGGER.error(
@@ -701,6 +843,7 @@ class Recorder(threading.Thread):
     def _add_to_session(self, session: Session, obj: object) -> None:
         """Add an object to the session."""
         self._event_session_has_pending_writes = True
+        self._event_session_pending_objects.append(obj)
         session.add(obj)
 
     def _run(self) -> None:
@@ -768,6 +911,8 @@ class Recorder(threading.Thread):
         _LOGGER.debug("Recorder processing the queue")
         self._adjust_lru_size()
         self.hass.add_job(self._async_set_recorder_ready_migration_done)
+        self._serializer = EventSerializer(self._prepare_event)
+        self._serializer.start()
         self._run_event_loop()
 
     def _activate_and_set_db_ready(self) -> None:
@@ -864,6 +1009,31 @@ class Recorder(threading.Thread):
         while not self.stop_requested:
             self._guarded_process_one_task_or_recover(queue_.get())
 
+    def _replay_spooled_events(self, task: ReplaySpooledEventsTask) -> None:
+        """Replay a batch of the events which have been spooled to disk."""
+        spool = self.spool
+        try:
+            events = spool.read(SPOOL_REPLAY_BATCH_SIZE, task.until)
+        except Exception:  # pylint: disable=broad-except
+            _LOGGER.exception(
+                "Error replaying the events spooled to disk; %s spooled events "
+                "were not recorded and new events will be kept in memory",
+                spool.abandon(),
+            )
+            if task.until is None:
+                self.hass.add_job(self._async_stop_spooling)
+            return
+        for event in events:
+            self._guarded_process_one_task_or_recover(EventTask(event))
+        if not spool.caught_up(task.until):
+            # Requeue the task so other tasks are not
+            # blocked until all events are replayed
+            self.queue_task(task)
+        elif task.until is None:
+            self.hass.add_job(self._async_stop_spooling)
+        elif not spool.failed:
+            _LOGGER.info("All events spooled to disk have been recorded")
+
     def _pre_process_startup_tasks(self, startup_tasks: list[RecorderTask]) -> None:
         """Pre process startup tasks."""
         # Prime all the state_attributes and event_data caches
@@ -1005,22 +1175,61 @@ class Recorder(threading.Thread):
             self.backlog,
         )
 
-    def _process_one_event(self, event: Event) -> None:
+    def _prepare_event(self, event: Event) -> PreparedEvent:
+        """Create the database row of an event and serialize its data.
+
+        This is called from the serializer thread or from the
+        recorder thread if it reaches the event first.
+        """
+        if event.event_type == EVENT_STATE_CHANGED:
+            dbstate = (
+                StatesRow(event)
+                if self._bulk_state_writes
+                else States.from_event(event)
+            )
+            if not (
+                shared_attrs_bytes := self.state_attributes_manager.serialize_from_event(
+                    event
+                )
+            ):
+                return PreparedEvent(dbstate)
+            return PreparedEvent(
+                dbstate,
+                shared_attrs_bytes,
+                StateAttributes.hash_shared_attrs_bytes(shared_attrs_bytes),
+            )
+        dbevent = Events.from_event(event)
+        if not event.data or not (
+            shared_data_bytes := self.event_data_manager.serialize_from_event(event)
+        ):
+            return PreparedEvent(dbevent)
+        return PreparedEvent(
+            dbevent,
+            shared_data_bytes,
+            EventData.hash_shared_data_bytes(shared_data_bytes),
+        )
+
+    def _process_one_event(self, task: EventTask) -> None:
         if not self.enabled:
             return
-        if event.event_type == EVENT_STATE_CHANGED:
-            self._process_state_changed_event_into_session(event)
+        if (prepared := task.prepared) is None:
+            # Also tells the serializer to skip the task
+            prepared = task.prepared = self._prepare_event(task.event)
+        if task.event.event_type == EVENT_STATE_CHANGED:
+            self._process_state_changed_event_into_session(task.event, prepared)
         else:
-            self._process_non_state_changed_event_into_session(event)
+            self._process_non_state_changed_event_into_session(task.event, prepared)
         # Commit if the commit interval is zero
         if not self.commit_interval:
             self._commit_event_session_or_retry()
 
-    def _process_non_state_changed_event_into_session(self, event: Event) -> None:
+    def _process_non_state_changed_event_into_session(
+        self, event: Event, prepared: PreparedEvent
+    ) -> None:
         """Process any event into the session except state changed."""
         session = self.event_session
         assert session is not None
-        dbevent = Events.from_event(event)
+        dbevent = cast(Events, prepared.row)
 
         # Map the event_type to the EventTypes table
         event_type_manager = self.event_type_manager
@@ -1039,7 +1248,7 @@ class Recorder(threading.Thread):
             return
 
         event_data_manager = self.event_data_manager
-        if not (shared_data_bytes := event_data_manager.serialize_from_event(event)):
+        if not (shared_data_bytes := prepared.shared_bytes):
             return
 
         # Map the event data to the EventData table
@@ -1049,7 +1258,7 @@ class Recorder(threading.Thread):
             dbevent.event_data_rel = pending_event_data
         # Matching attributes id found in the cache
         elif (data_id := event_data_manager.get_from_cache(shared_data)) or (
-            (hash_ := EventData.hash_shared_data_bytes(shared_data_bytes))
+            (hash_ := cast(int, prepared.hash))
             and (data_id := event_data_manager.get(shared_data, hash_, session))
         ):
             dbevent.data_id = data_id
@@ -1062,18 +1271,19 @@ class Recorder(threading.Thread):
 
         self._add_to_session(session, dbevent)
 
-    def _process_state_changed_event_into_session(self, event: Event) -> None:
+    def _process_state_changed_event_into_session(
+        self, event: Event, prepared: PreparedEvent
+    ) -> None:
         """Process a state_changed event into the session."""
         state_attributes_manager = self.state_attributes_manager
         states_meta_manager = self.states_meta_manager
         entity_removed = not event.data.get("new_state")
         entity_id = event.data["entity_id"]
-
-        dbstate = States.from_event(event)
+        dbstate = cast(States | StatesRow, prepared.row)
 
         states_manager = self.states_manager
         if old_state := states_manager.pop_pending(entity_id):
-            dbstate.old_state = old_state
+            dbstate.old_state = old_state  # type: ignore[assignment]
         elif old_state_id := states_manager.pop_committed(entity_id):
             dbstate.old_state_id = old_state_id
         if entity_removed:
@@ -1084,9 +1294,7 @@ class Recorder(threading.Thread):
         if states_meta_manager.active:
             dbstate.entity_id = None
 
-        if entity_id is None or not (
-            shared_attrs_bytes := state_attributes_manager.serialize_from_event(event)
-        ):
+        if entity_id is None or not (shared_attrs_bytes := prepared.shared_bytes):
             return
 
         assert self.event_session is not None
@@ -1118,7 +1326,7 @@ class Recorder(threading.Thread):
         elif (
             attributes_id := state_attributes_manager.get_from_cache(shared_attrs)
         ) or (
-            (hash_ := StateAttributes.hash_shared_attrs_bytes(shared_attrs_bytes))
+            (hash_ := cast(int, prepared.hash))
             and (
                 attributes_id := state_attributes_manager.get(
                     shared_attrs, hash_, session
@@ -1133,7 +1341,11 @@ class Recorder(threading.Thread):
             self._add_to_session(session, dbstate_attributes)
             dbstate.state_attributes = dbstate_attributes
 
-        self._add_to_session(session, dbstate)
+        if isinstance(dbstate, StatesRow):
+            self._event_session_has_pending_writes = True
+            states_manager.add_pending_row(dbstate)
+        else:
+            self._add_to_session(session, dbstate)
 
     def _handle_database_error(self, err: Exception) -> bool:
         """Handle a database error that may result in moving away the corrupt db."""
@@ -1164,16 +1376,33 @@ class Recorder(threading.Thread):
                 if tries == self.db_max_retries:
                     raise
 
+                self._rollback_event_session_for_retry()
                 tries += 1
                 time.sleep(self.db_retry_wait)
 
+    def _rollback_event_session_for_retry(self) -> None:
+        """Rollback the event session and add the pending writes to it again.
+
+        The session cannot be committed again once a flush or a commit failed.
+        The rollback expunges the objects added since the last commit and
+        discards the states inserted in bulk, so they are written again by
+        the next commit.
+        """
+        assert self.event_session is not None
+        session = self.event_session
+        session.rollback()
+        session.add_all(self._event_session_pending_objects)
+        self.states_manager.rollback_pending_rows()
+
     def _commit_event_session(self) -> None:
         assert self.event_session is not None
         session = self.event_session
         self._commits_without_expire += 1
 
+        self.states_manager.insert_pending_rows(session)
         session.commit()
         self._event_session_has_pending_writes = False
+        self._event_session_pending_objects.clear()
         # We just committed the state attributes to the database
         # and we now know the attributes_ids.  We can save
         # many selects for matching attributes by loading them
@@ -1210,6 +1439,7 @@ class Recorder(threading.Thread):
         self.event_type_manager.reset()
         self.states_meta_manager.reset()
         self.statistics_meta_manager.reset()
+        self._event_session_pending_objects.clear()
 
         if not self.event_session:
             return
@@ -1352,6 +1582,21 @@ class Recorder(threading.Thread):
         ):
             self.database_engine = database_engine
         self._completed_first_database_setup = True
+        if self._using_file_sqlite and threading.current_thread().name.startswith(
+            DB_READER_PREFIX
+        ):
+            setup_read_only_connection_for_dialect(
+                self.engine.dialect.name, dbapi_connection
+            )
+
+    def _setup_read_connection(
+        self, dbapi_connection: DBAPIConnection, connection_record: Any
+    ) -> None:
+        """Dbapi specific connection settings for the read engine."""
+        assert self._read_engine is not None
+        dialect_name = self._read_engine.dialect.name
+        setup_connection_for_dialect(self, dialect_name, dbapi_connection, False)
+        setup_read_only_connection_for_dialect(dialect_name, dbapi_connection)
 
     def _setup_connection(self) -> None:
         """Ensure database is ready to fly."""
@@ -1395,15 +1640,44 @@ class Recorder(threading.Thread):
         sqlalchemy_event.listen(self.engine, "connect", self._setup_recorder_connection)
 
         Base.metadata.create_all(self.engine)
+        # The dialect only knows which features the server supports once the
+        # first connection initialized it
+        self._bulk_state_writes = supports_bulk_state_writes(self.engine)
         self._get_session = scoped_session(sessionmaker(bind=self.engine, future=True))
+
+        if not self.db_url.startswith(SQLITE_URL_PREFIX):
+            # Reads use their own pool so they never wait for
+            # a connection which is used by the writer
+            self._read_engine = create_engine(
+                self.db_url,
+                **kwargs,
+                pool_size=MAX_DB_READ_EXECUTOR_WORKERS,
+                future=True,
+            )
+            sqlalchemy_event.listen(
+                self._read_engine, "connect", self._setup_read_connection
+            )
+            self._get_read_session = scoped_session(
+                sessionmaker(bind=self._read_engine, future=True)
+            )
+        elif self._using_file_sqlite:
+            # Each thread of the read executor has its own connection
+            # to the WAL database so reads do not block the writer
+            self._get_read_session = scoped_session(
+                sessionmaker(bind=self.engine, future=True)
+            )
         _LOGGER.debug("Connected to recorder database")
 
     def _close_connection(self) -> None:
         """Close the connection."""
+        if self._read_engine:
+            self._read_engine.dispose()
+            self._read_engine = None
         if self.engine:
             self.engine.dispose()
             self.engine = None
         self._get_session = None
+        self._get_read_session = None
 
     def _setup_run(self) -> None:
         """Log the start of the current run and schedule any needed jobs."""
@@ -1452,3 +1726,7 @@ class Recorder(threading.Thread):
         finally:
             self._stop_executor()
             self._close_connection()
+            self.spool.close()
+            if self._serializer:
+                self._serializer.stop()
+                self._serializer = None
@@ -57,6 +57,7 @@ from .models import (
     bytes_to_ulid_or_none,
     bytes_to_uuid_hex_or_none,
     datetime_to_timestamp_or_none,
+    decompress_shared_json,
     process_timestamp,
     ulid_to_bytes_or_none,
     uuid_hex_to_bytes_or_none,
@@ -374,8 +375,8 @@ class EventData(Base):
         if shared_data is None:
             return {}
         try:
-            return cast(dict[str, Any], json_loads(shared_data))
-        except JSON_DECODE_EXCEPTIONS:
+            return cast(dict[str, Any], json_loads(decompress_shared_json(shared_data)))
+        except ValueError:
             _LOGGER.exception("Error converting row to event data: %s", self)
             return {}
 
@@ -537,6 +538,92 @@ class States(Base):
         )
 
 
+class StatesRow:
+    """A row of the states table which is inserted in bulk instead of by the ORM.
+
+    The attributes mirror the ones of States, so the row can be linked to
+    its old state, its StatesMeta and its StateAttributes the same way.
+    """
+
+    __slots__ = (
+        "entity_id",
+        "state",
+        "attributes",
+        "last_updated_ts",
+        "last_changed_ts",
+        "old_state",
+        "old_state_id",
+        "attributes_id",
+        "state_attributes",
+        "metadata_id",
+        "states_meta_rel",
+        "origin_idx",
+        "context_id_bin",
+        "context_user_id_bin",
+        "context_parent_id_bin",
+        "state_id",
+    )
+
+    def __init__(self, event: Event) -> None:
+        """Create the row from a state_changed event."""
+        self.entity_id: str | None = event.data["entity_id"]
+        self.attributes: str | None = None
+        self.old_state: StatesRow | None = None
+        self.old_state_id: int | None = None
+        self.attributes_id: int | None = None
+        self.state_attributes: StateAttributes | None = None
+        self.metadata_id: int | None = None
+        self.states_meta_rel: StatesMeta | None = None
+        self.origin_idx = EVENT_ORIGIN_TO_IDX.get(event.origin)
+        self.context_id_bin = ulid_to_bytes_or_none(event.context.id)
+        self.context_user_id_bin = uuid_hex_to_bytes_or_none(event.context.user_id)
+        self.context_parent_id_bin = ulid_to_bytes_or_none(event.context.parent_id)
+        self.state_id: int | None = None
+        state: State | None = event.data.get("new_state")
+        # None state means the state was removed from the state machine
+        if state is None:
+            self.state: str | None = ""
+            self.last_updated_ts = dt_util.utc_to_timestamp(event.time_fired)
+            self.last_changed_ts: float | None = None
+            return
+
+        self.state = state.state
+        self.last_updated_ts = dt_util.utc_to_timestamp(state.last_updated)
+        if state.last_updated == state.last_changed:
+            self.last_changed_ts = None
+        else:
+            self.last_changed_ts = dt_util.utc_to_timestamp(state.last_changed)
+
+    def as_params(self) -> dict[str, Any]:
+        """Return the column values to insert.
+
+        The StatesMeta and StateAttributes the row is linked to must have
+        been flushed so their ids are known.
+        """
+        return {
+            "entity_id": self.entity_id,
+            "state": self.state,
+            "attributes": self.attributes,
+            "last_updated_ts": self.last_updated_ts,
+            "last_changed_ts": self.last_changed_ts,
+            "old_state_id": self.old_state_id,
+            "attributes_id": (
+                self.state_attributes.attributes_id
+                if self.state_attributes is not None
+                else self.attributes_id
+            ),
+            "metadata_id": (
+                self.states_meta_rel.metadata_id
+                if self.states_meta_rel is not None
+                else self.metadata_id
+            ),
+            "origin_idx": self.origin_idx,
+            "context_id_bin": self.context_id_bin,
+            "context_user_id_bin": self.context_user_id_bin,
+            "context_parent_id_bin": self.context_parent_id_bin,
+        }
+
+
 class StateAttributes(Base):
     """State attribute change history."""
 
@@ -596,8 +683,10 @@ class StateAttributes(Base):
         if shared_attrs is None:
             return {}
         try:
-            return cast(dict[str, Any], json_loads(shared_attrs))
-        except JSON_DECODE_EXCEPTIONS:
+            return cast(
+                dict[str, Any], json_loads(decompress_shared_json(shared_attrs))
+            )
+        except ValueError:
             # When json_loads fails
             _LOGGER.exception("Error converting row to state attributes: %s", self)
             return {}
@@ -1,7 +1,7 @@
 """Provide pre-made queries on top of the recorder component."""
 from __future__ import annotations
 
-from collections.abc import MutableMapping
+from collections.abc import Iterator, MutableMapping
 from datetime import datetime
 from typing import Any
 
@@ -15,6 +15,8 @@ from .const import NEED_ATTRIBUTE_DOMAINS, SIGNIFICANT_DOMAINS
 from .modern import (
     get_full_significant_states_with_session as _modern_get_full_significant_states_with_session,
     get_last_state_changes as _modern_get_last_state_changes,
+    get_significant_state_chunks_with_session as _modern_get_significant_state_chunks_with_session,
+    get_significant_state_columns_with_session as _modern_get_significant_state_columns_with_session,
     get_significant_states as _modern_get_significant_states,
     get_significant_states_with_session as _modern_get_significant_states_with_session,
     state_changes_during_period as _modern_state_changes_during_period,
@@ -26,6 +28,8 @@ __all__ = [
     "SIGNIFICANT_DOMAINS",
     "get_full_significant_states_with_session",
     "get_last_state_changes",
+    "get_significant_state_chunks_with_session",
+    "get_significant_state_columns_with_session",
     "get_significant_states",
     "get_significant_states_with_session",
     "state_changes_during_period",
@@ -80,6 +84,78 @@ def get_last_state_changes(
     return _target(hass, number_of_states, entity_id)
 
 
+def get_significant_state_chunks_with_session(
+    hass: HomeAssistant,
+    session: Session,
+    start_time: datetime,
+    end_time: datetime | None = None,
+    entity_ids: list[str] | None = None,
+    include_start_time_state: bool = True,
+    significant_changes_only: bool = True,
+    minimal_response: bool = False,
+    no_attributes: bool = False,
+    compressed_state_format: bool = False,
+    chunk_size: int | None = None,
+) -> Iterator[tuple[str, list[State | dict[str, Any]]]]:
+    """Yield significant states during a time period in chunks."""
+    if not recorder.get_instance(hass).states_meta_manager.active:
+        from .legacy import (  # pylint: disable=import-outside-toplevel
+            get_significant_states_with_session as _legacy_get_significant_states_with_session,
+        )
+
+        # The legacy queries can't be streamed, the whole
+        # result is fetched and yielded one entity at a time
+        yield from _legacy_get_significant_states_with_session(
+            hass,
+            session,
+            start_time,
+            end_time,
+            entity_ids,
+            None,
+            include_start_time_state,
+            significant_changes_only,
+            minimal_response,
+            no_attributes,
+            compressed_state_format,
+        ).items()
+        return
+    yield from _modern_get_significant_state_chunks_with_session(
+        hass,
+        session,
+        start_time,
+        end_time,
+        entity_ids,
+        include_start_time_state,
+        significant_changes_only,
+        minimal_response,
+        no_attributes,
+        compressed_state_format,
+        chunk_size,
+    )
+
+
+def get_significant_state_columns_with_session(
+    hass: HomeAssistant,
+    session: Session,
+    start_time: datetime,
+    end_time: datetime | None,
+    entity_ids: list[str],
+    significant_changes_only: bool = True,
+) -> (
+    dict[str, tuple[tuple[str, ...], tuple[float, ...], tuple[str | None, ...]]] | None
+):
+    """Return significant states during a time period as columns.
+
+    Only supported once the states_meta table is in use, returns None
+    before that.
+    """
+    if not recorder.get_instance(hass).states_meta_manager.active:
+        return None
+    return _modern_get_significant_state_columns_with_session(
+        hass, session, start_time, end_time, entity_ids, significant_changes_only
+    )
+
+
 def get_significant_states(
     hass: HomeAssistant,
     start_time: datetime,
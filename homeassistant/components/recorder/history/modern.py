@@ -3,7 +3,7 @@ from __future__ import annotations
 
 from collections.abc import Callable, Iterable, Iterator, MutableMapping
 from datetime import datetime
-from itertools import groupby
+from itertools import groupby, islice
 from operator import itemgetter
 from typing import Any, cast
 
@@ -211,6 +211,154 @@ def get_significant_states_with_session(
         raise NotImplementedError("Filters are no longer supported")
     if not entity_ids:
         raise ValueError("entity_ids must be provided")
+    if not (
+        significant_states := _get_significant_state_rows(
+            hass,
+            session,
+            start_time,
+            end_time,
+            entity_ids,
+            include_start_time_state,
+            significant_changes_only,
+            no_attributes,
+        )
+    ):
+        return {}
+    rows, start_time_ts, entity_id_to_metadata_id = significant_states
+    return _sorted_states_to_dict(
+        rows,
+        start_time_ts,
+        entity_ids,
+        entity_id_to_metadata_id,
+        minimal_response,
+        compressed_state_format,
+        no_attributes=no_attributes,
+    )
+
+
+def get_significant_state_chunks_with_session(
+    hass: HomeAssistant,
+    session: Session,
+    start_time: datetime,
+    end_time: datetime | None = None,
+    entity_ids: list[str] | None = None,
+    include_start_time_state: bool = True,
+    significant_changes_only: bool = True,
+    minimal_response: bool = False,
+    no_attributes: bool = False,
+    compressed_state_format: bool = False,
+    chunk_size: int | None = None,
+) -> Iterator[tuple[str, list[State | dict[str, Any]]]]:
+    """Yield states changes during UTC period start_time - end_time in chunks.
+
+    This is the streaming variant of get_significant_states_with_session, the
+    (entity_id, list of states) chunks are generated while the rows are read
+    from the database so the whole result never has to be kept in memory.
+    Each chunk holds at most chunk_size states.
+
+    The session must stay open until the iterator is exhausted.
+    """
+    if not entity_ids:
+        raise ValueError("entity_ids must be provided")
+    if not (
+        significant_states := _get_significant_state_rows(
+            hass,
+            session,
+            start_time,
+            end_time,
+            entity_ids,
+            include_start_time_state,
+            significant_changes_only,
+            no_attributes,
+            stream=True,
+        )
+    ):
+        return
+    rows, start_time_ts, entity_id_to_metadata_id = significant_states
+    yield from _sorted_states_to_chunks(
+        rows,
+        start_time_ts,
+        entity_ids,
+        entity_id_to_metadata_id,
+        minimal_response,
+        compressed_state_format,
+        no_attributes,
+        chunk_size,
+    )
+
+
+def get_significant_state_columns_with_session(
+    hass: HomeAssistant,
+    session: Session,
+    start_time: datetime,
+    end_time: datetime | None,
+    entity_ids: list[str],
+    significant_changes_only: bool = True,
+) -> dict[str, tuple[tuple[str, ...], tuple[float, ...], tuple[str | None, ...]]]:
+    """Return significant states during UTC period start_time - end_time as columns.
+
+    The result maps each entity_id to a (states, last_updated_ts, attributes)
+    tuple of columns sorted by last_updated_ts, the attributes are the raw
+    JSON strings from the database. The state at start_time is included
+    with its last_updated_ts set to start_time.
+
+    This avoids creating a State for every row, which is useful for callers
+    which only need to look at the state and the last_updated time of
+    a large number of rows.
+    """
+    if not entity_ids or not (
+        significant_states := _get_significant_state_rows(
+            hass,
+            session,
+            start_time,
+            end_time,
+            entity_ids,
+            True,
+            significant_changes_only,
+            False,
+        )
+    ):
+        return {}
+    rows, start_time_ts, entity_id_to_metadata_id = significant_states
+    metadata_id_to_entity_id = {
+        v: k for k, v in entity_id_to_metadata_id.items() if v is not None
+    }
+    result: dict[
+        str, tuple[tuple[str, ...], tuple[float, ...], tuple[str | None, ...]]
+    ] = {}
+    for metadata_id, group in groupby(rows, itemgetter(_FIELD_MAP["metadata_id"])):
+        # The last_changed_ts is selected too if all the changes are included
+        _, states, last_updated_ts, *_, attributes = zip(*group)
+        if start_time_ts is not None and not last_updated_ts[0]:
+            # The state at the start time is selected with a last_updated_ts of 0
+            last_updated_ts = (start_time_ts, *last_updated_ts[1:])
+        result[metadata_id_to_entity_id[metadata_id]] = (
+            states,
+            last_updated_ts,
+            attributes,
+        )
+    return result
+
+
+def _get_significant_state_rows(
+    hass: HomeAssistant,
+    session: Session,
+    start_time: datetime,
+    end_time: datetime | None,
+    entity_ids: list[str],
+    include_start_time_state: bool,
+    significant_changes_only: bool,
+    no_attributes: bool,
+    stream: bool = False,
+) -> tuple[Iterable[Row], float | None, dict[str, int | None]] | None:
+    """Return the rows sorted by metadata_id and last_updated_ts.
+
+    Also returns the start time timestamp if the states at the start time
+    are included and the map of entity_id to metadata_id.
+
+    If stream is set, the rows of long time ranges are fetched in batches
+    while they are consumed instead of all at once.
+    """
     entity_id_to_metadata_id: dict[str, int | None] | None = None
     metadata_ids_in_significant_domains: list[int] = []
     instance = recorder.get_instance(hass)
@@ -219,7 +367,7 @@ def get_significant_states_with_session(
             entity_ids, session, False
         )
     ) or not (possible_metadata_ids := extract_metadata_ids(entity_id_to_metadata_id)):
-        return {}
+        return None
     metadata_ids = possible_metadata_ids
     if significant_changes_only:
         metadata_ids_in_significant_domains = [
@@ -257,14 +405,12 @@ def get_significant_states_with_session(
             include_start_time_state,
         ],
     )
-    return _sorted_states_to_dict(
-        execute_stmt_lambda_element(session, stmt, None, end_time, orm_rows=False),
+    return (
+        execute_stmt_lambda_element(
+            session, stmt, start_time if stream else None, end_time, orm_rows=False
+        ),
         start_time_ts if include_start_time_state else None,
-        entity_ids,
         entity_id_to_metadata_id,
-        minimal_response,
-        compressed_state_format,
-        no_attributes=no_attributes,
     )
 
 
@@ -648,24 +794,48 @@ def _sorted_states_to_dict(
     each list of states, otherwise our graphs won't start on the Y
     axis correctly.
     """
-    field_map = _FIELD_MAP
-    state_class: Callable[
-        [Row, dict[str, dict[str, Any]], float | None, str, str, float | None, bool],
-        State | dict[str, Any],
-    ]
-    if compressed_state_format:
-        state_class = row_to_compressed_state
-        attr_time = COMPRESSED_STATE_LAST_UPDATED
-        attr_state = COMPRESSED_STATE_STATE
-    else:
-        state_class = LazyState
-        attr_time = LAST_CHANGED_KEY
-        attr_state = STATE_KEY
-
     # Set all entity IDs to empty lists in result set to maintain the order
     result: dict[str, list[State | dict[str, Any]]] = {
         entity_id: [] for entity_id in entity_ids
     }
+    for entity_id, ent_results in _sorted_states_to_chunks(
+        states,
+        start_time_ts,
+        entity_ids,
+        entity_id_to_metadata_id,
+        minimal_response,
+        compressed_state_format,
+        no_attributes,
+    ):
+        result[entity_id].extend(ent_results)
+
+    if descending:
+        for ent_results in result.values():
+            ent_results.reverse()
+
+    # Filter out the empty lists if some states had 0 results.
+    return {key: val for key, val in result.items() if val}
+
+
+def _sorted_states_to_chunks(
+    states: Iterable[Row],
+    start_time_ts: float | None,
+    entity_ids: list[str],
+    entity_id_to_metadata_id: dict[str, int | None],
+    minimal_response: bool,
+    compressed_state_format: bool,
+    no_attributes: bool,
+    chunk_size: int | None = None,
+) -> Iterator[tuple[str, list[State | dict[str, Any]]]]:
+    """Convert SQL results into chunks of JSON friendly states.
+
+    Yields (entity_id, list of states) tuples as the rows are consumed, a
+    chunk never holds more than chunk_size states. The chunks of an entity
+    are yielded in order and entities without any states are skipped.
+
+    States must be sorted by entity_id and last_updated
+    """
+    field_map = _FIELD_MAP
     metadata_id_to_entity_id: dict[int, str] = {}
     metadata_id_to_entity_id = {
         v: k for k, v in entity_id_to_metadata_id.items() if v is not None
@@ -681,86 +851,109 @@ def _sorted_states_to_dict(
         key_func = itemgetter(field_map["metadata_id"])
         states_iter = groupby(states, key_func)
 
-    state_idx = field_map["state"]
-    last_updated_ts_idx = field_map["last_updated_ts"]
-
     # Append all changes to it
     for metadata_id, group in states_iter:
         entity_id = metadata_id_to_entity_id[metadata_id]
-        attr_cache: dict[str, dict[str, Any]] = {}
-        ent_results = result[entity_id]
-        if (
-            not minimal_response
-            or split_entity_id(entity_id)[0] in NEED_ATTRIBUTE_DOMAINS
-        ):
-            ent_results.extend(
-                state_class(
-                    db_state,
-                    attr_cache,
-                    start_time_ts,
-                    entity_id,
-                    db_state[state_idx],
-                    db_state[last_updated_ts_idx],
-                    False,
-                )
-                for db_state in group
-            )
+        ent_states = _entity_rows_to_states(
+            group,
+            start_time_ts,
+            entity_id,
+            minimal_response,
+            compressed_state_format,
+            no_attributes,
+        )
+        if not chunk_size:
+            if ent_results := list(ent_states):
+                yield entity_id, ent_results
             continue
+        while ent_results := list(islice(ent_states, chunk_size)):
+            yield entity_id, ent_results
 
-        prev_state: str | None = None
-        # With minimal response we only provide a native
-        # State for the first and last response. All the states
-        # in-between only provide the "state" and the
-        # "last_changed".
-        if not ent_results:
-            if (first_state := next(group, None)) is None:
-                continue
-            prev_state = first_state[state_idx]
-            ent_results.append(
-                state_class(
-                    first_state,
-                    attr_cache,
-                    start_time_ts,
-                    entity_id,
-                    prev_state,  # type: ignore[arg-type]
-                    first_state[last_updated_ts_idx],
-                    no_attributes,
-                )
-            )
 
-        #
-        # minimal_response only makes sense with last_updated == last_updated
-        #
-        # We use last_updated for for last_changed since its the same
-        #
-        # With minimal response we do not care about attribute
-        # changes so we can filter out duplicate states
-        if compressed_state_format:
-            # Compressed state format uses the timestamp directly
-            ent_results.extend(
-                {
-                    attr_state: (prev_state := state),
-                    attr_time: row[last_updated_ts_idx],
-                }
-                for row in group
-                if (state := row[state_idx]) != prev_state
+def _entity_rows_to_states(
+    group: Iterator[Row],
+    start_time_ts: float | None,
+    entity_id: str,
+    minimal_response: bool,
+    compressed_state_format: bool,
+    no_attributes: bool,
+) -> Iterator[State | dict[str, Any]]:
+    """Convert the SQL results of a single entity into JSON friendly states."""
+    state_class: Callable[
+        [Row, dict[str, dict[str, Any]], float | None, str, str, float | None, bool],
+        State | dict[str, Any],
+    ]
+    if compressed_state_format:
+        state_class = row_to_compressed_state
+        attr_time = COMPRESSED_STATE_LAST_UPDATED
+        attr_state = COMPRESSED_STATE_STATE
+    else:
+        state_class = LazyState
+        attr_time = LAST_CHANGED_KEY
+        attr_state = STATE_KEY
+
+    state_idx = _FIELD_MAP["state"]
+    last_updated_ts_idx = _FIELD_MAP["last_updated_ts"]
+    attr_cache: dict[str, dict[str, Any]] = {}
+    if not minimal_response or split_entity_id(entity_id)[0] in NEED_ATTRIBUTE_DOMAINS:
+        yield from (
+            state_class(
+                db_state,
+                attr_cache,
+                start_time_ts,
+                entity_id,
+                db_state[state_idx],
+                db_state[last_updated_ts_idx],
+                False,
             )
-            continue
+            for db_state in group
+        )
+        return
+
+    prev_state: str | None = None
+    # With minimal response we only provide a native
+    # State for the first and last response. All the states
+    # in-between only provide the "state" and the
+    # "last_changed".
+    if (first_state := next(group, None)) is None:
+        return
+    prev_state = first_state[state_idx]
+    yield state_class(
+        first_state,
+        attr_cache,
+        start_time_ts,
+        entity_id,
+        prev_state,  # type: ignore[arg-type]
+        first_state[last_updated_ts_idx],
+        no_attributes,
+    )
 
-        # Non-compressed state format returns an ISO formatted string
-        _utc_from_timestamp = dt_util.utc_from_timestamp
-        ent_results.extend(
+    #
+    # minimal_response only makes sense with last_updated == last_updated
+    #
+    # We use last_updated for for last_changed since its the same
+    #
+    # With minimal response we do not care about attribute
+    # changes so we can filter out duplicate states
+    if compressed_state_format:
+        # Compressed state format uses the timestamp directly
+        yield from (
             {
-                attr_state: (prev_state := state),  # noqa: F841
-                attr_time: _utc_from_timestamp(row[last_updated_ts_idx]).isoformat(),
+                attr_state: (prev_state := state),
+                attr_time: row[last_updated_ts_idx],
             }
             for row in group
             if (state := row[state_idx]) != prev_state
         )
-
-    if descending:
-        for ent_results in result.values():
-            ent_results.reverse()
-
-    # Filter out the empty lists if some states had 0 results.
-    return {key: val for key, val in result.items() if val}
+        return
+
+    # Non-compressed state format returns an ISO formatted string
+    _utc_from_timestamp = dt_util.utc_from_timestamp
+    yield from (
+        {
+            attr_state: (prev_state := state),  # noqa: F841
+            attr_time: _utc_from_timestamp(row[last_updated_ts_idx]).isoformat(),
+        }
+        for row in group
+        if (state := row[state_idx]) != prev_state
+    )
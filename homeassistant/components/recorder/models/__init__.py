@@ -7,8 +7,19 @@ from .context import (
     ulid_to_bytes_or_none,
     uuid_hex_to_bytes_or_none,
 )
-from .database import DatabaseEngine, DatabaseOptimizer, UnsupportedDialect
+from .database import (
+    DatabaseEngine,
+    DatabaseOptimizer,
+    ReadQueryStats,
+    UnsupportedDialect,
+)
 from .event import extract_event_type_ids
+from .shared_json import (
+    EVENT_DATA_SQL_KEYS,
+    STATE_ATTRIBUTES_SQL_KEYS,
+    compress_shared_json,
+    decompress_shared_json,
+)
 from .state import LazyState, extract_metadata_ids, row_to_compressed_state
 from .statistics import (
     CalendarStatisticPeriod,
@@ -30,11 +41,14 @@ from .time import (
 
 __all__ = [
     "CalendarStatisticPeriod",
+    "EVENT_DATA_SQL_KEYS",
     "DatabaseEngine",
     "DatabaseOptimizer",
     "FixedStatisticPeriod",
     "LazyState",
+    "ReadQueryStats",
     "RollingWindowStatisticPeriod",
+    "STATE_ATTRIBUTES_SQL_KEYS",
     "StatisticData",
     "StatisticDataTimestamp",
     "StatisticMetaData",
@@ -43,7 +57,9 @@ __all__ = [
     "UnsupportedDialect",
     "bytes_to_ulid_or_none",
     "bytes_to_uuid_hex_or_none",
+    "compress_shared_json",
     "datetime_to_timestamp_or_none",
+    "decompress_shared_json",
     "extract_event_type_ids",
     "extract_metadata_ids",
     "process_datetime_to_timestamp",
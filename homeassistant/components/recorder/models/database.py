@@ -21,6 +21,29 @@ class DatabaseEngine:
     version: AwesomeVersion | None
 
 
+@dataclass(slots=True)
+class ReadQueryStats:
+    """Timing of the queries of a read job."""
+
+    count: int = 0
+    total_seconds: float = 0
+    max_seconds: float = 0
+
+    def add(self, seconds: float) -> None:
+        """Add the duration of a query."""
+        self.count += 1
+        self.total_seconds += seconds
+        self.max_seconds = max(self.max_seconds, seconds)
+
+    def as_dict(self) -> dict[str, float]:
+        """Return a dictionary version of the stats."""
+        return {
+            "count": self.count,
+            "total_seconds": self.total_seconds,
+            "max_seconds": self.max_seconds,
+        }
+
+
 @dataclass
 class DatabaseOptimizer:
     """Properties of the database optimizer for the configured database engine."""
@@ -0,0 +1,134 @@
+"""Compressed encoding of the shared attributes and event data."""
+from __future__ import annotations
+
+import binascii
+from collections.abc import Iterable
+from typing import overload
+import zlib
+
+from homeassistant.helpers.json import json_bytes
+from homeassistant.util.json import json_loads_object
+
+# The compressed payload is kept in a JSON object under a key which
+# never appears in attributes or event data, next to a plain copy of
+# the keys which are extracted from the JSON in SQL. This keeps the
+# column valid JSON for the databases and the JSON functions and LIKE
+# filters of the logbook working. The version in the key allows the
+# dictionary to change without breaking existing rows.
+COMPRESSED_JSON_KEY = "\x01zd1"
+COMPRESSED_JSON_PREFIX = '{"\\u0001zd1":"'
+
+# Keys extracted from the JSON in SQL by the logbook queries and filters
+STATE_ATTRIBUTES_SQL_KEYS = ("icon", "unit_of_measurement")
+EVENT_DATA_SQL_KEYS = ("entity_id", "device_id")
+
+# Only JSON which is at least this long is compressed as the
+# envelope and base64 encoding outweigh the savings of short JSON.
+MIN_COMPRESS_LENGTH = 128
+
+# The preset dictionary contains the fragments which are found in most
+# attributes and event data. The most common fragments are at the end
+# as they can be referenced with the shortest distance.
+_ZDICT = "".join(
+    (
+        '"media_content_type":"music","media_title":"',
+        '"source_list":["',
+        '"is_volume_muted":false,"volume_level":',
+        '"hvac_modes":["off","heat","cool","heat_cool","auto","dry","fan_only"],',
+        '"current_temperature":',
+        '"target_temp_step":',
+        '"preset_modes":["none","eco","away","boost","comfort","home","sleep"],',
+        '"fan_modes":["auto","low","medium","high"],',
+        '"latitude":',
+        '"longitude":',
+        '"gps_accuracy":',
+        '"source_type":"gps",',
+        '"editable":true,"id":"',
+        '"last_triggered":"',
+        '"mode":"single","current":0,',
+        '"effect_list":["',
+        '"min_color_temp_kelvin":2000,"max_color_temp_kelvin":6535,',
+        '"min_mireds":153,"max_mireds":500,',
+        '"supported_color_modes":["color_temp","hs","xy","brightness","onoff"],',
+        '"color_mode":"color_temp","brightness":',
+        '"hs_color":[',
+        '"rgb_color":[255,',
+        '"xy_color":[0.',
+        '"color_temp_kelvin":',
+        '"entity_picture":"/api/',
+        '"attribution":"',
+        '"restored":true,',
+        '"options":["',
+        '"service_data":{"entity_id":"',
+        '"domain":"',
+        '"service":"',
+        '"device_id":"',
+        '"entity_id":"sensor.',
+        '"entity_id":"binary_sensor.',
+        '"entity_id":"light.',
+        '"entity_id":"switch.',
+        '"entity_id":"',
+        '"supported_features":',
+        '"device_class":"battery","device_class":"energy","device_class":"power",',
+        '"device_class":"humidity","device_class":"temperature",',
+        '"device_class":"',
+        '"state_class":"total_increasing","state_class":"measurement",',
+        '"unit_of_measurement":"kWh","unit_of_measurement":"W",',
+        '"unit_of_measurement":"%","unit_of_measurement":"°C",',
+        '"unit_of_measurement":"',
+        '"icon":"mdi:',
+        '"friendly_name":"',
+    )
+).encode("utf-8")
+
+# Negative wbits writes a raw deflate stream without the header and checksum
+_WBITS = -zlib.MAX_WBITS
+
+
+def compress_shared_json(shared_json: str, sql_keys: Iterable[str]) -> str:
+    """Compress the shared attributes or event data JSON.
+
+    Returns the JSON as is when compressing does not make it shorter.
+    """
+    if len(shared_json) < MIN_COMPRESS_LENGTH:
+        return shared_json
+    compressor = zlib.compressobj(
+        zlib.Z_BEST_COMPRESSION, zlib.DEFLATED, _WBITS, zdict=_ZDICT
+    )
+    payload = compressor.compress(shared_json.encode("utf-8")) + compressor.flush()
+    data = json_loads_object(shared_json)
+    envelope: dict[str, object] = {
+        COMPRESSED_JSON_KEY: binascii.b2a_base64(payload, newline=False).decode("ascii")
+    }
+    for key in sql_keys:
+        if key in data:
+            envelope[key] = data[key]
+    compressed = json_bytes(envelope).decode("utf-8")
+    return compressed if len(compressed) < len(shared_json) else shared_json
+
+
+@overload
+def decompress_shared_json(source: str) -> str:
+    ...
+
+
+@overload
+def decompress_shared_json(source: bytes) -> bytes:
+    ...
+
+
+def decompress_shared_json(source: str | bytes) -> str | bytes:
+    """Return the shared attributes or event data JSON of a column value.
+
+    Values which are not compressed are returned as is. Raises
+    ValueError when a compressed value cannot be decompressed.
+    """
+    if not isinstance(source, str) or not source.startswith(COMPRESSED_JSON_PREFIX):
+        return source
+    start = len(COMPRESSED_JSON_PREFIX)
+    encoded = source[start : source.index('"', start)]
+    decompressor = zlib.decompressobj(_WBITS, zdict=_ZDICT)
+    try:
+        return decompressor.decompress(binascii.a2b_base64(encoded)).decode("utf-8")
+    except zlib.error as err:
+        raise ValueError(f"Invalid compressed JSON: {err}") from err
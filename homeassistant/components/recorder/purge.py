@@ -12,7 +12,7 @@ from sqlalchemy.orm.session import Session
 
 import homeassistant.util.dt as dt_util
 
-from .const import SQLITE_MAX_BIND_VARS
+from .const import SQLITE_MAX_BIND_VARS, SupportedDialect
 from .db_schema import Events, States, StatesMeta
 from .models import DatabaseEngine
 from .queries import (
@@ -22,22 +22,31 @@ from .queries import (
     data_ids_exist_in_events_with_fast_in_distinct,
     delete_event_data_rows,
     delete_event_rows,
+    delete_event_rows_before,
     delete_event_types_rows,
     delete_recorder_runs_rows,
     delete_states_attributes_rows,
     delete_states_meta_rows,
     delete_states_rows,
+    delete_states_rows_before,
     delete_statistics_runs_rows,
     delete_statistics_short_term_rows,
     disconnect_states_rows,
+    disconnect_states_rows_before,
     find_entity_ids_to_purge,
     find_event_types_to_purge,
+    find_events_data_ids_before,
     find_events_to_purge,
+    find_latest_state_ids_before,
     find_latest_statistics_runs_run_id,
     find_legacy_detached_states_and_attributes_to_purge,
     find_legacy_event_state_and_attributes_and_data_ids_to_purge,
     find_legacy_row,
+    find_old_state_ids_linked_after,
+    find_oldest_event_ts,
+    find_oldest_state_ts,
     find_short_term_statistics_to_purge,
+    find_states_attributes_ids_before,
     find_states_to_purge,
     find_statistics_runs_to_purge,
 )
@@ -53,6 +62,12 @@ _LOGGER = logging.getLogger(__name__)
 DEFAULT_STATES_BATCHES_PER_PURGE = 20  # We expect ~95% de-dupe rate
 DEFAULT_EVENTS_BATCHES_PER_PURGE = 15  # We expect ~92% de-dupe rate
 
+# Size of the time range purged at once when purging by day
+PURGE_DAY_SECONDS = 86400
+# Size of the slices of the day which are deleted and committed one at a time,
+# so a busy day does not make one huge statement and transaction
+PURGE_SLICE_SECONDS = 3600
+
 
 @retryable_database_job("purge")
 def purge_old_data(
@@ -86,12 +101,20 @@ def purge_old_data(
                 " remaining"
             )
             # Once we are done purging legacy rows, we use the new method
-            has_more_to_purge |= _purge_states_and_attributes_ids(
-                instance, session, states_batch_size, purge_before
-            )
-            has_more_to_purge |= _purge_events_and_data_ids(
-                instance, session, events_batch_size, purge_before
-            )
+            if instance.purge_by_day:
+                has_more_to_purge |= _purge_states_and_attributes_by_day(
+                    instance, session, purge_before
+                )
+                has_more_to_purge |= _purge_events_and_data_ids_by_day(
+                    instance, session, purge_before
+                )
+            else:
+                has_more_to_purge |= _purge_states_and_attributes_ids(
+                    instance, session, states_batch_size, purge_before
+                )
+                has_more_to_purge |= _purge_events_and_data_ids(
+                    instance, session, events_batch_size, purge_before
+                )
 
         statistics_runs = _select_statistics_runs_to_purge(session, purge_before)
         short_term_statistics = _select_short_term_statistics_to_purge(
@@ -239,6 +262,135 @@ def _purge_events_and_data_ids(
     return has_remaining_event_ids_to_purge
 
 
+def _purge_day_slice_ends(
+    oldest_ts: float | None, purge_before_ts: float
+) -> list[float]:
+    """Return the ends of the slices of the day of the oldest row.
+
+    The day is capped to purge_before_ts. No slices are returned if
+    nothing is purged.
+    """
+    if oldest_ts is None or oldest_ts >= purge_before_ts:
+        return []
+    day_end = min(
+        (oldest_ts // PURGE_DAY_SECONDS + 1) * PURGE_DAY_SECONDS, purge_before_ts
+    )
+    slice_ends: list[float] = []
+    slice_end = (oldest_ts // PURGE_SLICE_SECONDS + 1) * PURGE_SLICE_SECONDS
+    while slice_end < day_end:
+        slice_ends.append(slice_end)
+        slice_end += PURGE_SLICE_SECONDS
+    slice_ends.append(day_end)
+    return slice_ends
+
+
+def _purge_states_and_attributes_by_day(
+    instance: Recorder, session: Session, purge_before: datetime
+) -> bool:
+    """Purge the states of the oldest day with range deletes.
+
+    Instead of selecting the state_ids to purge and deleting them in
+    batches of SQLITE_MAX_BIND_VARS, the states of the oldest day are
+    deleted with one statement per slice of the day using the
+    last_updated_ts index. Each slice is committed before the next one.
+
+    Returns true if there are more states to purge.
+    """
+    purge_before_ts = dt_util.utc_to_timestamp(purge_before)
+    if not (
+        slice_ends := _purge_day_slice_ends(
+            session.execute(find_oldest_state_ts()).scalar(), purge_before_ts
+        )
+    ):
+        return False
+    for slice_end in slice_ends:
+        _purge_states_and_attributes_before(instance, session, slice_end)
+        session.commit()
+    return slice_ends[-1] < purge_before_ts
+
+
+def _purge_states_and_attributes_before(
+    instance: Recorder, session: Session, purge_before_ts: float
+) -> None:
+    """Purge the states before purge_before_ts with a range delete."""
+    attributes_ids = {
+        attributes_id
+        for (attributes_id,) in session.execute(
+            find_states_attributes_ids_before(purge_before_ts)
+        )
+        if attributes_id
+    }
+    # Only the latest state of an entity can be in the old states cache
+    latest_state_ids = {
+        state_id
+        for (state_id,) in session.execute(
+            find_latest_state_ids_before(purge_before_ts)
+        )
+    }
+    # Disconnect the states which are kept from the states which are purged
+    linked_state_ids = {
+        old_state_id
+        for (old_state_id,) in session.execute(
+            find_old_state_ids_linked_after(purge_before_ts)
+        )
+    }
+    for state_ids_chunk in chunked(linked_state_ids, SQLITE_MAX_BIND_VARS):
+        session.execute(disconnect_states_rows(state_ids_chunk))
+    if instance.dialect_name == SupportedDialect.MYSQL:
+        # InnoDB checks foreign keys row by row instead of at the end
+        # of the statement so the purged states are disconnected first
+        session.execute(disconnect_states_rows_before(purge_before_ts))
+
+    deleted_rows = session.execute(delete_states_rows_before(purge_before_ts))
+    _LOGGER.debug("Deleted %s states before %s", deleted_rows.rowcount, purge_before_ts)
+    instance.states_manager.evict_purged_state_ids(latest_state_ids)
+
+    for attributes_ids_chunk in chunked(
+        attributes_ids, SQLITE_MAX_BIND_VARS * DEFAULT_STATES_BATCHES_PER_PURGE
+    ):
+        _purge_unused_attributes_ids(instance, session, set(attributes_ids_chunk))
+
+
+def _purge_events_and_data_ids_by_day(
+    instance: Recorder, session: Session, purge_before: datetime
+) -> bool:
+    """Purge the events of the oldest day with range deletes.
+
+    Each slice of the day is deleted and committed before the next one.
+
+    Returns true if there are more events to purge.
+    """
+    purge_before_ts = dt_util.utc_to_timestamp(purge_before)
+    if not (
+        slice_ends := _purge_day_slice_ends(
+            session.execute(find_oldest_event_ts()).scalar(), purge_before_ts
+        )
+    ):
+        return False
+    for slice_end in slice_ends:
+        _purge_events_and_data_ids_before(instance, session, slice_end)
+        session.commit()
+    return slice_ends[-1] < purge_before_ts
+
+
+def _purge_events_and_data_ids_before(
+    instance: Recorder, session: Session, purge_before_ts: float
+) -> None:
+    """Purge the events before purge_before_ts with a range delete."""
+    data_ids = {
+        data_id
+        for (data_id,) in session.execute(find_events_data_ids_before(purge_before_ts))
+        if data_id
+    }
+    deleted_rows = session.execute(delete_event_rows_before(purge_before_ts))
+    _LOGGER.debug("Deleted %s events before %s", deleted_rows.rowcount, purge_before_ts)
+
+    for data_ids_chunk in chunked(
+        data_ids, SQLITE_MAX_BIND_VARS * DEFAULT_EVENTS_BATCHES_PER_PURGE
+    ):
+        _purge_unused_data_ids(instance, session, set(data_ids_chunk))
+
+
 def _select_state_attributes_ids_to_purge(
     session: Session, purge_before: datetime
 ) -> tuple[set[int], set[int]]:
@@ -10,6 +10,7 @@ from sqlalchemy.sql.selectable import Select
 
 from .const import SQLITE_MAX_BIND_VARS
 from .db_schema import (
+    OLD_STATE,
     EventData,
     Events,
     EventTypes,
@@ -630,6 +631,82 @@ def find_states_to_purge(purge_before: float) -> StatementLambdaElement:
     )
 
 
+def find_oldest_state_ts() -> StatementLambdaElement:
+    """Find the last_updated_ts of the oldest state."""
+    return lambda_stmt(lambda: select(func.min(States.last_updated_ts)))
+
+
+def find_states_attributes_ids_before(purge_before: float) -> StatementLambdaElement:
+    """Find the attributes_ids used by the states before purge_before."""
+    return lambda_stmt(
+        lambda: select(distinct(States.attributes_id)).filter(
+            States.last_updated_ts < purge_before
+        )
+    )
+
+
+def find_latest_state_ids_before(purge_before: float) -> StatementLambdaElement:
+    """Find the state_id of the latest state of each entity before purge_before."""
+    return lambda_stmt(
+        lambda: select(func.max(States.state_id))
+        .filter(States.last_updated_ts < purge_before)
+        .group_by(States.metadata_id)
+    )
+
+
+def find_old_state_ids_linked_after(purge_before: float) -> StatementLambdaElement:
+    """Find the states before purge_before linked by a state after it."""
+    return lambda_stmt(
+        lambda: select(States.old_state_id)
+        .join(OLD_STATE, States.old_state_id == OLD_STATE.state_id)
+        .filter(OLD_STATE.last_updated_ts < purge_before)
+        .filter(States.last_updated_ts >= purge_before)
+    )
+
+
+def disconnect_states_rows_before(purge_before: float) -> StatementLambdaElement:
+    """Disconnect the states before purge_before."""
+    return lambda_stmt(
+        lambda: update(States)
+        .where(States.last_updated_ts < purge_before)
+        .where(States.old_state_id.is_not(None))
+        .values(old_state_id=None)
+        .execution_options(synchronize_session=False)
+    )
+
+
+def delete_states_rows_before(purge_before: float) -> StatementLambdaElement:
+    """Delete the states before purge_before."""
+    return lambda_stmt(
+        lambda: delete(States)
+        .where(States.last_updated_ts < purge_before)
+        .execution_options(synchronize_session=False)
+    )
+
+
+def find_oldest_event_ts() -> StatementLambdaElement:
+    """Find the time_fired_ts of the oldest event."""
+    return lambda_stmt(lambda: select(func.min(Events.time_fired_ts)))
+
+
+def find_events_data_ids_before(purge_before: float) -> StatementLambdaElement:
+    """Find the data_ids used by the events before purge_before."""
+    return lambda_stmt(
+        lambda: select(distinct(Events.data_id)).filter(
+            Events.time_fired_ts < purge_before
+        )
+    )
+
+
+def delete_event_rows_before(purge_before: float) -> StatementLambdaElement:
+    """Delete the events before purge_before."""
+    return lambda_stmt(
+        lambda: delete(Events)
+        .where(Events.time_fired_ts < purge_before)
+        .execution_options(synchronize_session=False)
+    )
+
+
 def find_short_term_statistics_to_purge(
     purge_before: datetime,
 ) -> StatementLambdaElement:
@@ -0,0 +1,59 @@
+"""Serialize recorder events ahead of the recorder thread."""
+from __future__ import annotations
+
+from collections.abc import Callable
+from dataclasses import dataclass
+import logging
+import queue
+import threading
+
+from homeassistant.core import Event
+
+from .db_schema import Events, States, StatesRow
+from .tasks import EventTask
+
+_LOGGER = logging.getLogger(__name__)
+
+
+@dataclass(slots=True)
+class PreparedEvent:
+    """An event with its database row and serialized data or attributes."""
+
+    row: Events | States | StatesRow
+    shared_bytes: bytes | None = None
+    hash: int | None = None
+
+
+class EventSerializer(threading.Thread):
+    """Prepare the events in the recorder queue before the recorder thread.
+
+    The JSON encoding, hashing and creation of the database rows
+    run here while the recorder thread waits for the database so
+    the recorder thread only has to resolve ids and write the rows.
+    """
+
+    def __init__(self, prepare_event: Callable[[Event], PreparedEvent]) -> None:
+        """Initialize the serializer."""
+        threading.Thread.__init__(self, name="RecorderSerializer")
+        self._prepare_event = prepare_event
+        self._queue: queue.SimpleQueue[EventTask | None] = queue.SimpleQueue()
+        self.queue_task = self._queue.put_nowait
+
+    def run(self) -> None:
+        """Prepare the queued tasks until stopped."""
+        queue_get = self._queue.get
+        prepare_event = self._prepare_event
+        while (task := queue_get()) is not None:
+            # The recorder thread prepares the tasks it
+            # reaches first itself
+            if task.prepared is not None:
+                continue
+            try:
+                task.prepared = prepare_event(task.event)
+            except Exception:  # pylint: disable=broad-except
+                _LOGGER.exception("Error preparing event %s", task.event)
+
+    def stop(self) -> None:
+        """Stop the serializer."""
+        self._queue.put_nowait(None)
+        self.join()
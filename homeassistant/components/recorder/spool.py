@@ -0,0 +1,352 @@
+"""Spool recorder events to disk while the queue backlog is too large."""
+from __future__ import annotations
+
+from collections import deque
+import logging
+import os
+import queue
+import threading
+from typing import IO, Any, cast
+
+from homeassistant.const import EVENT_STATE_CHANGED
+from homeassistant.core import Context, Event, EventOrigin, State
+from homeassistant.helpers.json import json_bytes
+import homeassistant.util.dt as dt_util
+from homeassistant.util.json import json_loads
+
+_LOGGER = logging.getLogger(__name__)
+
+SEGMENT_MAX_EVENTS = 10000
+SEGMENT_SUFFIX = ".log"
+
+# Written for events which cannot be serialized to keep the
+# position of a line in the spool equal to the position of
+# the event in the order the events were put.
+SKIPPED_EVENT = b"null"
+
+
+class _Segment:
+    """A segment file of the spool."""
+
+    __slots__ = ("path", "events")
+
+    def __init__(self, path: str, events: int = 0) -> None:
+        """Initialize a segment."""
+        self.path = path
+        self.events = events
+
+
+class EventSpool:
+    """Append-only segment log of events waiting to be recorded.
+
+    Events are put from the event loop and are written to disk by a
+    writer thread so the event loop never waits for disk I/O. The
+    recorder thread reads them back in the order they were put and
+    removes each segment once it has been read.
+
+    Events which were not read back before the spool was closed are
+    picked up by load at the next start.
+    """
+
+    def __init__(self, path: str) -> None:
+        """Initialize the spool."""
+        self.path = path
+        self.failed = False
+        # Number of events put, written to disk and read back. Each
+        # counter is only increased by one thread: put_count by the
+        # event loop, written by the writer and read_count by the reader.
+        self.put_count = 0
+        self.written = 0
+        self.read_count = 0
+        self._queue: queue.SimpleQueue[Event | None] = queue.SimpleQueue()
+        self._lock = threading.Lock()
+        self._condition = threading.Condition()
+        self._segments: deque[_Segment] = deque()
+        self._next_segment = 0
+        self._write_file: IO[bytes] | None = None
+        self._read_file: IO[bytes] | None = None
+        self._read_segment_events = 0
+        self._writer: threading.Thread | None = None
+        self._closed = False
+
+    @property
+    def backlog(self) -> int:
+        """Return the number of spooled events which have not been read back."""
+        return self.put_count - self.read_count
+
+    def load(self) -> None:
+        """Load the segments left behind by a previous run.
+
+        Must not be called from the event loop.
+        """
+        if not os.path.isdir(self.path):
+            return
+        names = sorted(
+            name for name in os.listdir(self.path) if name.endswith(SEGMENT_SUFFIX)
+        )
+        for name in names:
+            path = os.path.join(self.path, name)
+            try:
+                with open(path, "rb") as segment_file:
+                    # A partially written line is never read
+                    events = segment_file.read().count(b"\n")
+                if not events:
+                    os.unlink(path)
+                    continue
+            except OSError as err:
+                _LOGGER.error("Error loading recorder spool %s: %s", path, err)
+                continue
+            self._segments.append(_Segment(path, events))
+            self.put_count += events
+        self.written = self.put_count
+        if names:
+            self._next_segment = int(names[-1].removesuffix(SEGMENT_SUFFIX)) + 1
+        if self.put_count:
+            _LOGGER.warning(
+                "Found %s events which were spooled to disk before the last shutdown",
+                self.put_count,
+            )
+
+    def put(self, event: Event) -> bool:
+        """Put an event in the spool and return if it was accepted.
+
+        Must be called from the event loop.
+        """
+        with self._lock:
+            if self._closed or self.failed:
+                return False
+            if self._writer is None:
+                self._writer = threading.Thread(
+                    target=self._write_events, name="RecorderSpool"
+                )
+                self._writer.start()
+            self.put_count += 1
+            self._queue.put_nowait(event)
+        return True
+
+    def caught_up(self, until: int | None = None) -> bool:
+        """Return if all events put before the until position have been read."""
+        target = self.put_count if until is None else until
+        if self.failed:
+            # Events which were put after the failure are lost
+            target = min(target, self.written)
+        return self.read_count >= target
+
+    def abandon(self) -> int:
+        """Stop spooling after the spool could not be read.
+
+        Returns the number of events which have not been read back. The
+        events which were written stay on disk and are picked up by load
+        at the next start.
+        """
+        with self._lock:
+            self.failed = True
+            unread = self.put_count - self.read_count
+            self.read_count = self.put_count
+        return unread
+
+    def close(self) -> None:
+        """Write all events which have been put and close the spool.
+
+        The events which have not been read back stay on disk.
+        """
+        with self._lock:
+            self._closed = True
+            writer = self._writer
+            if writer is not None:
+                self._queue.put_nowait(None)
+        if writer is not None:
+            writer.join()
+        if not self._read_file:
+            return
+        # Remove the events which have been read from the segment
+        # which is being read so they are not read again by load.
+        segment = self._segments[0]
+        try:
+            if unread := self._read_file.read():
+                with open(f"{segment.path}.tmp", "wb") as segment_file:
+                    segment_file.write(unread)
+                os.replace(f"{segment.path}.tmp", segment.path)
+            else:
+                os.unlink(segment.path)
+        except OSError as err:
+            _LOGGER.error("Error closing recorder spool %s: %s", segment.path, err)
+        self._read_file.close()
+        self._read_file = None
+
+    def read(self, max_events: int, until: int | None = None) -> list[Event]:
+        """Read the next events from the spool.
+
+        Only events put before the until position are read. Waits
+        shortly for the writer if none of the events can be read yet.
+        """
+        target = self.put_count if until is None else until
+        with self._condition:
+            if self.read_count >= self.written and self.read_count < target:
+                self._condition.wait(1)
+            available = min(self.written, target) - self.read_count
+
+        events: list[Event] = []
+        for _ in range(min(available, max_events)):
+            if (line := self._read_line()) == SKIPPED_EVENT:
+                continue
+            try:
+                events.append(_event_from_json(line))
+            except (ValueError, TypeError, KeyError) as err:
+                _LOGGER.error("Error reading spooled event %s: %s", line, err)
+        return events
+
+    def _read_line(self) -> bytes:
+        """Read the next line from the segments."""
+        with self._condition:
+            segment = self._segments[0]
+            if self._read_segment_events == segment.events and len(self._segments) > 1:
+                # The writer moved on to the next segment
+                self._segments.popleft()
+                if self._read_file:
+                    self._read_file.close()
+                    self._read_file = None
+                os.unlink(segment.path)
+                segment = self._segments[0]
+                self._read_segment_events = 0
+        if not self._read_file:
+            self._read_file = open(  # pylint: disable=consider-using-with
+                segment.path, "rb"
+            )
+        self._read_segment_events += 1
+        self.read_count += 1
+        return self._read_file.readline().rstrip(b"\n")
+
+    def _write_events(self) -> None:
+        """Write the events which have been put to the segments."""
+        spool_queue = self._queue
+        while True:
+            events = [spool_queue.get()]
+            while not spool_queue.empty():
+                events.append(spool_queue.get_nowait())
+            if not self.failed:
+                self._write_lines(
+                    [_event_to_json(event) for event in events if event is not None]
+                )
+            if None in events:
+                break
+        if self._write_file:
+            self._write_file.close()
+            self._write_file = None
+
+    def _write_lines(self, lines: list[bytes]) -> None:
+        """Write lines to the segments and make them available to read."""
+        written = 0
+        try:
+            for line in lines:
+                if not self._write_file or self._segments[-1].events >= (
+                    SEGMENT_MAX_EVENTS
+                ):
+                    self._open_segment()
+                assert self._write_file is not None
+                self._write_file.write(line + b"\n")
+                written += 1
+                if self._segments[-1].events + written >= SEGMENT_MAX_EVENTS:
+                    self._flush(written)
+                    written = 0
+            self._flush(written)
+        except OSError as err:
+            _LOGGER.error(
+                "Error writing to the recorder spool %s: %s; new events will be "
+                "kept in memory",
+                self.path,
+                err,
+            )
+            self.failed = True
+
+    def _open_segment(self) -> None:
+        """Close the current segment and open a new one."""
+        if self._write_file:
+            self._write_file.close()
+        os.makedirs(self.path, exist_ok=True)
+        path = os.path.join(self.path, f"{self._next_segment:010d}{SEGMENT_SUFFIX}")
+        self._next_segment += 1
+        self._write_file = open(path, "ab")  # pylint: disable=consider-using-with
+        with self._condition:
+            self._segments.append(_Segment(path))
+
+    def _flush(self, written: int) -> None:
+        """Flush the current segment and make the written lines available to read."""
+        if self._write_file is None:
+            return
+        self._write_file.flush()
+        with self._condition:
+            self._segments[-1].events += written
+            self.written += written
+            self._condition.notify_all()
+
+
+def _event_to_json(event: Event) -> bytes:
+    """Serialize an event to a line of the spool.
+
+    The unrecorded attributes of the new state are kept in the line since
+    the state info is not part of the dict of the state.
+    """
+    context = event.context
+    unrecorded_attributes: list[str] | None = None
+    if (
+        event.event_type == EVENT_STATE_CHANGED
+        and (new_state := event.data.get("new_state")) is not None
+        and (state_info := new_state.state_info)
+    ):
+        unrecorded_attributes = sorted(state_info["unrecorded_attributes"])
+    try:
+        return json_bytes(
+            [
+                event.event_type,
+                event.data,
+                event.origin.value,
+                event.time_fired.timestamp(),
+                context.id,
+                context.user_id,
+                context.parent_id,
+                unrecorded_attributes,
+            ]
+        )
+    except (TypeError, ValueError) as err:
+        _LOGGER.warning(
+            "Event %s is not JSON serializable and cannot be spooled: %s", event, err
+        )
+        return SKIPPED_EVENT
+
+
+def _event_from_json(line: bytes) -> Event:
+    """Create an event from a line of the spool."""
+    row = cast(list[Any], json_loads(line))
+    event_type, data, origin, time_fired_ts, context_id, user_id, parent_id = row[:7]
+    context = Context(user_id=user_id, parent_id=parent_id, id=context_id)
+    if event_type == EVENT_STATE_CHANGED:
+        data["old_state"] = _state_from_dict(data["old_state"], context)
+        data["new_state"] = new_state = _state_from_dict(data["new_state"], context)
+        # Lines spooled by older versions do not have the unrecorded attributes
+        if (
+            new_state is not None
+            and len(row) > 7
+            and (unrecorded_attributes := row[7]) is not None
+        ):
+            new_state.state_info = {
+                "unrecorded_attributes": frozenset(unrecorded_attributes)
+            }
+    return Event(
+        event_type,
+        data,
+        EventOrigin(origin),
+        dt_util.utc_from_timestamp(time_fired_ts),
+        context,
+    )
+
+
+def _state_from_dict(
+    state_dict: dict[str, Any] | None, context: Context
+) -> State | None:
+    """Create a state from its dict and share the context of the event."""
+    if not state_dict:
+        return None
+    if (state := State.from_dict(state_dict)) and state.context == context:
+        state.context = context
+    return state
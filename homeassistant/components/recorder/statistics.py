@@ -2,7 +2,7 @@
 from __future__ import annotations
 
 from collections import defaultdict
-from collections.abc import Callable, Iterable, Sequence
+from collections.abc import Callable, Iterable, MutableMapping, Sequence
 import contextlib
 import dataclasses
 from datetime import datetime, timedelta
@@ -12,12 +12,28 @@ import logging
 from operator import itemgetter
 import re
 from statistics import mean
+import threading
 from typing import TYPE_CHECKING, Any, Literal, TypedDict, cast
 
-from sqlalchemy import Select, and_, bindparam, func, lambda_stmt, select, text
+from lru import LRU  # pylint: disable=no-name-in-module
+from sqlalchemy import (
+    Float,
+    Integer,
+    Select,
+    and_,
+    bindparam,
+    case,
+    func,
+    lambda_stmt,
+    literal,
+    select,
+    text,
+)
 from sqlalchemy.engine.row import Row
 from sqlalchemy.exc import SQLAlchemyError, StatementError
+from sqlalchemy.orm.attributes import InstrumentedAttribute
 from sqlalchemy.orm.session import Session
+from sqlalchemy.sql.elements import ColumnElement
 from sqlalchemy.sql.lambdas import StatementLambdaElement
 import voluptuous as vol
 
@@ -143,6 +159,10 @@ STATISTIC_UNIT_TO_UNIT_CONVERTER: dict[str | None, type[BaseUnitConverter]] = {
 }
 
 DATA_SHORT_TERM_STATISTICS_RUN_CACHE = "recorder_short_term_statistics_run_cache"
+DATA_STATISTICS_DURING_PERIOD_CACHE = "recorder_statistics_during_period_cache"
+
+# The maximum number of periods of a statistic kept in the cache
+STATISTICS_DURING_PERIOD_CACHE_SIZE = 16384
 
 
 _LOGGER = logging.getLogger(__name__)
@@ -175,6 +195,68 @@ class ShortTermStatisticsRunCache:
         self._latest_id_by_metadata_id.update(metadata_id_to_id)
 
 
+@dataclasses.dataclass(slots=True)
+class StatisticsDuringPeriodCache:
+    """Cache for statistics of periods which can no longer change.
+
+    A period can no longer change once the hourly statistics have been
+    compiled until its end, unless the statistics are imported, adjusted,
+    converted or cleared, which invalidates them.
+    """
+
+    # The end of the newest compiled hourly statistics
+    compiled_until: float | None = None
+    # This is a mapping of (statistic_id, period, units, types, start) to
+    # the row of the period, or None if there are no statistics in it
+    _rows: MutableMapping[tuple, StatisticsRow | None] = dataclasses.field(
+        default_factory=lambda: LRU(STATISTICS_DURING_PERIOD_CACHE_SIZE)
+    )
+    # Increased on each invalidation to drop rows read before it
+    generation: int = 0
+    _lock: threading.Lock = dataclasses.field(default_factory=threading.Lock)
+
+    def get_rows(
+        self, key: tuple, period_starts: list[float]
+    ) -> list[StatisticsRow] | None:
+        """Return copies of the cached rows or None if a period is missing."""
+        rows: list[StatisticsRow] = []
+        with self._lock:
+            for start in period_starts:
+                if (row_key := (*key, start)) not in self._rows:
+                    return None
+                if (row := self._rows[row_key]) is not None:
+                    rows.append(cast(StatisticsRow, dict(row)))
+        return rows
+
+    def set_rows(
+        self,
+        generation: int,
+        key: tuple,
+        period_starts: list[float],
+        rows: list[StatisticsRow],
+    ) -> None:
+        """Cache the rows of the periods if nothing was invalidated since."""
+        rows_by_start = {row["start"]: row for row in rows}
+        with self._lock:
+            if generation != self.generation:
+                return
+            for start in period_starts:
+                row = rows_by_start.get(start)
+                self._rows[(*key, start)] = (
+                    None if row is None else cast(StatisticsRow, dict(row))
+                )
+
+    def invalidate(self, statistic_ids: Iterable[str]) -> None:
+        """Invalidate the cached rows of the statistic_ids."""
+        statistic_ids = set(statistic_ids)
+        with self._lock:
+            self.generation += 1
+            # LRU does not support iteration, only its keys can be iterated
+            keys = self._rows.keys()  # noqa: SIM118
+            for key in [key for key in keys if key[0] in statistic_ids]:
+                del self._rows[key]
+
+
 class BaseStatisticsRow(TypedDict, total=False):
     """A processed row of statistic data."""
 
@@ -460,6 +542,10 @@ def compile_missing_statistics(instance: Recorder) -> bool:
                 periods_without_commit = 0
             start = end
 
+    # The hourly statistics are committed until the hour of the last period
+    get_statistics_during_period_cache(
+        instance.hass
+    ).compiled_until = last_period.replace(minute=0).timestamp()
     return True
 
 
@@ -478,6 +564,12 @@ def compile_statistics(instance: Recorder, start: datetime, fire_events: bool) -
             instance, session, start, fire_events
         )
 
+    if start.minute == 55:
+        # The hourly statistics of the hour are committed
+        get_statistics_during_period_cache(instance.hass).compiled_until = (
+            start + timedelta(minutes=5)
+        ).timestamp()
+
     if modified_statistic_ids:
         # In the rare case that we have modified statistic_ids, we reload the modified
         # statistics meta data into the cache in a fresh session to ensure that the
@@ -705,6 +797,7 @@ def clear_statistics(instance: Recorder, statistic_ids: list[str]) -> None:
     """Clear statistics for a list of statistic_ids."""
     with session_scope(session=instance.get_session()) as session:
         instance.statistics_meta_manager.delete(session, statistic_ids)
+    get_statistics_during_period_cache(instance.hass).invalidate(statistic_ids)
 
 
 def update_statistics_metadata(
@@ -728,6 +821,11 @@ def update_statistics_metadata(
             statistics_meta_manager.update_statistic_id(
                 session, DOMAIN, statistic_id, new_statistic_id
             )
+    get_statistics_during_period_cache(instance.hass).invalidate(
+        (statistic_id, new_statistic_id)
+        if isinstance(new_statistic_id, str)
+        else (statistic_id,)
+    )
 
 
 async def async_list_statistic_ids(
@@ -752,7 +850,7 @@ async def async_list_statistic_ids(
             result = _statistic_by_id_from_metadata(hass, metadata)
             return _flatten_list_statistic_ids_metadata_result(result)
 
-    return await instance.async_add_executor_job(
+    return await instance.async_add_read_executor_job(
         list_statistic_ids,
         hass,
         statistic_ids,
@@ -1070,6 +1168,151 @@ def _reduce_statistics_per_month(
     )
 
 
+_REDUCE_TS_FACTORIES: dict[
+    str,
+    Callable[
+        [],
+        tuple[Callable[[float, float], bool], Callable[[float], tuple[float, float]]],
+    ],
+] = {
+    "day": reduce_day_ts_factory,
+    "week": reduce_week_ts_factory,
+    "month": reduce_month_ts_factory,
+}
+
+# Periods are reduced in Python if there are more of them
+MAX_PERIODS_REDUCED_IN_DATABASE = 1000
+
+
+def _periods_between(
+    session: Session,
+    start_time: datetime,
+    end_time: datetime | None,
+    period: Literal["day", "week", "month"],
+) -> list[tuple[float, float]] | None:
+    """Return the start and end of the periods between start_time and end_time.
+
+    If end_time is None, the periods end with the period of the newest
+    statistics. Returns None if there are too many periods to reduce
+    them in the database.
+    """
+    _, period_start_end = _REDUCE_TS_FACTORIES[period]()
+    periods: list[tuple[float, float]] = []
+    start_ts = start_time.timestamp()
+    if end_time is not None:
+        end_ts = end_time.timestamp()
+    elif (
+        newest_start_ts := session.execute(_get_newest_start_ts_stmt()).scalar()
+    ) is not None:
+        end_ts = newest_start_ts + 1
+    else:
+        return None
+    while start_ts < end_ts:
+        if len(periods) == MAX_PERIODS_REDUCED_IN_DATABASE:
+            return None
+        periods.append(period_start_end(start_ts))
+        start_ts = periods[-1][1]
+    return periods
+
+
+def _get_newest_start_ts_stmt() -> StatementLambdaElement:
+    """Generate a statement to find the start of the newest statistics."""
+    return lambda_stmt(lambda: select(func.max(Statistics.start_ts)))
+
+
+def _period_index_expression(
+    start_ts: InstrumentedAttribute[float | None],
+    periods: list[tuple[float, float]],
+    low: int,
+    high: int,
+) -> ColumnElement[int]:
+    """Return an expression of the index of the period start_ts is within.
+
+    The boundaries of the periods are calculated in the configured time
+    zone and searched with nested CASE expressions, so each row is only
+    compared to log2(len(periods)) boundaries on every database engine.
+    """
+    if high - low == 1:
+        return literal(low, Integer, literal_execute=True)
+    middle = (low + high) // 2
+    return case(
+        (
+            start_ts < literal(periods[middle][0], Float, literal_execute=True),
+            _period_index_expression(start_ts, periods, low, middle),
+        ),
+        else_=_period_index_expression(start_ts, periods, middle, high),
+    )
+
+
+def _generate_reduced_statistics_during_period_stmt(
+    periods: list[tuple[float, float]],
+    metadata_ids: list[int] | None,
+    types: set[Literal["last_reset", "max", "mean", "min", "state", "sum"]],
+) -> Select:
+    """Prepare a database query for hourly statistics reduced to periods.
+
+    The start_ts column of the result is the index of the period in periods.
+    The last_reset, state and sum are the ones of the last hour of the period.
+    """
+    table = Statistics
+    rows = select(
+        table.metadata_id,
+        _period_index_expression(table.start_ts, periods, 0, len(periods)).label(
+            "period"
+        ),
+        table.start_ts,
+        table.mean,
+        table.min,
+        table.max,
+    ).filter(table.start_ts >= periods[0][0], table.start_ts < periods[-1][1])
+    if metadata_ids:
+        rows = rows.filter(table.metadata_id.in_(metadata_ids))
+    rows_subquery = rows.subquery()
+
+    columns = [
+        rows_subquery.c.metadata_id,
+        rows_subquery.c.period.label("start_ts"),
+        func.max(rows_subquery.c.start_ts).label("last_start_ts"),
+    ]
+    if "mean" in types:
+        columns.append(func.avg(rows_subquery.c.mean).label("mean"))
+    if "min" in types:
+        columns.append(func.min(rows_subquery.c.min).label("min"))
+    if "max" in types:
+        columns.append(func.max(rows_subquery.c.max).label("max"))
+    periods_subquery = (
+        select(*columns)
+        .group_by(rows_subquery.c.metadata_id, rows_subquery.c.period)
+        .subquery()
+    )
+
+    stmt = select(
+        *(column for column in periods_subquery.c if column.name != "last_start_ts")
+    )
+    if last_columns := [
+        getattr(table, column)
+        for key, column in _type_column_mapping.items()
+        if key in ("last_reset", "state", "sum") and key in types
+    ]:
+        stmt = stmt.add_columns(*last_columns).join(
+            table,
+            and_(
+                table.metadata_id == periods_subquery.c.metadata_id,
+                table.start_ts == periods_subquery.c.last_start_ts,
+            ),
+        )
+    return stmt.order_by(periods_subquery.c.metadata_id, periods_subquery.c.start_ts)
+
+
+def _set_period_start_end(
+    result: dict[str, list[StatisticsRow]], periods: list[tuple[float, float]]
+) -> None:
+    """Replace the period index in the start of the rows with the period."""
+    for rows in result.values():
+        for row in rows:
+            row["start"], row["end"] = periods[int(row["start"])]
+
+
 def _generate_statistics_during_period_stmt(
     start_time: datetime,
     end_time: datetime | None,
@@ -1695,12 +1938,83 @@ def _statistics_during_period_with_session(
     table: type[Statistics | StatisticsShortTerm] = (
         Statistics if period != "5minute" else StatisticsShortTerm
     )
-    stmt = _generate_statistics_during_period_stmt(
-        start_time, end_time, metadata_ids, table, types
-    )
-    stats = cast(
-        Sequence[Row], execute_stmt_lambda_element(session, stmt, orm_rows=False)
-    )
+    cache = get_statistics_during_period_cache(hass)
+    if (
+        table is Statistics
+        and statistic_ids is not None
+        and cache.compiled_until is not None
+    ):
+        result = _cached_statistics_during_period(
+            hass,
+            session,
+            cache,
+            start_time,
+            end_time,
+            statistic_ids,
+            metadata,
+            period,
+            units,
+            types,
+        )
+    else:
+        result = _query_statistics_during_period(
+            hass,
+            session,
+            start_time,
+            end_time,
+            statistic_ids,
+            metadata,
+            metadata_ids,
+            table,
+            period,
+            units,
+            types,
+        )
+
+    if not result:
+        return {}
+
+    if "change" in _types:
+        _augment_result_with_change(
+            hass, session, start_time, units, _types, table, metadata, result
+        )
+
+    # Return statistics combined with metadata
+    return result
+
+
+def _query_statistics_during_period(
+    hass: HomeAssistant,
+    session: Session,
+    start_time: datetime,
+    end_time: datetime | None,
+    statistic_ids: set[str] | None,
+    metadata: dict[str, tuple[int, StatisticMetaData]],
+    metadata_ids: list[int] | None,
+    table: type[Statistics | StatisticsShortTerm],
+    period: Literal["5minute", "day", "hour", "week", "month"],
+    units: dict[str, str] | None,
+    types: set[Literal["last_reset", "max", "mean", "min", "state", "sum"]],
+) -> dict[str, list[StatisticsRow]]:
+    """Query the statistics during a period aligned with the period."""
+    # Reduce the hourly statistics to the periods in the database so only
+    # the reduced rows are fetched, unless there are too many periods
+    periods: list[tuple[float, float]] | None = None
+    if period in ("day", "week", "month"):
+        periods = _periods_between(session, start_time, end_time, period)
+    if periods:
+        stats = session.execute(
+            _generate_reduced_statistics_during_period_stmt(
+                periods, metadata_ids, types
+            )
+        ).all()
+    else:
+        stmt = _generate_statistics_during_period_stmt(
+            start_time, end_time, metadata_ids, table, types
+        )
+        stats = cast(
+            Sequence[Row], execute_stmt_lambda_element(session, stmt, orm_rows=False)
+        )
 
     if not stats:
         return {}
@@ -1718,22 +2032,145 @@ def _statistics_during_period_with_session(
         types,
     )
 
-    if period == "day":
+    if periods:
+        _set_period_start_end(result, periods)
+
+    elif period == "day":
         result = _reduce_statistics_per_day(result, types)
 
-    if period == "week":
+    elif period == "week":
         result = _reduce_statistics_per_week(result, types)
 
-    if period == "month":
+    elif period == "month":
         result = _reduce_statistics_per_month(result, types)
 
-    if "change" in _types:
-        _augment_result_with_change(
-            hass, session, start_time, units, _types, table, metadata, result
+    return result
+
+
+def _finalized_periods(
+    start_time: datetime,
+    end_time: datetime | None,
+    period: Literal["5minute", "day", "hour", "week", "month"],
+    compiled_until: float,
+    max_periods: int,
+) -> list[tuple[float, float]] | None:
+    """Return the start and end of the periods which can no longer change.
+
+    These are the periods from start_time which end before both end_time
+    and the end of the newest compiled hourly statistics. Returns None if
+    there are more than max_periods.
+    """
+    end_ts = compiled_until
+    if end_time is not None:
+        end_ts = min(end_ts, end_time.timestamp())
+    start_ts = start_time.timestamp()
+    if period == "hour":
+
+        def period_start_end(start: float) -> tuple[float, float]:
+            return start, start + 3600
+
+        # The first hour is the first one starting at or after start_time
+        start_ts = -(-start_ts // 3600) * 3600
+    else:
+        _, period_start_end = _REDUCE_TS_FACTORIES[period]()
+    periods: list[tuple[float, float]] = []
+    while (next_period := period_start_end(start_ts))[1] <= end_ts:
+        if len(periods) == max_periods:
+            return None
+        periods.append(next_period)
+        start_ts = next_period[1]
+    return periods
+
+
+def _cached_statistics_during_period(
+    hass: HomeAssistant,
+    session: Session,
+    cache: StatisticsDuringPeriodCache,
+    start_time: datetime,
+    end_time: datetime | None,
+    statistic_ids: set[str],
+    metadata: dict[str, tuple[int, StatisticMetaData]],
+    period: Literal["5minute", "day", "hour", "week", "month"],
+    units: dict[str, str] | None,
+    types: set[Literal["last_reset", "max", "mean", "min", "state", "sum"]],
+) -> dict[str, list[StatisticsRow]]:
+    """Return the statistics during a period using the cache.
+
+    The periods which can no longer change are taken from the cache, the
+    ones missing from it are queried and cached. Only the open periods at
+    the end are always queried.
+    """
+
+    def _query(
+        start_time: datetime, end_time: datetime | None, statistic_ids: set[str]
+    ) -> dict[str, list[StatisticsRow]]:
+        return _query_statistics_during_period(
+            hass,
+            session,
+            start_time,
+            end_time,
+            statistic_ids,
+            {statistic_id: metadata[statistic_id] for statistic_id in statistic_ids},
+            [metadata[statistic_id][0] for statistic_id in statistic_ids],
+            Statistics,
+            period,
+            units,
+            types,
         )
 
-    # Return statistics combined with metadata
-    return result
+    # Read before querying so rows invalidated meanwhile are not cached
+    generation = cache.generation
+    statistic_ids = statistic_ids.intersection(metadata)
+    if not statistic_ids:
+        return {}
+    if not (
+        periods := _finalized_periods(
+            start_time,
+            end_time,
+            period,
+            cast(float, cache.compiled_until),
+            STATISTICS_DURING_PERIOD_CACHE_SIZE // len(statistic_ids),
+        )
+    ):
+        return _query(start_time, end_time, statistic_ids)
+
+    period_starts = [period_start for period_start, _ in periods]
+    types_key = tuple(sorted(types))
+    units_key = tuple(sorted(units.items())) if units else None
+    result: dict[str, list[StatisticsRow]] = {}
+    missing: dict[str, tuple] = {}
+    for statistic_id in statistic_ids:
+        # The display unit depends on the unit of the state
+        state_unit = None
+        if state := hass.states.get(statistic_id):
+            state_unit = state.attributes.get(ATTR_UNIT_OF_MEASUREMENT)
+        key = (
+            statistic_id,
+            period,
+            metadata[statistic_id][1]["unit_of_measurement"],
+            state_unit,
+            units_key,
+            types_key,
+        )
+        if (rows := cache.get_rows(key, period_starts)) is None:
+            missing[statistic_id] = key
+        else:
+            result[statistic_id] = rows
+
+    finalized_end = dt_util.utc_from_timestamp(periods[-1][1])
+    if missing:
+        finalized = _query(start_time, finalized_end, set(missing))
+        for statistic_id, key in missing.items():
+            rows = result[statistic_id] = finalized.get(statistic_id, [])
+            cache.set_rows(generation, key, period_starts, rows)
+
+    if end_time is None or finalized_end < end_time:
+        for statistic_id, rows in _query(
+            finalized_end, end_time, statistic_ids
+        ).items():
+            result.setdefault(statistic_id, []).extend(rows)
+
+    return {statistic_id: rows for statistic_id, rows in result.items() if rows}
 
 
 def statistics_during_period(
@@ -2325,6 +2762,14 @@ def get_short_term_statistics_run_cache(
     return ShortTermStatisticsRunCache()
 
 
+@singleton(DATA_STATISTICS_DURING_PERIOD_CACHE)
+def get_statistics_during_period_cache(
+    hass: HomeAssistant,
+) -> StatisticsDuringPeriodCache:
+    """Get the cache of statistics of periods which can no longer change."""
+    return StatisticsDuringPeriodCache()
+
+
 def cache_latest_short_term_statistic_id_for_metadata_id(
     run_cache: ShortTermStatisticsRunCache, session: Session, metadata_id: int
 ) -> int | None:
@@ -2384,12 +2829,17 @@ def import_statistics(
 ) -> bool:
     """Process an import_statistics job."""
 
-    with session_scope(
-        session=instance.get_session(),
-        exception_filter=_filter_unique_constraint_integrity_error(instance),
-    ) as session:
-        return _import_statistics_with_session(
-            instance, session, metadata, statistics, table
+    try:
+        with session_scope(
+            session=instance.get_session(),
+            exception_filter=_filter_unique_constraint_integrity_error(instance),
+        ) as session:
+            return _import_statistics_with_session(
+                instance, session, metadata, statistics, table
+            )
+    finally:
+        get_statistics_during_period_cache(instance.hass).invalidate(
+            (metadata["statistic_id"],)
         )
 
 
@@ -2432,6 +2882,7 @@ def adjust_statistics(
             sum_adjustment,
         )
 
+    get_statistics_during_period_cache(instance.hass).invalidate((statistic_id,))
     return True
 
 
@@ -2499,6 +2950,7 @@ def change_statistics_unit(
         statistics_meta_manager.update_unit_of_measurement(
             session, statistic_id, new_unit
         )
+    get_statistics_during_period_cache(instance.hass).invalidate((statistic_id,))
 
 
 @callback
@@ -12,6 +12,7 @@ from homeassistant.util.json import JSON_ENCODE_EXCEPTIONS
 
 from ..const import SQLITE_MAX_BIND_VARS
 from ..db_schema import EventData
+from ..models import EVENT_DATA_SQL_KEYS, compress_shared_json, decompress_shared_json
 from ..queries import get_shared_event_datas
 from ..util import chunked, execute_stmt_lambda_element
 from . import BaseLRUTableManager
@@ -99,6 +100,7 @@ class EventDataManager(BaseLRUTableManager[EventData]):
                 for data_id, shared_data in execute_stmt_lambda_element(
                     session, get_shared_event_datas(hashs_chunk), orm_rows=False
                 ):
+                    shared_data = decompress_shared_json(shared_data)
                     results[shared_data] = self._id_map[shared_data] = cast(
                         int, data_id
                     )
@@ -108,12 +110,19 @@ class EventDataManager(BaseLRUTableManager[EventData]):
     def add_pending(self, db_event_data: EventData) -> None:
         """Add a pending EventData that will be committed at the next interval.
 
+        The shared_data is compressed once it has been added when
+        the recorder compresses shared data.
+
         This call is not thread-safe and must be called from the
         recorder thread.
         """
         assert db_event_data.shared_data is not None
         shared_data: str = db_event_data.shared_data
         self._pending[shared_data] = db_event_data
+        if self.recorder.compress_shared_data:
+            db_event_data.shared_data = compress_shared_json(
+                shared_data, EVENT_DATA_SQL_KEYS
+            )
 
     def post_commit_pending(self) -> None:
         """Call after commit to load the data_ids of the new EventData into the LRU.
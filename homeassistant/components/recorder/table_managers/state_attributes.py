@@ -13,6 +13,11 @@ from homeassistant.util.json import JSON_ENCODE_EXCEPTIONS
 
 from ..const import SQLITE_MAX_BIND_VARS
 from ..db_schema import StateAttributes
+from ..models import (
+    STATE_ATTRIBUTES_SQL_KEYS,
+    compress_shared_json,
+    decompress_shared_json,
+)
 from ..queries import get_shared_attributes
 from ..util import chunked, execute_stmt_lambda_element
 from . import BaseLRUTableManager
@@ -112,6 +117,7 @@ class StateAttributesManager(BaseLRUTableManager[StateAttributes]):
                 for attributes_id, shared_attrs in execute_stmt_lambda_element(
                     session, get_shared_attributes(hashs_chunk), orm_rows=False
                 ):
+                    shared_attrs = decompress_shared_json(shared_attrs)
                     results[shared_attrs] = self._id_map[shared_attrs] = cast(
                         int, attributes_id
                     )
@@ -121,12 +127,19 @@ class StateAttributesManager(BaseLRUTableManager[StateAttributes]):
     def add_pending(self, db_state_attributes: StateAttributes) -> None:
         """Add a pending StateAttributes that will be committed at the next interval.
 
+        The shared_attrs are compressed once they have been added when
+        the recorder compresses shared data.
+
         This call is not thread-safe and must be called from the
         recorder thread.
         """
         assert db_state_attributes.shared_attrs is not None
         shared_attrs: str = db_state_attributes.shared_attrs
         self._pending[shared_attrs] = db_state_attributes
+        if self.recorder.compress_shared_data:
+            db_state_attributes.shared_attrs = compress_shared_json(
+                shared_attrs, STATE_ATTRIBUTES_SQL_KEYS
+            )
 
     def post_commit_pending(self) -> None:
         """Call after commit to load the attributes_ids of the new StateAttributes into the LRU.
@@ -1,7 +1,10 @@
 """Support managing States."""
 from __future__ import annotations
 
-from ..db_schema import States
+from sqlalchemy import insert, update
+from sqlalchemy.orm.session import Session
+
+from ..db_schema import States, StatesRow
 
 
 class StatesManager:
@@ -9,10 +12,11 @@ class StatesManager:
 
     def __init__(self) -> None:
         """Initialize the states manager for linking old_state_id."""
-        self._pending: dict[str, States] = {}
+        self._pending: dict[str, States | StatesRow] = {}
+        self._pending_rows: list[StatesRow] = []
         self._last_committed_id: dict[str, int] = {}
 
-    def pop_pending(self, entity_id: str) -> States | None:
+    def pop_pending(self, entity_id: str) -> States | StatesRow | None:
         """Pop a pending state.
 
         Pending states are states that are in the session but not yet committed.
@@ -33,7 +37,7 @@ class StatesManager:
         """
         return self._last_committed_id.pop(entity_id, None)
 
-    def add_pending(self, entity_id: str, state: States) -> None:
+    def add_pending(self, entity_id: str, state: States | StatesRow) -> None:
         """Add a pending state.
 
         Pending states are states that are in the session but not yet committed.
@@ -43,6 +47,52 @@ class StatesManager:
         """
         self._pending[entity_id] = state
 
+    def add_pending_row(self, row: StatesRow) -> None:
+        """Add a row to insert in bulk before the next commit.
+
+        This call is not thread-safe and must be called from the
+        recorder thread.
+        """
+        self._pending_rows.append(row)
+
+    def insert_pending_rows(self, session: Session) -> None:
+        """Insert the pending rows with a multi-row INSERT ... RETURNING.
+
+        The old_state_id of rows linked to another row of the same insert
+        is only known after the insert, so it is set with an executemany
+        UPDATE afterwards.
+
+        This call is not thread-safe and must be called from the
+        recorder thread.
+        """
+        if not (rows := self._pending_rows):
+            return
+        # Flush the StatesMeta and StateAttributes the rows link to
+        session.flush()
+        state_ids = session.scalars(
+            insert(States).returning(States.state_id, sort_by_parameter_order=True),
+            [row.as_params() for row in rows],
+        ).all()
+        for row, state_id in zip(rows, state_ids):
+            row.state_id = state_id
+        if old_state_ids := [
+            {"state_id": row.state_id, "old_state_id": row.old_state.state_id}
+            for row in rows
+            if row.old_state is not None and row.old_state.state_id is not None
+        ]:
+            session.execute(update(States), old_state_ids)
+
+    def rollback_pending_rows(self) -> None:
+        """Forget the state_id of the pending rows after a rollback.
+
+        The rows are inserted again by the next call to insert_pending_rows.
+
+        This call is not thread-safe and must be called from the
+        recorder thread.
+        """
+        for row in self._pending_rows:
+            row.state_id = None
+
     def post_commit_pending(self) -> None:
         """Call after commit to load the state_id of the new States into committed.
 
@@ -50,8 +100,10 @@ class StatesManager:
         recorder thread.
         """
         for entity_id, db_states in self._pending.items():
-            self._last_committed_id[entity_id] = db_states.state_id
+            if (state_id := db_states.state_id) is not None:
+                self._last_committed_id[entity_id] = state_id
         self._pending.clear()
+        self._pending_rows.clear()
 
     def reset(self) -> None:
         """Reset after the database has been reset or changed.
@@ -61,6 +113,7 @@ class StatesManager:
         """
         self._last_committed_id.clear()
         self._pending.clear()
+        self._pending_rows.clear()
 
     def evict_purged_state_ids(self, purged_state_ids: set[int]) -> None:
         """Evict purged states from the committed states.
@@ -24,6 +24,7 @@ _LOGGER = logging.getLogger(__name__)
 
 if TYPE_CHECKING:
     from .core import Recorder
+    from .serializer import PreparedEvent
 
 
 @dataclass(slots=True)
@@ -273,12 +274,31 @@ class EventTask(RecorderTask):
     """An event to be processed."""
 
     event: Event
+    # Set by the serializer when it reaches the task before the recorder thread
+    prepared: PreparedEvent | None = None
     commit_before = False
 
     def run(self, instance: Recorder) -> None:
         """Handle the task."""
         # pylint: disable-next=[protected-access]
-        instance._process_one_event(self.event)
+        instance._process_one_event(self)
+
+
+@dataclass(slots=True)
+class ReplaySpooledEventsTask(RecorderTask):
+    """Replay the next events which have been spooled to disk.
+
+    When until is set, the events spooled before that position
+    are replayed and spooling has already been stopped.
+    """
+
+    until: int | None = None
+    commit_before = False
+
+    def run(self, instance: Recorder) -> None:
+        """Handle the task."""
+        # pylint: disable-next=[protected-access]
+        instance._replay_spooled_events(self)
 
 
 @dataclass(slots=True)
@@ -19,7 +19,7 @@ from awesomeversion import (
 )
 import ciso8601
 from sqlalchemy import inspect, text
-from sqlalchemy.engine import Result, Row
+from sqlalchemy.engine import Engine, Result, Row
 from sqlalchemy.engine.interfaces import DBAPIConnection
 from sqlalchemy.exc import OperationalError, SQLAlchemyError
 from sqlalchemy.orm.query import Query
@@ -569,6 +569,35 @@ def setup_connection_for_dialect(
     )
 
 
+def setup_read_only_connection_for_dialect(
+    dialect_name: str, dbapi_connection: DBAPIConnection
+) -> None:
+    """Make a dbapi connection refuse writes."""
+    if dialect_name == SupportedDialect.SQLITE:
+        execute_on_connection(dbapi_connection, "PRAGMA query_only = ON")
+    elif dialect_name == SupportedDialect.MYSQL:
+        execute_on_connection(dbapi_connection, "SET SESSION TRANSACTION READ ONLY")
+    elif dialect_name == SupportedDialect.POSTGRESQL:
+        execute_on_connection(
+            dbapi_connection, "SET SESSION CHARACTERISTICS AS TRANSACTION READ ONLY"
+        )
+
+
+def supports_bulk_state_writes(engine: Engine) -> bool:
+    """Return if states can be inserted in bulk.
+
+    The database must return the ids of the rows inserted by an executemany
+    in the order of the parameters, which MySQL does not support.
+    """
+    return bool(
+        getattr(
+            engine.dialect,
+            "insert_executemany_returning_sort_by_parameter_order",
+            False,
+        )
+    )
+
+
 def end_incomplete_runs(session: Session, start_time: datetime) -> None:
     """End any incomplete recorder runs."""
     for run in session.query(RecorderRuns).filter_by(end=None):
@@ -133,7 +133,7 @@ async def ws_get_statistic_during_period(
     start_time, end_time = resolve_period(cast(StatisticPeriod, msg))
 
     connection.send_message(
-        await get_instance(hass).async_add_executor_job(
+        await get_instance(hass).async_add_read_executor_job(
             _ws_get_statistic_during_period,
             hass,
             msg["id"],
@@ -202,7 +202,7 @@ async def ws_handle_get_statistics_during_period(
     if (types := msg.get("types")) is None:
         types = {"change", "last_reset", "max", "mean", "min", "state", "sum"}
     connection.send_message(
-        await get_instance(hass).async_add_executor_job(
+        await get_instance(hass).async_add_read_executor_job(
             _ws_get_statistics_during_period,
             hass,
             msg["id"],
@@ -257,7 +257,7 @@ async def ws_handle_list_statistic_ids(
 ) -> None:
     """Fetch a list of available statistic_id."""
     connection.send_message(
-        await get_instance(hass).async_add_executor_job(
+        await get_instance(hass).async_add_read_executor_job(
             _ws_get_list_statistic_ids,
             hass,
             msg["id"],
@@ -411,7 +411,7 @@ async def ws_adjust_sum_statistics(
         return
 
     instance = get_instance(hass)
-    metadatas = await instance.async_add_executor_job(
+    metadatas = await instance.async_add_read_executor_job(
         list_statistic_ids, hass, {msg["statistic_id"]}
     )
     if not metadatas:
@@ -504,8 +504,10 @@ def ws_info(
     recorder_info = {
         "backlog": backlog,
         "max_backlog": instance.max_backlog,
+        "spooled_backlog": instance.spooled_backlog if instance else None,
         "migration_in_progress": migration_in_progress,
         "migration_is_live": migration_is_live,
+        "read_queries": instance.get_read_query_stats() if instance else None,
         "recording": recording,
         "thread_running": thread_alive,
     }
@@ -150,6 +150,9 @@ class SensorEntity(Entity):
     """Base class for sensor entities."""
 
     _entity_component_unrecorded_attributes = frozenset({ATTR_OPTIONS})
+    _cacheable_entity_properties = frozenset(
+        {"device_class", "_default_to_device_class_name"}
+    )
 
     entity_description: SensorEntityDescription
     _attr_device_class: SensorDeviceClass | None
@@ -1,12 +1,15 @@
 """Statistics helper for sensor."""
 from __future__ import annotations
 
+from array import array
+from bisect import bisect_left
 from collections import defaultdict
-from collections.abc import Callable, Iterable, MutableMapping
+from collections.abc import Callable, Iterable, MutableMapping, Sequence
 import datetime
 import itertools
 import logging
 import math
+from operator import mul, sub
 from typing import Any
 
 from sqlalchemy.orm.session import Session
@@ -23,6 +26,9 @@ from homeassistant.components.recorder.models import (
     StatisticMetaData,
     StatisticResult,
 )
+from homeassistant.components.recorder.models.state_attributes import (
+    decode_attributes_from_source,
+)
 from homeassistant.const import (
     ATTR_UNIT_OF_MEASUREMENT,
     REVOLUTIONS_PER_MINUTE,
@@ -125,6 +131,32 @@ def _time_weighted_average(
     return accumulated / period_seconds
 
 
+def _time_weighted_average_columns(
+    values: array[float],
+    timestamps: array[float],
+    start_ts: float,
+    end_ts: float,
+) -> float:
+    """Calculate a time weighted average from columns of values and timestamps.
+
+    This is the equivalent of _time_weighted_average, but works on the
+    float values and last updated timestamps of the states.
+    """
+    # The recorder will give us the last known state, which may be well
+    # before the requested start time for the statistics
+    if before_start := bisect_left(timestamps, start_ts):
+        timestamps = array("d", [start_ts]) * before_start + timestamps[before_start:]
+    ends = timestamps[1:]
+    ends.append(end_ts)
+    accumulated = sum(map(mul, values, map(sub, ends, timestamps)))
+
+    # Adjust start time, if there was no last known state
+    if (period_seconds := end_ts - timestamps[0]) == 0:
+        # See _time_weighted_average
+        return 0.0
+    return accumulated / period_seconds
+
+
 def _get_units(fstates: list[tuple[float, State]]) -> set[str | None]:
     """Return a set of all units."""
     return {item[1].attributes.get(ATTR_UNIT_OF_MEASUREMENT) for item in fstates}
@@ -167,6 +199,88 @@ def _entity_history_to_float_and_state(
     ]
 
 
+def _entity_columns_to_float_columns(
+    states: Sequence[str],
+    last_updated_ts: Sequence[float],
+    attributes: Sequence[str | None],
+) -> tuple[array[float], array[float], array[int], set[str | None]]:
+    """Return the float values, timestamps, rows and units for the given entity columns.
+
+    The rows are the indexes of the float values in the entity columns.
+    """
+    values: array[float] = array("d")
+    timestamps: array[float] = array("d")
+    rows: array[int] = array("L")
+    attribute_sources: set[str | None] = set()
+    for row, (state, timestamp, source) in enumerate(
+        zip(states, last_updated_ts, attributes)
+    ):
+        if (fstate := _float_or_none(state)) is None:
+            continue
+        values.append(fstate)
+        timestamps.append(timestamp)
+        rows.append(row)
+        attribute_sources.add(source)
+    attr_cache: dict[str, dict[str, Any]] = {}
+    units = {
+        decode_attributes_from_source(source, attr_cache).get(ATTR_UNIT_OF_MEASUREMENT)
+        for source in attribute_sources
+    }
+    return values, timestamps, rows, units
+
+
+def _normalize_float_columns(
+    hass: HomeAssistant,
+    old_metadatas: dict[str, tuple[int, StatisticMetaData]],
+    values: array[float],
+    state_unit: str | None,
+    entity_id: str,
+) -> tuple[str | None, array[float] | None]:
+    """Normalize units of float values which all have the same state unit.
+
+    This is the equivalent of _normalize_states for an entity with a stable unit.
+    """
+    statistics_unit: str | None
+    old_metadata = old_metadatas[entity_id][1] if entity_id in old_metadatas else None
+    if not old_metadata:
+        # We've not seen this sensor before, the unit of the states determines the
+        # unit used for statistics
+        statistics_unit = state_unit
+    else:
+        # We have seen this sensor before, use the unit from metadata
+        statistics_unit = old_metadata["unit_of_measurement"]
+
+    if statistics_unit not in statistics.STATISTIC_UNIT_TO_UNIT_CONVERTER:
+        # The unit used by this sensor doesn't support unit conversion
+        return state_unit, values
+
+    converter = statistics.STATISTIC_UNIT_TO_UNIT_CONVERTER[statistics_unit]
+    # Exclude states with unsupported unit from statistics
+    if state_unit not in converter.VALID_UNITS:
+        if WARN_UNSUPPORTED_UNIT not in hass.data:
+            hass.data[WARN_UNSUPPORTED_UNIT] = set()
+        if entity_id not in hass.data[WARN_UNSUPPORTED_UNIT]:
+            hass.data[WARN_UNSUPPORTED_UNIT].add(entity_id)
+            _LOGGER.warning(
+                (
+                    "The unit of %s (%s) cannot be converted to the unit of"
+                    " previously compiled statistics (%s). Generation of long term"
+                    " statistics will be suppressed unless the unit changes back to"
+                    " %s or a compatible unit. Go to %s to fix this"
+                ),
+                entity_id,
+                state_unit,
+                statistics_unit,
+                statistics_unit,
+                LINK_DEV_STATISTICS,
+            )
+        return statistics_unit, None
+    if state_unit == statistics_unit:
+        return statistics_unit, values
+    convert = converter.converter_factory(state_unit, statistics_unit)
+    return statistics_unit, array("d", map(convert, values))
+
+
 def _normalize_states(
     hass: HomeAssistant,
     old_metadatas: dict[str, tuple[int, StatisticMetaData]],
@@ -352,6 +466,209 @@ def reset_detected(
     return fstate < 0.9 * previous_fstate
 
 
+def _state_from_columns(
+    entity_id: str, states: Sequence[str], timestamps: array[float], row: int
+) -> State:
+    """Return the State of a row of the columns, used to log warnings."""
+    return State(
+        entity_id,
+        states[row],
+        last_updated=dt_util.utc_from_timestamp(timestamps[row]),
+    )
+
+
+def _total_increasing_resets(
+    hass: HomeAssistant,
+    entity_id: str,
+    values: array[float],
+    timestamps: array[float],
+    states: Sequence[str],
+    previous_fstate: float | None,
+    last_reset: str | None,
+) -> tuple[array[float], list[int]]:
+    """Return the valid values and the rows where a total_increasing sensor was reset.
+
+    This is the equivalent of reset_detected for columns, negative values
+    are dropped and only the rows where the value decreased are visited.
+    """
+    resets: list[int] = []
+    first = 0
+    if previous_fstate is None:
+        if not values:
+            return values, resets
+        # The first value is the zero point
+        if last_reset is None:
+            _LOGGER.info(
+                "Compiling initial sum statistics for %s, zero point set to %s",
+                entity_id,
+                values[0],
+            )
+        else:
+            _LOGGER.info(
+                (
+                    "Detected new cycle for %s, value dropped from %s to %s,"
+                    " triggered by state with last_updated set to %s"
+                ),
+                entity_id,
+                previous_fstate,
+                values[0],
+                _timestamp_to_isoformat_or_none(timestamps[0]),
+            )
+        resets.append(0)
+        first = 1
+        previous_fstate = values[0]
+
+    if negative := [row for row in range(first, len(values)) if values[row] < 0]:
+        warn_negative(
+            hass,
+            entity_id,
+            _state_from_columns(entity_id, states, timestamps, negative[0]),
+        )
+        valid = [row for row in range(len(values)) if row < first or values[row] >= 0]
+        values = array("d", [values[row] for row in valid])
+        timestamps = array("d", [timestamps[row] for row in valid])
+        states = [states[row] for row in valid]
+
+    previous_values = array("d", [previous_fstate]) + values[first:-1]
+    for row, previous in [
+        (row, previous)
+        for row, previous, fstate in zip(
+            itertools.count(first), previous_values, values[first:]
+        )
+        if fstate < previous
+    ]:
+        fstate = values[row]
+        if fstate >= 0.9 * previous:
+            warn_dip(
+                hass,
+                entity_id,
+                _state_from_columns(entity_id, states, timestamps, row),
+                previous,
+            )
+            continue
+        _LOGGER.info(
+            (
+                "Detected new cycle for %s, value dropped from %s to %s,"
+                " triggered by state with last_updated set to %s"
+            ),
+            entity_id,
+            previous,
+            fstate,
+            _timestamp_to_isoformat_or_none(timestamps[row]),
+        )
+        resets.append(row)
+    return values, resets
+
+
+def _total_resets(
+    entity_id: str,
+    values: array[float],
+    last_resets: list[str | None],
+    old_last_reset: str | None,
+    zero_point_set: bool,
+) -> list[int]:
+    """Return the rows where a total sensor was reset.
+
+    The sensor is reset when its last_reset changes, only the first row of
+    each run of rows with the same last_reset is visited.
+    """
+    resets: list[int] = []
+    for last_reset, rows in itertools.groupby(
+        range(len(values)), last_resets.__getitem__
+    ):
+        row = next(rows)
+        if last_reset is not None and last_reset != old_last_reset:
+            if zero_point_set or resets:
+                _LOGGER.info(
+                    "Detected new cycle for %s, last_reset set to %s (old last_reset %s)",
+                    entity_id,
+                    last_reset,
+                    old_last_reset,
+                )
+            else:
+                _LOGGER.info(
+                    "Compiling initial sum statistics for %s, zero point set to %s",
+                    entity_id,
+                    values[row],
+                )
+            old_last_reset = last_reset
+        elif last_reset is None and not zero_point_set and not resets:
+            _LOGGER.info(
+                "Compiling initial sum statistics for %s, zero point set to %s",
+                entity_id,
+                values[row],
+            )
+        else:
+            continue
+        resets.append(row)
+    return resets
+
+
+def _compile_sum_from_columns(
+    hass: HomeAssistant,
+    entity_id: str,
+    state_class: str,
+    values: array[float],
+    timestamps: array[float],
+    states: Sequence[str],
+    attributes: Sequence[str | None],
+    last_stat: statistics.StatisticsRow | None,
+) -> tuple[float, float, str | None] | None:
+    """Compile the sum, state and last_reset of a sensor from columns.
+
+    This is the equivalent of compiling the sum from the float states, but
+    only the rows where the sensor was reset are visited. Returns None if
+    there are no valid updates.
+    """
+    last_reset: str | None = None
+    new_state = old_state = None
+    _sum = 0.0
+    if last_stat is not None:
+        # We have compiled history for this sensor before,
+        # use that as a starting point.
+        last_reset = _timestamp_to_isoformat_or_none(last_stat["last_reset"])
+        new_state = old_state = last_stat.get("state")
+        _sum = last_stat.get("sum") or 0.0
+
+    if state_class == SensorStateClass.TOTAL_INCREASING:
+        values, resets = _total_increasing_resets(
+            hass, entity_id, values, timestamps, states, new_state, last_reset
+        )
+    else:
+        attr_cache: dict[str, dict[str, Any]] = {}
+        source_last_resets = {
+            source: _last_reset_as_utc_isoformat(
+                decode_attributes_from_source(source, attr_cache).get("last_reset"),
+                entity_id,
+            )
+            for source in set(attributes)
+        }
+        last_resets = [source_last_resets[source] for source in attributes]
+        resets = _total_resets(
+            entity_id, values, last_resets, last_reset, old_state is not None
+        )
+        if last_resets:
+            last_reset = last_resets[-1]
+
+    for row in resets:
+        # The sensor has been reset, update the sum
+        if old_state is not None and new_state is not None:
+            _sum += (values[row - 1] if row else new_state) - old_state
+        # ..and update the starting point
+        new_state = values[row]
+        # Force a new cycle for an existing sensor to start at 0
+        old_state = 0.0 if old_state is not None else new_state
+    if values:
+        new_state = values[-1]
+
+    if new_state is None or old_state is None:
+        # No valid updates
+        return None
+
+    # Update the sum with the last state
+    return _sum + new_state - old_state, new_state, last_reset
+
+
 def _wanted_statistics(sensor_states: list[State]) -> dict[str, set[str]]:
     """Prepare a dict with wanted statistics for entities."""
     return {
@@ -418,30 +735,72 @@ def _compile_statistics(  # noqa: C901
     entities_full_history = [
         i.entity_id for i in sensor_states if "sum" in wanted_statistics[i.entity_id]
     ]
-    history_list: MutableMapping[str, list[State]] = {}
-    if entities_full_history:
-        history_list = history.get_full_significant_states_with_session(
-            hass,
-            session,
-            start - datetime.timedelta.resolution,
-            end,
-            entity_ids=entities_full_history,
-            significant_changes_only=False,
-        )
     entities_significant_history = [
         i.entity_id
         for i in sensor_states
         if "sum" not in wanted_statistics[i.entity_id]
     ]
-    if entities_significant_history:
-        _history_list = history.get_full_significant_states_with_session(
-            hass,
-            session,
-            start - datetime.timedelta.resolution,
-            end,
-            entity_ids=entities_significant_history,
+    history_list: MutableMapping[str, list[State]] = {}
+    # Entities are compiled from columns of float values and timestamps, unless
+    # their unit changed during the period in which case the states are needed
+    # to normalize the units
+    entities_with_float_columns: dict[
+        str, tuple[str | None, array[float], array[float]]
+    ] = {}
+    # The states and attributes of the float values of entities tracking a sum
+    entities_with_sum_columns: dict[str, tuple[list[str], list[str | None]]] = {}
+    for entity_ids, significant_changes_only in (
+        (entities_full_history, False),
+        (entities_significant_history, True),
+    ):
+        if not entity_ids:
+            continue
+        entities_from_states = entity_ids
+        if (
+            history_columns := history.get_significant_state_columns_with_session(
+                hass,
+                session,
+                start - datetime.timedelta.resolution,
+                end,
+                entity_ids,
+                significant_changes_only,
+            )
+        ) is not None:
+            entities_from_states = []
+            for entity_id, entity_columns in history_columns.items():
+                values, timestamps, rows, units = _entity_columns_to_float_columns(
+                    *entity_columns
+                )
+                if values and len(units) != 1:
+                    entities_from_states.append(entity_id)
+                    continue
+                # Don't compile statistics for this entity from the states
+                history_list[entity_id] = []
+                if not values:
+                    continue
+                entities_with_float_columns[entity_id] = (
+                    units.pop(),
+                    values,
+                    timestamps,
+                )
+                if not significant_changes_only:
+                    states, _, attributes = entity_columns
+                    entities_with_sum_columns[entity_id] = (
+                        [states[row] for row in rows],
+                        [attributes[row] for row in rows],
+                    )
+            if not entities_from_states:
+                continue
+        history_list.update(
+            history.get_full_significant_states_with_session(
+                hass,
+                session,
+                start - datetime.timedelta.resolution,
+                end,
+                entity_ids=entities_from_states,
+                significant_changes_only=significant_changes_only,
+            )
         )
-        history_list = {**history_list, **_history_list}
 
     entities_with_float_states: dict[str, list[tuple[float, State]]] = {}
     for _state in sensor_states:
@@ -459,12 +818,43 @@ def _compile_statistics(  # noqa: C901
     # that are not in the metadata table and we are not working
     # with them anyway.
     old_metadatas = statistics.get_metadata_with_session(
-        get_instance(hass), session, statistic_ids=set(entities_with_float_states)
+        get_instance(hass),
+        session,
+        statistic_ids=set(entities_with_float_states)
+        | set(entities_with_float_columns),
     )
-    to_process: list[tuple[str, str | None, str, list[tuple[float, State]]]] = []
+    to_process: list[
+        tuple[
+            str,
+            str | None,
+            str,
+            list[tuple[float, State]],
+            tuple[array[float], array[float]] | None,
+        ]
+    ] = []
     to_query: set[str] = set()
     for _state in sensor_states:
         entity_id = _state.entity_id
+        state_class: str = _state.attributes[ATTR_STATE_CLASS]
+        if float_columns := entities_with_float_columns.get(entity_id):
+            state_unit, values, timestamps = float_columns
+            statistics_unit, valid_values = _normalize_float_columns(
+                hass, old_metadatas, values, state_unit, entity_id
+            )
+            if valid_values is None:
+                continue
+            to_process.append(
+                (
+                    entity_id,
+                    statistics_unit,
+                    state_class,
+                    [],
+                    (valid_values, timestamps),
+                )
+            )
+            if "sum" in wanted_statistics[entity_id]:
+                to_query.add(entity_id)
+            continue
         if not (maybe_float_states := entities_with_float_states.get(entity_id)):
             continue
         statistics_unit, valid_float_states = _normalize_states(
@@ -475,8 +865,9 @@ def _compile_statistics(  # noqa: C901
         )
         if not valid_float_states:
             continue
-        state_class: str = _state.attributes[ATTR_STATE_CLASS]
-        to_process.append((entity_id, statistics_unit, state_class, valid_float_states))
+        to_process.append(
+            (entity_id, statistics_unit, state_class, valid_float_states, None)
+        )
         if "sum" in wanted_statistics[entity_id]:
             to_query.add(entity_id)
 
@@ -488,6 +879,7 @@ def _compile_statistics(  # noqa: C901
         statistics_unit,
         state_class,
         valid_float_states,
+        valid_float_columns,
     ) in to_process:
         # Check metadata
         if old_metadata := old_metadatas.get(entity_id):
@@ -526,6 +918,36 @@ def _compile_statistics(  # noqa: C901
 
         # Make calculations
         stat: StatisticData = {"start": start}
+        if valid_float_columns is not None:
+            values, timestamps = valid_float_columns
+            if "sum" not in wanted_statistics[entity_id]:
+                stat["max"] = max(values)
+                stat["min"] = min(values)
+                stat["mean"] = _time_weighted_average_columns(
+                    values, timestamps, start.timestamp(), end.timestamp()
+                )
+                result.append({"meta": meta, "stat": stat})
+                continue
+            states, attributes = entities_with_sum_columns[entity_id]
+            if not (
+                compiled_sum := _compile_sum_from_columns(
+                    hass,
+                    entity_id,
+                    state_class,
+                    values,
+                    timestamps,
+                    states,
+                    attributes,
+                    last_stats[entity_id][0] if entity_id in last_stats else None,
+                )
+            ):
+                continue
+            stat["sum"], stat["state"], last_reset = compiled_sum
+            if last_reset is not None:
+                stat["last_reset"] = dt_util.parse_datetime(last_reset)
+            result.append({"meta": meta, "stat": stat})
+            continue
+
         if "max" in wanted_statistics[entity_id]:
             stat["max"] = max(
                 *itertools.islice(
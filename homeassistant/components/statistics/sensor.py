@@ -537,7 +537,7 @@ class StatisticsSensor(SensorEntity):
         If MaxAge is provided then query will restrict to entries younger then
         current datetime - MaxAge.
         """
-        if states := await get_instance(self.hass).async_add_executor_job(
+        if states := await get_instance(self.hass).async_add_read_executor_job(
             self._fetch_states_from_database
         ):
             for state in reversed(states):
@@ -17,7 +17,14 @@ from homeassistant.const import (
     MATCH_ALL,
     SIGNAL_BOOTSTRAP_INTEGRATIONS,
 )
-from homeassistant.core import Context, Event, HomeAssistant, State, callback
+from homeassistant.core import (
+    Context,
+    Event,
+    HomeAssistant,
+    State,
+    callback,
+    split_entity_id,
+)
 from homeassistant.exceptions import (
     HomeAssistantError,
     ServiceNotFound,
@@ -47,7 +54,11 @@ from homeassistant.loader import (
     async_get_integration_descriptions,
     async_get_integrations,
 )
-from homeassistant.setup import DATA_SETUP_TIME, async_get_loaded_integrations
+from homeassistant.setup import (
+    DATA_SETUP_TIME,
+    async_get_loaded_integrations,
+    async_get_startup_profile,
+)
 from homeassistant.util.json import format_unserializable_data
 
 from . import const, decorators, messages
@@ -55,6 +66,7 @@ from .connection import ActiveConnection
 from .messages import construct_event_message, construct_result_message
 
 ALL_SERVICE_DESCRIPTIONS_JSON_CACHE = "websocket_api_all_service_descriptions_json"
+STATES_JSON_CACHE = "websocket_api_states_json"
 
 
 @callback
@@ -72,6 +84,7 @@ def async_register_commands(
     async_reg(hass, handle_get_states)
     async_reg(hass, handle_manifest_get)
     async_reg(hass, handle_integration_setup_info)
+    async_reg(hass, handle_integration_startup_profile)
     async_reg(hass, handle_manifest_list)
     async_reg(hass, handle_ping)
     async_reg(hass, handle_render_template)
@@ -247,6 +260,115 @@ async def handle_call_service(
         connection.send_error(msg["id"], const.ERR_UNKNOWN_ERROR, str(err))
 
 
+class _StatesJSONCache:
+    """Cache the joined JSON of the states of each domain.
+
+    The cached JSON of a domain is dropped when one of its states changes
+    and joined again from the JSON cached on the states when it is needed,
+    so clients connecting at the same time share the serialized states.
+    """
+
+    __slots__ = ("_hass", "_domains", "_dict_json", "_compressed_json")
+
+    def __init__(self, hass: HomeAssistant) -> None:
+        """Initialize the cache."""
+        self._hass = hass
+        self._domains: dict[str, None] = dict.fromkeys(
+            state.domain for state in hass.states.async_all()
+        )
+        self._dict_json: dict[str, str] = {}
+        self._compressed_json: dict[str, str] = {}
+        hass.bus.async_listen(
+            EVENT_STATE_CHANGED, self._async_state_changed, run_immediately=True
+        )
+
+    @callback
+    def _async_state_changed(self, event: EventType[EventStateChangedData]) -> None:
+        """Drop the cached JSON of the domain of the changed state."""
+        domain = split_entity_id(event.data["entity_id"])[0]
+        self._domains[domain] = None
+        self._dict_json.pop(domain, None)
+        self._compressed_json.pop(domain, None)
+
+    @callback
+    def async_dict_json(self, entity_perm: Callable[[str, str], bool] | None) -> str:
+        """Return the JSON of the states as dicts joined by commas.
+
+        Raises ValueError or TypeError if a state can't be serialized.
+        """
+        return self._async_json(self._dict_json, _state_as_dict_json, entity_perm)
+
+    @callback
+    def async_compressed_json(
+        self, entity_perm: Callable[[str, str], bool] | None
+    ) -> str:
+        """Return the compressed JSON of the states joined by commas.
+
+        Raises ValueError or TypeError if a state can't be serialized.
+        """
+        return self._async_json(
+            self._compressed_json, _state_as_compressed_state_json, entity_perm
+        )
+
+    @callback
+    def _async_json(
+        self,
+        domain_json: dict[str, str],
+        state_json: Callable[[State], str],
+        entity_perm: Callable[[str, str], bool] | None,
+    ) -> str:
+        """Return the JSON of the states the user is allowed to read."""
+        parts: list[str] = []
+        all_states = self._hass.states.async_all
+        for domain in self._domains:
+            if (json_fragment := domain_json.get(domain)) is None:
+                json_fragment = domain_json[domain] = ",".join(
+                    map(state_json, all_states(domain))
+                )
+            if not json_fragment:
+                continue
+            if entity_perm is None:
+                parts.append(json_fragment)
+                continue
+            states = all_states(domain)
+            allowed = [
+                state for state in states if entity_perm(state.entity_id, POLICY_READ)
+            ]
+            if len(allowed) == len(states):
+                parts.append(json_fragment)
+            elif allowed:
+                parts.append(",".join(map(state_json, allowed)))
+        return ",".join(parts)
+
+
+def _state_as_dict_json(state: State) -> str:
+    """Return the JSON of a state."""
+    return state.as_dict_json
+
+
+def _state_as_compressed_state_json(state: State) -> str:
+    """Return the compressed JSON of a state."""
+    return state.as_compressed_state_json
+
+
+@callback
+def _async_get_states_json_cache(hass: HomeAssistant) -> _StatesJSONCache:
+    """Return the states JSON cache."""
+    if (cache := hass.data.get(STATES_JSON_CACHE)) is None:
+        cache = hass.data[STATES_JSON_CACHE] = _StatesJSONCache(hass)
+    return cast(_StatesJSONCache, cache)
+
+
+@callback
+def _async_get_entity_perm(
+    connection: ActiveConnection,
+) -> Callable[[str, str], bool] | None:
+    """Return the entity permission check or None if all entities can be read."""
+    if connection.user.permissions.access_all_entities(POLICY_READ):
+        return None
+    return connection.user.permissions.check_entity
+
+
 @callback
 def _async_get_allowed_states(
     hass: HomeAssistant, connection: ActiveConnection
@@ -267,16 +389,18 @@ def handle_get_states(
     hass: HomeAssistant, connection: ActiveConnection, msg: dict[str, Any]
 ) -> None:
     """Handle get states command."""
-    states = _async_get_allowed_states(hass, connection)
-
     try:
-        serialized_states = [state.as_dict_json for state in states]
+        joined_states = _async_get_states_json_cache(hass).async_dict_json(
+            _async_get_entity_perm(connection)
+        )
     except (ValueError, TypeError):
         pass
     else:
-        _send_handle_get_states_response(connection, msg["id"], serialized_states)
+        _send_handle_get_states_response(connection, msg["id"], [joined_states])
         return
 
+    states = _async_get_allowed_states(hass, connection)
+
     # If we can't serialize, we'll filter out unserializable states
     serialized_states = []
     for state in states:
@@ -337,7 +461,6 @@ def handle_subscribe_entities(
     # We must never await between sending the states and listening for
     # state changed events or we will introduce a race condition
     # where some states are missed
-    states = _async_get_allowed_states(hass, connection)
     connection.subscriptions[msg["id"]] = hass.bus.async_listen(
         EVENT_STATE_CHANGED,
         callback(
@@ -356,6 +479,18 @@ def handle_subscribe_entities(
     # JSON serialize here so we can recover if it blows up due to the
     # state machine containing unserializable data. This command is required
     # to succeed for the UI to show.
+    if not entity_ids:
+        try:
+            joined_states = _async_get_states_json_cache(hass).async_compressed_json(
+                _async_get_entity_perm(connection)
+            )
+        except (ValueError, TypeError):
+            pass
+        else:
+            _send_handle_entities_init_response(connection, msg["id"], [joined_states])
+            return
+
+    states = _async_get_allowed_states(hass, connection)
     try:
         serialized_states = [
             state.as_compressed_state_json
@@ -482,6 +617,16 @@ def handle_integration_setup_info(
     )
 
 
+@callback
+@decorators.require_admin
+@decorators.websocket_command({vol.Required("type"): "integration/startup_profile"})
+def handle_integration_startup_profile(
+    hass: HomeAssistant, connection: ActiveConnection, msg: dict[str, Any]
+) -> None:
+    """Handle integration startup profile command."""
+    connection.send_result(msg["id"], async_get_startup_profile(hass))
+
+
 @callback
 @decorators.websocket_command({vol.Required("type"): "ping"})
 def handle_ping(
@@ -992,13 +992,25 @@ _FilterableJobType = tuple[
 class EventBus:
     """Allow the firing of and listening for events."""
 
-    __slots__ = ("_listeners", "_match_all_listeners", "_hass")
+    __slots__ = (
+        "_listeners",
+        "_match_all_listeners",
+        "_dispatch",
+        "_match_all_dispatch",
+        "_hass",
+    )
 
     def __init__(self, hass: HomeAssistant) -> None:
         """Initialize a new event bus."""
         self._listeners: dict[str, list[_FilterableJobType]] = {}
         self._match_all_listeners: list[_FilterableJobType] = []
         self._listeners[MATCH_ALL] = self._match_all_listeners
+        # The listeners to run per event type, with the MATCH_ALL listeners
+        # merged in. Rebuilt when listeners change instead of on every fire.
+        self._dispatch: dict[str, tuple[_FilterableJobType, ...]] = {
+            EVENT_HOMEASSISTANT_CLOSE: ()
+        }
+        self._match_all_dispatch: tuple[_FilterableJobType, ...] = ()
         self._hass = hass
 
     @callback
@@ -1044,21 +1056,16 @@ class EventBus:
                 event_type, "event_type", MAX_LENGTH_EVENT_EVENT_TYPE
             )
 
-        listeners = self._listeners.get(event_type, [])
-        match_all_listeners = self._match_all_listeners
+        listeners = self._dispatch.get(event_type, self._match_all_dispatch)
 
         event = Event(event_type, event_data, origin, time_fired, context)
 
         if _LOGGER.isEnabledFor(logging.DEBUG):
             _LOGGER.debug("Bus:Handling %s", event)
 
-        if not listeners and not match_all_listeners:
+        if not listeners:
             return
 
-        # EVENT_HOMEASSISTANT_CLOSE should not be sent to MATCH_ALL listeners
-        if event_type != EVENT_HOMEASSISTANT_CLOSE:
-            listeners = match_all_listeners + listeners
-
         for job, event_filter, run_immediately in listeners:
             if event_filter is not None:
                 try:
@@ -1127,11 +1134,84 @@ class EventBus:
             (HassJob(listener, f"listen {event_type}"), event_filter, run_immediately),
         )
 
+    @callback
+    def async_listen_batched(
+        self,
+        event_type: str,
+        listener: Callable[[tuple[Event, ...]], Coroutine[Any, Any, None] | None],
+        event_filter: Callable[[Event], bool] | None = None,
+    ) -> CALLBACK_TYPE:
+        """Listen for events of a specific type and receive them in batches.
+
+        Events fired during the same event loop iteration are collected and
+        passed to the listener as one tuple, in the order they were fired.
+        This avoids scheduling a job per event for listeners which handle
+        bursts of events, like state_changed events during startup.
+
+        To listen to all events specify the constant ``MATCH_ALL``
+        as event_type.
+
+        An optional event_filter, which must be a callable decorated with
+        @callback that returns a boolean value, determines if an event is
+        added to the batch.
+
+        This method must be run in the event loop.
+        """
+        if event_filter is not None and not is_callback(event_filter):
+            raise HomeAssistantError(f"Event filter {event_filter} is not a callback")
+        hass = self._hass
+        job = HassJob(listener, f"listen batched {event_type}")
+        pending: list[Event] = []
+
+        @callback
+        def _flush_batch() -> None:
+            """Pass the collected events to the listener."""
+            events = tuple(pending)
+            pending.clear()
+            hass.async_run_hass_job(job, events)
+
+        @callback
+        def _collect_event(event: Event) -> None:
+            """Add an event to the batch."""
+            if not pending:
+                hass.loop.call_soon(_flush_batch)
+            pending.append(event)
+
+        return self._async_listen_filterable_job(
+            event_type,
+            (
+                HassJob(_collect_event, f"collect batched {event_type}"),
+                event_filter,
+                True,
+            ),
+        )
+
+    def listen_batched(
+        self,
+        event_type: str,
+        listener: Callable[[tuple[Event, ...]], Coroutine[Any, Any, None] | None],
+    ) -> CALLBACK_TYPE:
+        """Listen for events of a specific type and receive them in batches.
+
+        To listen to all events specify the constant ``MATCH_ALL``
+        as event_type.
+        """
+        async_remove_listener = run_callback_threadsafe(
+            self._hass.loop, self.async_listen_batched, event_type, listener
+        ).result()
+
+        def remove_listener() -> None:
+            """Remove the listener."""
+            run_callback_threadsafe(self._hass.loop, async_remove_listener).result()
+
+        return remove_listener
+
     @callback
     def _async_listen_filterable_job(
         self, event_type: str, filterable_job: _FilterableJobType
     ) -> CALLBACK_TYPE:
         self._listeners.setdefault(event_type, []).append(filterable_job)
+        self._async_update_dispatch(event_type)
 
         def remove_listener() -> None:
             """Remove the listener."""
@@ -1226,6 +1306,34 @@ class EventBus:
             _LOGGER.exception(
                 "Unable to remove unknown job listener %s", filterable_job
             )
+            return
+        self._async_update_dispatch(event_type)
+
+    @callback
+    def _async_update_dispatch(self, event_type: str) -> None:
+        """Rebuild the listeners to run when firing an event type.
+
+        A change of the MATCH_ALL listeners rebuilds every event type.
+        """
+        listeners = self._listeners
+        match_all_listeners = self._match_all_listeners
+        event_types: Iterable[str]
+        if event_type == MATCH_ALL:
+            self._match_all_dispatch = tuple(match_all_listeners)
+            event_types = (*listeners, EVENT_HOMEASSISTANT_CLOSE)
+        else:
+            event_types = (event_type,)
+        dispatch = self._dispatch
+        for type_ in event_types:
+            if type_ == MATCH_ALL:
+                continue
+            if type_ == EVENT_HOMEASSISTANT_CLOSE:
+                # EVENT_HOMEASSISTANT_CLOSE should not be sent to MATCH_ALL listeners
+                dispatch[type_] = tuple(listeners.get(type_, ()))
+            elif type_ in listeners:
+                dispatch[type_] = (*match_all_listeners, *listeners[type_])
+            else:
+                dispatch.pop(type_, None)
 
 
 class State:
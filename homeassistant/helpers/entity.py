@@ -79,6 +79,48 @@ DATA_ENTITY_SOURCE = "entity_info"
 # epsilon to make the string representation readable
 FLOAT_PRECISION = abs(int(math.floor(math.log10(abs(sys.float_info.epsilon))))) - 1
 
+# The state attributes which rarely change mapped to the entity properties
+# they are calculated from. The attributes are cached for the entities which
+# do not override the properties, or override them with an implementation
+# which is declared in _cacheable_entity_properties.
+CACHEABLE_ENTITY_ATTRIBUTES: Final[dict[str, tuple[str, ...]]] = {
+    ATTR_UNIT_OF_MEASUREMENT: ("unit_of_measurement",),
+    ATTR_ASSUMED_STATE: ("assumed_state",),
+    ATTR_ATTRIBUTION: ("attribution",),
+    ATTR_DEVICE_CLASS: ("device_class",),
+    ATTR_ENTITY_PICTURE: ("entity_picture",),
+    ATTR_ICON: ("icon",),
+    ATTR_FRIENDLY_NAME: (
+        "name",
+        "has_entity_name",
+        "use_device_name",
+        "_friendly_name_internal",
+        "_default_to_device_class_name",
+        "device_class",
+    ),
+    ATTR_SUPPORTED_FEATURES: ("supported_features",),
+}
+
+# The instance attributes the properties of the cached state attributes
+# are calculated from, setting one of them invalidates the cache.
+CACHED_ENTITY_ATTRIBUTES_SOURCES: Final = frozenset(
+    {
+        "_attr_assumed_state",
+        "_attr_attribution",
+        "_attr_device_class",
+        "_attr_entity_picture",
+        "_attr_has_entity_name",
+        "_attr_icon",
+        "_attr_name",
+        "_attr_supported_features",
+        "_attr_unit_of_measurement",
+        "device_entry",
+        "entity_description",
+        "platform",
+        "registry_entry",
+    }
+)
+
 
 @callback
 def async_setup(hass: HomeAssistant) -> None:
@@ -242,6 +284,16 @@ class EntityDescription:
     unit_of_measurement: str | None = None
 
 
+def _is_cacheable_property(cls: type[Entity], name: str) -> bool:
+    """Return if the state attributes calculated from a property can be cached."""
+    for klass in cls.__mro__:
+        if name in klass.__dict__:
+            return klass is Entity or name in klass.__dict__.get(
+                "_cacheable_entity_properties", ()
+            )
+    return False
+
+
 class Entity(ABC):
     """An abstract class for Home Assistant entities."""
 
@@ -300,6 +352,14 @@ class Entity(ABC):
     _context: Context | None = None
     _context_set: float | None = None
 
+    # The pending write of the state writes which are coalesced
+    _coalesced_write: asyncio.Handle | None = None
+    # The number of state writes which were coalesced into a later write
+    _coalesced_state_writes = 0
+    # If the state was written since the entity was added, the first write
+    # is never coalesced
+    _state_written = False
+
     # If entity is added to an entity platform
     _platform_state = EntityPlatformState.NOT_ADDED
 
@@ -314,6 +374,20 @@ class Entity(ABC):
         _entity_component_unrecorded_attributes | _unrecorded_attributes
     )
 
+    # The properties overridden by the class with an implementation which only
+    # reads the instance attributes in CACHED_ENTITY_ATTRIBUTES_SOURCES, only
+    # applies to the properties overridden by the class which declares them
+    _cacheable_entity_properties: frozenset[str] = frozenset()
+
+    # The keys of the state attributes which are cached and the keys of those
+    # which are calculated on every write as the class overrides their
+    # properties, set automatically by __init_subclass__
+    __cached_attribute_keys: frozenset[str] = frozenset(CACHEABLE_ENTITY_ATTRIBUTES)
+    __uncached_attribute_keys: frozenset[str] = frozenset()
+    # The cached state attributes, cleared when an instance attribute they are
+    # calculated from is set
+    _cached_attributes: dict[str, Any] | None = None
+
     # StateInfo. Set by EntityPlatform by calling async_internal_added_to_hass
     # While not purely typed, it makes typehinting more useful for us
     # and removes the need for constant None checks or asserts.
@@ -325,6 +399,7 @@ class Entity(ABC):
     _attr_available: bool = True
     _attr_capability_attributes: Mapping[str, Any] | None = None
     _attr_context_recent_time: timedelta = timedelta(seconds=5)
+    _attr_coalesce_state_writes: timedelta | None = None
     _attr_device_class: str | None
     _attr_device_info: DeviceInfo | None = None
     _attr_entity_category: EntityCategory | None
@@ -349,6 +424,26 @@ class Entity(ABC):
         cls.__combined_unrecorded_attributes = (
             cls._entity_component_unrecorded_attributes | cls._unrecorded_attributes
         )
+        cls.__uncached_attribute_keys = frozenset(
+            key
+            for key, properties in CACHEABLE_ENTITY_ATTRIBUTES.items()
+            if not all(_is_cacheable_property(cls, name) for name in properties)
+        )
+        cls.__cached_attribute_keys = frozenset(CACHEABLE_ENTITY_ATTRIBUTES).difference(
+            cls.__uncached_attribute_keys
+        )
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        """Set an attribute and clear the state attributes calculated from it."""
+        if name in CACHED_ENTITY_ATTRIBUTES_SOURCES:
+            self.__dict__.pop("_cached_attributes", None)
+        super().__setattr__(name, value)
+
+    def __delattr__(self, name: str) -> None:
+        """Delete an attribute and clear the state attributes calculated from it."""
+        if name in CACHED_ENTITY_ATTRIBUTES_SOURCES:
+            self.__dict__.pop("_cached_attributes", None)
+        super().__delattr__(name)
 
     @property
     def should_poll(self) -> bool:
@@ -644,6 +739,17 @@ class Entity(ABC):
         """Time that a context is considered recent."""
         return self._attr_context_recent_time
 
+    @property
+    def coalesce_state_writes(self) -> timedelta | None:
+        """Return the window within which state writes are coalesced.
+
+        The state is written once at the end of the window instead of on every
+        call to async_write_ha_state. A zero window coalesces the writes of the
+        same event loop iteration. None writes the state immediately. The first
+        state after the entity was added is always written immediately.
+        """
+        return self._attr_coalesce_state_writes
+
     @property
     def entity_registry_enabled_default(self) -> bool:
         """Return if the entity should be enabled when first added.
@@ -776,8 +882,24 @@ class Entity(ABC):
                 f"No entity id specified for entity {self.name}"
             )
 
+        if (window := self.coalesce_state_writes) is not None and self._state_written:
+            self._async_coalesce_write_ha_state(window)
+            return
+
         self._async_write_ha_state()
 
+    @callback
+    def _async_coalesce_write_ha_state(self, window: timedelta) -> None:
+        """Write the state at the end of the window unless a write is pending."""
+        if self._coalesced_write is not None:
+            self._coalesced_state_writes += 1
+            return
+        loop = self.hass.loop
+        if delay := window.total_seconds():
+            self._coalesced_write = loop.call_later(delay, self._async_write_ha_state)
+        else:
+            self._coalesced_write = loop.call_soon(self._async_write_ha_state)
+
     def _stringify_state(self, available: bool) -> str:
         """Convert state to string."""
         if not available:
@@ -809,52 +931,91 @@ class Entity(ABC):
         return f"{device_name} {name}" if device_name else name
 
     @callback
-    def _async_generate_attributes(self) -> tuple[str, dict[str, Any]]:
-        """Calculate state string and attribute mapping."""
+    def _async_calculate_entity_attributes(
+        self, keys: frozenset[str]
+    ) -> dict[str, Any]:
+        """Calculate the state attributes of the entity properties with the keys."""
         entry = self.registry_entry
+        attr: dict[str, Any] = {}
 
-        attr = self.capability_attributes
-        attr = dict(attr) if attr else {}
-
-        available = self.available  # only call self.available once per update cycle
-        state = self._stringify_state(available)
-        if available:
-            attr.update(self.state_attributes or {})
-            attr.update(self.extra_state_attributes or {})
-
-        if (unit_of_measurement := self.unit_of_measurement) is not None:
+        if (
+            ATTR_UNIT_OF_MEASUREMENT in keys
+            and (unit_of_measurement := self.unit_of_measurement) is not None
+        ):
             attr[ATTR_UNIT_OF_MEASUREMENT] = unit_of_measurement
 
-        if assumed_state := self.assumed_state:
+        if ATTR_ASSUMED_STATE in keys and (assumed_state := self.assumed_state):
             attr[ATTR_ASSUMED_STATE] = assumed_state
 
-        if (attribution := self.attribution) is not None:
+        if ATTR_ATTRIBUTION in keys and (attribution := self.attribution) is not None:
             attr[ATTR_ATTRIBUTION] = attribution
 
         if (
-            device_class := (entry and entry.device_class) or self.device_class
-        ) is not None:
+            ATTR_DEVICE_CLASS in keys
+            and (device_class := (entry and entry.device_class) or self.device_class)
+            is not None
+        ):
             attr[ATTR_DEVICE_CLASS] = str(device_class)
 
-        if (entity_picture := self.entity_picture) is not None:
+        if (
+            ATTR_ENTITY_PICTURE in keys
+            and (entity_picture := self.entity_picture) is not None
+        ):
             attr[ATTR_ENTITY_PICTURE] = entity_picture
 
-        if (icon := (entry and entry.icon) or self.icon) is not None:
+        if (
+            ATTR_ICON in keys
+            and (icon := (entry and entry.icon) or self.icon) is not None
+        ):
             attr[ATTR_ICON] = icon
 
         if (
-            name := (entry and entry.name) or self._friendly_name_internal()
-        ) is not None:
+            ATTR_FRIENDLY_NAME in keys
+            and (name := (entry and entry.name) or self._friendly_name_internal())
+            is not None
+        ):
             attr[ATTR_FRIENDLY_NAME] = name
 
-        if (supported_features := self.supported_features) is not None:
+        if (
+            ATTR_SUPPORTED_FEATURES in keys
+            and (supported_features := self.supported_features) is not None
+        ):
             attr[ATTR_SUPPORTED_FEATURES] = supported_features
 
+        return attr
+
+    @callback
+    def _async_generate_attributes(self) -> tuple[str, dict[str, Any]]:
+        """Calculate state string and attribute mapping."""
+        attr = self.capability_attributes
+        attr = dict(attr) if attr else {}
+
+        available = self.available  # only call self.available once per update cycle
+        state = self._stringify_state(available)
+        if available:
+            attr.update(self.state_attributes or {})
+            attr.update(self.extra_state_attributes or {})
+
+        # The state attributes of the properties which are not overridden
+        # only change when the instance attributes they read are set
+        if (cached_attr := self._cached_attributes) is None:
+            cached_attr = (
+                self._cached_attributes
+            ) = self._async_calculate_entity_attributes(self.__cached_attribute_keys)
+        attr.update(cached_attr)
+        if uncached_keys := self.__uncached_attribute_keys:
+            attr.update(self._async_calculate_entity_attributes(uncached_keys))
+
         return (state, attr)
 
     @callback
     def _async_write_ha_state(self) -> None:
         """Write the state to the state machine."""
+        if self._coalesced_write is not None:
+            # The state is written now, including the coalesced writes
+            self._coalesced_write.cancel()
+            self._coalesced_write = None
+
         if self._platform_state == EntityPlatformState.REMOVED:
             # Polling returned after the entity has already been removed
             return
@@ -902,6 +1063,7 @@ class Entity(ABC):
             self._context = None
             self._context_set = None
 
+        self._state_written = True
         try:
             hass.states.async_set(
                 entity_id,
@@ -1031,6 +1193,7 @@ class Entity(ABC):
         self.platform = platform
         self.parallel_updates = parallel_updates
         self._platform_state = EntityPlatformState.ADDED
+        self._state_written = False
 
     def _call_on_remove_callbacks(self) -> None:
         """Call callbacks registered by async_on_remove."""
@@ -1075,6 +1238,10 @@ class Entity(ABC):
 
         self._platform_state = EntityPlatformState.REMOVED
 
+        if self._coalesced_write is not None:
+            self._coalesced_write.cancel()
+            self._coalesced_write = None
+
         self._call_on_remove_callbacks()
 
         await self.async_internal_will_remove_from_hass()
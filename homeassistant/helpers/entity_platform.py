@@ -2,7 +2,7 @@
 from __future__ import annotations
 
 import asyncio
-from collections.abc import Awaitable, Callable, Coroutine, Iterable
+from collections.abc import Awaitable, Callable, Collection, Coroutine, Iterable
 from contextvars import ContextVar
 from datetime import datetime, timedelta
 from logging import Logger, getLogger
@@ -97,6 +97,20 @@ class EntityPlatformModule(Protocol):
     ) -> None:
         """Set up an integration platform from a config entry."""
 
+    async def async_batch_entity_service_call(
+        self,
+        hass: HomeAssistant,
+        entities: list[Entity],
+        call: ServiceCall,
+        data: dict[str, Any] | ServiceCall,
+    ) -> Collection[Entity]:
+        """Handle an entity service call for several entities with one command.
+
+        The data is what the service method of each entity is called with.
+        Returns the entities which were handled, the service is called for each
+        of the other entities as usual.
+        """
+
 
 class EntityPlatform:
     """Manage the entities for a single platform."""
@@ -142,6 +156,16 @@ class EntityPlatform:
         # which powers entity_component.add_entities
         self.parallel_updates_created = platform is None
 
+        # Limits the entity service calls and the updates which follow them
+        self.parallel_service_calls: asyncio.Semaphore | None = None
+        if parallel_service_calls := getattr(platform, "PARALLEL_SERVICE_CALLS", 0):
+            self.parallel_service_calls = asyncio.Semaphore(parallel_service_calls)
+
+        self.batch_entity_service_call: Callable[
+            [HomeAssistant, list[Entity], ServiceCall, dict[str, Any] | ServiceCall],
+            Awaitable[Collection[Entity]],
+        ] | None = getattr(platform, "async_batch_entity_service_call", None)
+
         hass.data.setdefault(DATA_ENTITY_PLATFORM, {}).setdefault(
             self.platform_name, []
         ).append(self)
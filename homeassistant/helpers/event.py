@@ -50,6 +50,9 @@ from .typing import EventType, TemplateVarsType
 TRACK_STATE_CHANGE_CALLBACKS = "track_state_change_callbacks"
 TRACK_STATE_CHANGE_LISTENER = "track_state_change_listener"
 
+TRACK_STATE_CHANGE_DOMAIN_CALLBACKS = "track_state_change_domain_callbacks"
+TRACK_STATE_CHANGE_DOMAIN_LISTENER = "track_state_change_domain_listener"
+
 TRACK_STATE_ADDED_DOMAIN_CALLBACKS = "track_state_added_domain_callbacks"
 TRACK_STATE_ADDED_DOMAIN_LISTENER = "track_state_added_domain_listener"
 
@@ -622,6 +625,44 @@ def async_track_state_removed_domain(
     )
 
 
+@callback
+def _async_domain_state_change_filter(
+    hass: HomeAssistant,
+    callbacks: dict[str, list[HassJob[[EventType[EventStateChangedData]], Any]]],
+    event: EventType[EventStateChangedData],
+) -> bool:
+    """Filter state changes by domain."""
+    return (
+        MATCH_ALL in callbacks
+        or split_entity_id(event.data["entity_id"])[0] in callbacks
+    )
+
+
+@bind_hass
+def _async_track_state_change_domain_event(
+    hass: HomeAssistant,
+    domains: str | Iterable[str],
+    action: Callable[[EventType[EventStateChangedData]], Any],
+) -> CALLBACK_TYPE:
+    """Track state change events of all entities in domains.
+
+    Pass MATCH_ALL as domain to track state change events of all entities.
+
+    All trackers share a single state_changed listener which routes each
+    event to the trackers of its domain only.
+    """
+    return _async_track_event(
+        hass,
+        domains,
+        TRACK_STATE_CHANGE_DOMAIN_CALLBACKS,
+        TRACK_STATE_CHANGE_DOMAIN_LISTENER,
+        EVENT_STATE_CHANGED,
+        _async_dispatch_domain_event,
+        _async_domain_state_change_filter,
+        action,
+    )
+
+
 @callback
 def _async_string_to_lower_list(instr: str | Iterable[str]) -> list[str]:
     if isinstance(instr, str):
@@ -642,9 +683,6 @@ class _TrackStateChangeFiltered:
         """Handle removal / refresh of tracker init."""
         self.hass = hass
         self._action = action
-        self._action_as_hassjob = HassJob(
-            action, f"track state change filtered {track_states}"
-        )
         self._listeners: dict[str, Callable[[], None]] = {}
         self._last_track_states: TrackStates = track_states
 
@@ -729,8 +767,12 @@ class _TrackStateChangeFiltered:
     @callback
     def _setup_entities_listener(self, domains: set[str], entities: set[str]) -> None:
         if domains:
-            entities = entities.copy()
-            entities.update(self.hass.states.async_entity_ids(domains))
+            # Entities in a tracked domain are already routed by the domain listener
+            entities = {
+                entity_id
+                for entity_id in entities
+                if entity_id.partition(".")[0] not in domains
+            }
 
         # Entities has changed to none
         if not entities:
@@ -740,27 +782,19 @@ class _TrackStateChangeFiltered:
             self.hass, entities, self._action
         )
 
-    @callback
-    def _state_added(self, event: EventType[EventStateChangedData]) -> None:
-        self._cancel_listener(_ENTITIES_LISTENER)
-        self._setup_entities_listener(
-            self._last_track_states.domains, self._last_track_states.entities
-        )
-        self.hass.async_run_hass_job(self._action_as_hassjob, event)
-
     @callback
     def _setup_domains_listener(self, domains: set[str]) -> None:
         if not domains:
             return
 
-        self._listeners[_DOMAINS_LISTENER] = _async_track_state_added_domain(
-            self.hass, domains, self._state_added
+        self._listeners[_DOMAINS_LISTENER] = _async_track_state_change_domain_event(
+            self.hass, domains, self._action
         )
 
     @callback
     def _setup_all_listener(self) -> None:
-        self._listeners[_ALL_LISTENER] = self.hass.bus.async_listen(
-            EVENT_STATE_CHANGED, self._action  # type: ignore[arg-type]
+        self._listeners[_ALL_LISTENER] = _async_track_state_change_domain_event(
+            self.hass, MATCH_ALL, self._action
         )
 
 
@@ -910,6 +944,7 @@ class TrackTemplateResultInfo:
         self._info: dict[Template, RenderInfo] = {}
         self._track_state_changes: _TrackStateChangeFiltered | None = None
         self._time_listeners: dict[Template, Callable[[], None]] = {}
+        self._rerenders: dict[Template, int] = {}
 
     def __repr__(self) -> str:
         """Return the representation."""
@@ -986,6 +1021,11 @@ class TrackTemplateResultInfo:
             "time": bool(self._time_listeners),
         }
 
+    @property
+    def rerenders(self) -> dict[Template, int]:
+        """Return how many times each template was re-rendered after setup."""
+        return self._rerenders
+
     @callback
     def _setup_time_listener(self, template: Template, has_time: bool) -> None:
         if not has_time:
@@ -1074,6 +1114,7 @@ class TrackTemplateResultInfo:
             )
 
         self._rate_limit.async_triggered(template, now)
+        self._rerenders[template] = self._rerenders.get(template, 0) + 1
         self._info[template] = info = template.async_render_to_info(
             track_template_.variables
         )
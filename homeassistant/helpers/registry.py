@@ -0,0 +1,17 @@
+"""Provide shared helpers for the registries."""
+from __future__ import annotations
+
+from collections import defaultdict
+from typing import Literal
+
+# Maps an indexed value (config entry id, device id, area id) to the keys of the
+# registry items having that value. A dict is used as an ordered set.
+RegistryIndexType = defaultdict[str, dict[str, Literal[True]]]
+
+
+def unindex_key(index: RegistryIndexType, value: str, key: str) -> None:
+    """Remove a key from an index, dropping the value once it has no keys left."""
+    keys = index[value]
+    del keys[key]
+    if not keys:
+        del index[value]
@@ -7,6 +7,7 @@ import dataclasses
 from enum import Enum
 from functools import cache, partial, wraps
 import logging
+from timeit import default_timer as timer
 from types import ModuleType
 from typing import TYPE_CHECKING, Any, TypedDict, TypeGuard, TypeVar, cast
 
@@ -68,6 +69,9 @@ _LOGGER = logging.getLogger(__name__)
 
 SERVICE_DESCRIPTION_CACHE = "service_description_cache"
 ALL_SERVICE_DESCRIPTIONS_CACHE = "all_service_descriptions_cache"
+DATA_ENTITY_SERVICE_CALL_STATS = "entity_service_call_stats"
+
+_T = TypeVar("_T")
 
 
 @cache
@@ -246,6 +250,27 @@ class SelectedEntities:
         )
 
 
+@dataclasses.dataclass(slots=True)
+class EntityServiceCallStats:
+    """Statistics of the entity service calls fanned out to an integration."""
+
+    calls: int = 0
+    entities: int = 0
+    total_time: float = 0.0
+    max_time: float = 0.0
+
+
+@callback
+def async_get_entity_service_call_stats(
+    hass: HomeAssistant,
+) -> dict[str, EntityServiceCallStats]:
+    """Return the statistics of the entity service calls per integration."""
+    stats: dict[str, EntityServiceCallStats] = hass.data.setdefault(
+        DATA_ENTITY_SERVICE_CALL_STATS, {}
+    )
+    return stats
+
+
 @bind_hass
 def call_from_config(
     hass: HomeAssistant,
@@ -480,32 +505,37 @@ def async_extract_referenced_entity_ids(
 
     # Find devices for targeted areas
     selected.referenced_devices.update(selector.device_ids)
-    for device_entry in dev_reg.devices.values():
-        if device_entry.area_id in selector.area_ids:
-            selected.referenced_devices.add(device_entry.id)
+    for area_id in selector.area_ids:
+        selected.referenced_devices.update(
+            device_entry.id
+            for device_entry in dev_reg.devices.get_devices_for_area_id(area_id)
+        )
 
     if not selector.area_ids and not selected.referenced_devices:
         return selected
 
-    for ent_entry in ent_reg.entities.values():
-        # Do not add entities which are hidden or which are config
-        # or diagnostic entities.
-        if ent_entry.entity_category is not None or ent_entry.hidden_by is not None:
-            continue
+    entities = ent_reg.entities
+    # Do not add entities which are hidden or which are config
+    # or diagnostic entities.
+    for area_id in selector.area_ids:
+        # The entity's area matches a targeted area
+        selected.indirectly_referenced.update(
+            ent_entry.entity_id
+            for ent_entry in entities.get_entries_for_area_id(area_id)
+            if ent_entry.entity_category is None and ent_entry.hidden_by is None
+        )
 
-        if (
-            # The entity's area matches a targeted area
-            ent_entry.area_id in selector.area_ids
-            # The entity's device matches a device referenced by an area and the entity
-            # has no explicitly set area
-            or (
-                not ent_entry.area_id
-                and ent_entry.device_id in selected.referenced_devices
-            )
-            # The entity's device matches a targeted device
-            or ent_entry.device_id in selector.device_ids
-        ):
-            selected.indirectly_referenced.add(ent_entry.entity_id)
+    for device_id in selected.referenced_devices:
+        # The entity's device matches a targeted device, or a device referenced
+        # by an area and the entity has no explicitly set area
+        targeted_device = device_id in selector.device_ids
+        selected.indirectly_referenced.update(
+            ent_entry.entity_id
+            for ent_entry in entities.get_entries_for_device_id(device_id, True)
+            if ent_entry.entity_category is None
+            and ent_entry.hidden_by is None
+            and (targeted_device or not ent_entry.area_id)
+        )
 
     return selected
 
@@ -840,25 +870,30 @@ async def entity_service_call(
         referenced.log_missing(missing)
 
     entities: list[Entity] = []
+    # Most entities share their supported features with other entities of
+    # the same integration, only check each combination once.
+    has_required_features: dict[int | None, bool] = {}
     for entity in entity_candidates:
         if not entity.available:
             continue
 
         # Skip entities that don't have the required feature.
-        if required_features is not None and (
-            entity.supported_features is None
-            or not any(
-                entity.supported_features & feature_set == feature_set
-                for feature_set in required_features
-            )
-        ):
-            # If entity explicitly referenced, raise an error
-            if referenced is not None and entity.entity_id in referenced.referenced:
-                raise HomeAssistantError(
-                    f"Entity {entity.entity_id} does not support this service."
+        if required_features is not None:
+            supported_features = entity.supported_features
+            if (has_features := has_required_features.get(supported_features)) is None:
+                has_features = supported_features is not None and any(
+                    supported_features & feature_set == feature_set
+                    for feature_set in required_features
                 )
+                has_required_features[supported_features] = has_features
+            if not has_features:
+                # If entity explicitly referenced, raise an error
+                if referenced is not None and entity.entity_id in referenced.referenced:
+                    raise HomeAssistantError(
+                        f"Entity {entity.entity_id} does not support this service."
+                    )
 
-            continue
+                continue
 
         entities.append(entity)
 
@@ -873,14 +908,15 @@ async def entity_service_call(
         # Single entity case avoids creating tasks and allows returning
         # ServiceResponse
         entity = entities[0]
-        response_data = await _handle_entity_call(
-            hass, entity, func, data, call.context
+        semaphore = entity.platform.parallel_service_calls if entity.platform else None
+        response_data = await _async_limit(
+            semaphore, _handle_entity_call(hass, entity, func, data, call.context)
         )
         if entity.should_poll:
             # Context expires if the turn on commands took a long time.
             # Set context again so it's there when we update
             entity.async_set_context(call.context)
-            await entity.async_update_ha_state(True)
+            await _async_limit(semaphore, entity.async_update_ha_state(True))
         return response_data if return_response else None
 
     if return_response:
@@ -888,14 +924,18 @@ async def entity_service_call(
             "Service call requested response data but matched more than one entity"
         )
 
+    platform_entities: dict[EntityPlatform | None, list[Entity]] = {}
+    for entity in entities:
+        platform_entities.setdefault(entity.platform, []).append(entity)
+
     done, pending = await asyncio.wait(
         [
             asyncio.create_task(
-                entity.async_request_call(
-                    _handle_entity_call(hass, entity, func, data, call.context)
+                _handle_platform_entities_call(
+                    hass, platform, platform_entities[platform], func, data, call
                 )
             )
-            for entity in entities
+            for platform in platform_entities
         ]
     )
     assert not pending
@@ -903,24 +943,121 @@ async def entity_service_call(
     for task in done:
         task.result()  # pop exception if have
 
-    tasks: list[asyncio.Task[None]] = []
+    return None
 
-    for entity in entities:
-        if not entity.should_poll:
-            continue
 
-        # Context expires if the turn on commands took a long time.
-        # Set context again so it's there when we update
-        entity.async_set_context(call.context)
-        tasks.append(asyncio.create_task(entity.async_update_ha_state(True)))
+async def _handle_platform_entities_call(
+    hass: HomeAssistant,
+    platform: EntityPlatform | None,
+    entities: list[Entity],
+    func: str | Callable[..., Coroutine[Any, Any, ServiceResponse]],
+    data: dict | ServiceCall,
+    call: ServiceCall,
+) -> None:
+    """Handle calling service method for the entities of a platform.
 
-    if tasks:
-        done, pending = await asyncio.wait(tasks)
-        assert not pending
-        for future in done:
-            future.result()  # pop exception if have
+    The platform can handle the call for several entities with one command,
+    the service method is called for each of the other entities.
+    """
+    start = timer()
+    semaphore = platform.parallel_service_calls if platform else None
+    try:
+        call_entities = entities
+        if (
+            platform is not None
+            and (batch_entity_service_call := platform.batch_entity_service_call)
+            and len(entities) > 1
+        ):
+            for entity in entities:
+                entity.async_set_context(call.context)
+            if handled := await _async_limit(
+                semaphore, batch_entity_service_call(hass, entities, call, data)
+            ):
+                handled = set(handled)
+                call_entities = [entity for entity in entities if entity not in handled]
+
+        if call_entities:
+            done, pending = await asyncio.wait(
+                [
+                    asyncio.create_task(
+                        _async_limit(
+                            semaphore,
+                            entity.async_request_call(
+                                _handle_entity_call(
+                                    hass, entity, func, data, call.context
+                                )
+                            ),
+                        )
+                    )
+                    for entity in call_entities
+                ]
+            )
+            assert not pending
 
-    return None
+            for task in done:
+                task.result()  # pop exception if have
+
+        tasks: list[asyncio.Task[None]] = []
+
+        for entity in entities:
+            if not entity.should_poll:
+                continue
+
+            # Context expires if the turn on commands took a long time.
+            # Set context again so it's there when we update
+            entity.async_set_context(call.context)
+            tasks.append(
+                asyncio.create_task(
+                    _async_limit(semaphore, entity.async_update_ha_state(True))
+                )
+            )
+
+        if tasks:
+            done, pending = await asyncio.wait(tasks)
+            assert not pending
+            for future in done:
+                future.result()  # pop exception if have
+    finally:
+        if platform is not None:
+            _async_record_entity_service_call(
+                hass, platform, call, len(entities), timer() - start
+            )
+
+
+@callback
+def _async_record_entity_service_call(
+    hass: HomeAssistant,
+    platform: EntityPlatform,
+    call: ServiceCall,
+    entity_count: int,
+    runtime: float,
+) -> None:
+    """Record how long a service call for the entities of a platform took."""
+    _LOGGER.debug(
+        "Called %s.%s for %s entities of %s in %.3f seconds",
+        call.domain,
+        call.service,
+        entity_count,
+        platform.platform_name,
+        runtime,
+    )
+    all_stats = async_get_entity_service_call_stats(hass)
+    if (stats := all_stats.get(platform.platform_name)) is None:
+        stats = all_stats[platform.platform_name] = EntityServiceCallStats()
+    stats.calls += 1
+    stats.entities += entity_count
+    stats.total_time += runtime
+    stats.max_time = max(stats.max_time, runtime)
+
+
+async def _async_limit(
+    semaphore: asyncio.Semaphore | None, coro: Coroutine[Any, Any, _T]
+) -> _T:
+    """Await a coroutine while holding the semaphore of the platform."""
+    if semaphore is None:
+        return await coro
+    async with semaphore:
+        return await coro
 
 
 async def _handle_entity_call(
@@ -32,7 +32,6 @@ from typing import (
     overload,
 )
 from urllib.parse import urlencode as urllib_urlencode
-import weakref
 
 from awesomeversion import AwesomeVersion
 import jinja2
@@ -153,6 +152,14 @@ CACHED_TEMPLATE_NO_COLLECT_LRU: MutableMapping[State, TemplateState] = LRU(
 )
 ENTITY_COUNT_GROWTH_FACTOR = 1.2
 
+#
+# COMPILED_TEMPLATE_CODE_SIZE is the number of distinct template sources
+# of which the compiled code is kept. The code is shared by all templates
+# with the same source, so a template which is instantiated by many
+# blueprint automations is only compiled once.
+#
+COMPILED_TEMPLATE_CODE_SIZE = 2048
+
 ORJSON_PASSTHROUGH_OPTIONS = (
     orjson.OPT_PASSTHROUGH_DATACLASS | orjson.OPT_PASSTHROUGH_DATETIME
 )
@@ -2302,6 +2309,47 @@ class HassLoader(jinja2.BaseLoader):
         return self._sources[template], template, lambda: cur_reload == self._reload
 
 
+class TemplateCodeCache:
+    """Bounded cache of compiled template code with hit and miss counters.
+
+    The cache is keyed by the template source and the flavor of the
+    environment compiling it and is shared by all environments.
+    """
+
+    __slots__ = ("_code", "hits", "misses")
+
+    def __init__(self, size: int) -> None:
+        """Initialize the cache."""
+        self._code: MutableMapping[tuple[str, str], CodeType] = LRU(size)
+        self.hits = 0
+        self.misses = 0
+
+    def __len__(self) -> int:
+        """Return the number of cached templates."""
+        return len(self._code)
+
+    def get(self, source: str, flavor: str) -> CodeType | None:
+        """Return the compiled code of a template source."""
+        if (code := self._code.get((source, flavor))) is None:
+            self.misses += 1
+        else:
+            self.hits += 1
+        return code
+
+    def set(self, source: str, flavor: str, code: CodeType) -> None:
+        """Store the compiled code of a template source."""
+        self._code[(source, flavor)] = code
+
+    def clear(self) -> None:
+        """Clear the cache and reset the counters."""
+        self._code.clear()
+        self.hits = 0
+        self.misses = 0
+
+
+TEMPLATE_CODE_CACHE = TemplateCodeCache(COMPILED_TEMPLATE_CODE_SIZE)
+
+
 class TemplateEnvironment(ImmutableSandboxedEnvironment):
     """The Home Assistant template environment."""
 
@@ -2315,9 +2363,16 @@ class TemplateEnvironment(ImmutableSandboxedEnvironment):
         """Initialise template environment."""
         super().__init__(undefined=make_logging_undefined(strict, log_fn))
         self.hass = hass
-        self.template_cache: weakref.WeakValueDictionary[
-            str | jinja2.nodes.Template, CodeType | str | None
-        ] = weakref.WeakValueDictionary()
+        # Environments of the same flavor compile a source to the same code
+        self.flavor: str
+        if hass is None:
+            self.flavor = "no_hass"
+        elif limited:
+            self.flavor = "limited"
+        elif strict:
+            self.flavor = "strict"
+        else:
+            self.flavor = "normal"
         self.add_extension("jinja2.ext.loopcontrols")
         self.filters["round"] = forgiving_round
         self.filters["multiply"] = multiply
@@ -2601,10 +2656,13 @@ class TemplateEnvironment(ImmutableSandboxedEnvironment):
                 defer_init,
             )
 
-        if (cached := self.template_cache.get(source)) is None:
-            cached = self.template_cache[source] = super().compile(source)
+        if isinstance(source, str):
+            if (code := TEMPLATE_CODE_CACHE.get(source, self.flavor)) is None:
+                code = super().compile(source)
+                TEMPLATE_CODE_CACHE.set(source, self.flavor, code)
+            return code
 
-        return cached
+        return super().compile(source)  # type: ignore[no-any-return]
 
 
 _NO_HASS_ENV = TemplateEnvironment(None)
@@ -8,12 +8,15 @@ from __future__ import annotations
 import asyncio
 from collections.abc import Callable, Iterable
 from contextlib import suppress
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 import functools as ft
 import importlib
+from itertools import islice
 import logging
+import os
 import pathlib
 import sys
+from timeit import default_timer as timer
 from types import ModuleType
 from typing import TYPE_CHECKING, Any, Literal, Protocol, TypedDict, TypeVar, cast
 
@@ -46,10 +49,12 @@ _CallableT = TypeVar("_CallableT", bound=Callable[..., Any])
 _LOGGER = logging.getLogger(__name__)
 
 DATA_COMPONENTS = "components"
+DATA_IMPORT_PROFILE = "integration_import_profile"
 DATA_INTEGRATIONS = "integrations"
 DATA_CUSTOM_COMPONENTS = "custom_components"
 PACKAGE_CUSTOM_COMPONENTS = "custom_components"
 PACKAGE_BUILTIN = "homeassistant.components"
+FIRST_PARTY_PACKAGES = ("homeassistant", PACKAGE_CUSTOM_COMPONENTS)
 CUSTOM_WARNING = (
     "We found a custom integration %s which has not "
     "been tested by Home Assistant. This component might "
@@ -131,6 +136,36 @@ class HomeKitDiscoveredIntegration:
     always_discover: bool
 
 
+@dataclass(slots=True)
+class ImportProfile:
+    """Time and memory spent importing the modules of an integration.
+
+    The modules loaded as a side effect of an import are attributed to the
+    integration, which is approximate when imports run concurrently.
+    """
+
+    modules: dict[str, float] = field(default_factory=dict)
+    loop_seconds: float = 0
+    executor_seconds: float = 0
+    first_party_modules: int = 0
+    requirement_modules: int = 0
+    requirements: set[str] = field(default_factory=set)
+    rss_delta: int | None = None
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return a dictionary version of the profile."""
+        return {
+            "modules": self.modules,
+            "seconds": self.loop_seconds + self.executor_seconds,
+            "loop_seconds": self.loop_seconds,
+            "executor_seconds": self.executor_seconds,
+            "first_party_modules": self.first_party_modules,
+            "requirement_modules": self.requirement_modules,
+            "requirements": sorted(self.requirements),
+            "rss_delta": self.rss_delta,
+        }
+
+
 class Manifest(TypedDict, total=False):
     """Integration manifest.
 
@@ -813,7 +848,7 @@ class Integration:
 
         try:
             cache[self.domain] = cast(
-                ComponentProtocol, importlib.import_module(self.pkg_path)
+                ComponentProtocol, self._import_module(self.pkg_path)
             )
         except ImportError:
             raise
@@ -848,15 +883,110 @@ class Integration:
 
         return cache[full_name]
 
+    def import_modules(self, platform_names: Iterable[str]) -> None:
+        """Import the component and the platforms it has of the given names.
+
+        This is meant to be called from an executor thread before the
+        integration is set up. Import errors are ignored, they are raised
+        again when the modules are imported for the setup.
+        """
+        cache: dict[str, ModuleType] = self.hass.data[DATA_COMPONENTS]
+        try:
+            component = cache.get(self.domain) or self._import_module(self.pkg_path)
+        except Exception as err:  # pylint: disable=broad-except
+            _LOGGER.debug("Unable to preload component %s: %s", self.pkg_path, err)
+            return
+
+        if not (paths := getattr(component, "__path__", None)):
+            return
+        try:
+            files = set(os.listdir(paths[0]))
+        except OSError:
+            return
+
+        for platform_name in platform_names:
+            if f"{platform_name}.py" not in files and platform_name not in files:
+                continue
+            try:
+                self._import_module(f"{self.pkg_path}.{platform_name}")
+            except Exception as err:  # pylint: disable=broad-except
+                _LOGGER.debug(
+                    "Unable to preload platform %s.%s: %s",
+                    self.pkg_path,
+                    platform_name,
+                    err,
+                )
+
     def _import_platform(self, platform_name: str) -> ModuleType:
         """Import the platform."""
-        return importlib.import_module(f"{self.pkg_path}.{platform_name}")
+        return self._import_module(f"{self.pkg_path}.{platform_name}")
+
+    def _import_module(self, name: str) -> ModuleType:
+        """Import a module and record it in the import profile."""
+        if name in sys.modules:
+            return importlib.import_module(name)
+
+        loaded_modules = len(sys.modules)
+        rss = _get_rss()
+        start = timer()
+        try:
+            return importlib.import_module(name)
+        finally:
+            self._record_import(name, timer() - start, loaded_modules, rss)
+
+    def _record_import(
+        self, name: str, seconds: float, loaded_modules: int, rss: int | None
+    ) -> None:
+        """Record an import in the import profile of the integration."""
+        profiles: dict[str, ImportProfile] = self.hass.data.setdefault(
+            DATA_IMPORT_PROFILE, {}
+        )
+        if (profile := profiles.get(self.domain)) is None:
+            profile = profiles[self.domain] = ImportProfile()
+
+        profile.modules[name] = seconds
+        if _in_event_loop():
+            profile.loop_seconds += seconds
+        else:
+            profile.executor_seconds += seconds
+
+        # Modules are added to sys.modules in import order, the new ones are last
+        new_modules = max(len(sys.modules) - loaded_modules, 0)
+        with suppress(RuntimeError):  # sys.modules changed by another thread
+            for module in islice(reversed(sys.modules), new_modules):
+                package = module.partition(".")[0]
+                if package in FIRST_PARTY_PACKAGES:
+                    profile.first_party_modules += 1
+                elif package not in sys.stdlib_module_names:
+                    profile.requirement_modules += 1
+                    profile.requirements.add(package)
+
+        if rss is not None and (new_rss := _get_rss()) is not None:
+            profile.rss_delta = (profile.rss_delta or 0) + new_rss - rss
 
     def __repr__(self) -> str:
         """Text representation of class."""
         return f"<Integration {self.domain}: {self.pkg_path}>"
 
 
+def _in_event_loop() -> bool:
+    """Return if called from a thread running an event loop."""
+    try:
+        asyncio.get_running_loop()
+    except RuntimeError:
+        return False
+    return True
+
+
+def _get_rss() -> int | None:
+    """Return the resident set size of the process in bytes if available."""
+    try:
+        with open("/proc/self/statm", encoding="ascii") as statm:
+            return int(statm.read().split()[1]) * os.sysconf("SC_PAGE_SIZE")
+    except (OSError, ValueError, IndexError, AttributeError):
+        return None
+
+
 def _resolve_integrations_from_root(
     hass: HomeAssistant, root_module: ModuleType, domains: list[str]
 ) -> dict[str, Integration]:
@@ -6,19 +6,22 @@ import asyncio
 import collections
 from collections.abc import Callable
 from contextlib import suppress
+from datetime import timedelta
 import json
 import logging
+import os
 from timeit import default_timer as timer
 from typing import TypeVar
 
 from homeassistant import core
-from homeassistant.const import EVENT_STATE_CHANGED
+from homeassistant.const import EVENT_STATE_CHANGED, MATCH_ALL
 from homeassistant.helpers.entityfilter import convert_include_exclude_filter
 from homeassistant.helpers.event import (
     async_track_state_change,
     async_track_state_change_event,
 )
 from homeassistant.helpers.json import JSON_DUMP, JSONEncoder
+from homeassistant.util import dt as dt_util
 
 # mypy: allow-untyped-calls, allow-untyped-defs, no-check-untyped-defs
 # mypy: no-warn-return-any
@@ -120,6 +123,38 @@ async def fire_events_with_filter(hass):
     return timer() - start
 
 
+@benchmark
+async def fire_events_batched(hass):
+    """Fire 100k events to a batched listener and a MATCH_ALL listener."""
+    count = 0
+    event_name = "benchmark_event"
+    events_to_fire = 10**5
+
+    @core.callback
+    def listener(events):
+        """Handle events."""
+        nonlocal count
+        count += len(events)
+
+    @core.callback
+    def match_all_listener(_):
+        """Handle event."""
+
+    hass.bus.async_listen_batched(event_name, listener)
+    hass.bus.async_listen(MATCH_ALL, match_all_listener, run_immediately=True)
+
+    start = timer()
+
+    for _ in range(events_to_fire):
+        hass.bus.async_fire(event_name)
+
+    await hass.async_block_till_done()
+
+    assert count == events_to_fire
+
+    return timer() - start
+
+
 @benchmark
 async def state_changed_helper(hass):
     """Run a million events through state changed helper with 1000 entities."""
@@ -314,6 +349,458 @@ async def json_serialize_states(hass):
     return timer() - start
 
 
+@benchmark
+async def mqtt_wildcard_subscriptions(hass):
+    """Match 100k topics against 10k MQTT wildcard subscriptions."""
+    # pylint: disable-next=import-outside-toplevel
+    from homeassistant.components.mqtt.client import Subscription, TopicTrie
+
+    job = core.HassJob(lambda msg: None)
+    trie = TopicTrie()
+    for idx in range(10**4):
+        pattern = ("zigbee2mqtt/{}/+", "tasmota/{}/#", "+/{}/state")[idx % 3]
+        trie.add(Subscription(pattern.format(f"device_{idx}"), job))
+
+    topics = [
+        f"{prefix}/device_{idx}/{suffix}"
+        for idx in range(0, 10**4, 100)
+        for prefix, suffix in (
+            ("zigbee2mqtt", "availability"),
+            ("tasmota", "tele/SENSOR"),
+            ("shellies", "state"),
+            ("zigbee2mqtt", "unknown/level"),
+        )
+    ]
+    size = len(topics)
+
+    start = timer()
+
+    for i in range(10**5):
+        trie.matches(topics[i % size])
+
+    return timer() - start
+
+
+def _sensor_statistics_history(start):
+    """Create 5 minutes of history with 10 states each for 3000 sensors."""
+    attributes = {"state_class": "measurement", "unit_of_measurement": "°C"}
+    attributes_json = JSON_DUMP(attributes)
+    start_ts = start.timestamp()
+    return {
+        f"sensor.temperature_{idx}": [
+            (str(20 + (idx + offset) % 7 / 3), start_ts + offset * 30, attributes_json)
+            for offset in range(10)
+        ]
+        for idx in range(3000)
+    }
+
+
+@benchmark
+async def sensor_statistics_states(hass):
+    """Compile 5 minute statistics for 3000 sensors from states."""
+    # pylint: disable-next=import-outside-toplevel
+    from homeassistant.components.recorder.models import LazyState
+
+    # pylint: disable-next=import-outside-toplevel
+    from homeassistant.components.sensor import recorder as sensor_recorder
+
+    start = dt_util.utcnow()
+    end = start + timedelta(minutes=5)
+    row = collections.namedtuple("Row", ["state", "last_updated_ts", "attributes"])
+    history = _sensor_statistics_history(start)
+
+    start_time = timer()
+
+    for entity_id, rows in history.items():
+        attr_cache = {}
+        entity_history = [
+            LazyState(db_row, attr_cache, None, entity_id, db_row[0], db_row[1], False)
+            for db_row in map(row._make, rows)
+        ]
+        fstates = sensor_recorder._entity_history_to_float_and_state(entity_history)
+        _, fstates = sensor_recorder._normalize_states(hass, {}, fstates, entity_id)
+        max(fstate for fstate, _ in fstates)
+        min(fstate for fstate, _ in fstates)
+        sensor_recorder._time_weighted_average(fstates, start, end)
+
+    return timer() - start_time
+
+
+@benchmark
+async def sensor_statistics_columns(hass):
+    """Compile 5 minute statistics for 3000 sensors from columns."""
+    # pylint: disable-next=import-outside-toplevel
+    from homeassistant.components.sensor import recorder as sensor_recorder
+
+    start = dt_util.utcnow()
+    end = start + timedelta(minutes=5)
+    history = _sensor_statistics_history(start)
+    start_ts = start.timestamp()
+    end_ts = end.timestamp()
+
+    start_time = timer()
+
+    for entity_id, rows in history.items():
+        columns = tuple(zip(*rows))
+        values, timestamps, _, units = sensor_recorder._entity_columns_to_float_columns(
+            *columns
+        )
+        _, values = sensor_recorder._normalize_float_columns(
+            hass, {}, values, units.pop(), entity_id
+        )
+        max(values)
+        min(values)
+        sensor_recorder._time_weighted_average_columns(
+            values, timestamps, start_ts, end_ts
+        )
+
+    return timer() - start_time
+
+
+async def _recorder_state_writes(bulk: bool) -> float:
+    """Write 20000 state changes of 200 entities committing every 1000 changes.
+
+    The database is in-memory SQLite unless BENCHMARK_RECORDER_DB_URL is set,
+    for example to a MariaDB or PostgreSQL database running in a container.
+    """
+    # pylint: disable-next=import-outside-toplevel
+    from sqlalchemy import create_engine
+    from sqlalchemy.orm import Session
+
+    # pylint: disable-next=import-outside-toplevel
+    from homeassistant.components.recorder.db_schema import (
+        Base,
+        States,
+        StatesMeta,
+        StatesRow,
+    )
+
+    # pylint: disable-next=import-outside-toplevel
+    from homeassistant.components.recorder.table_managers.states import StatesManager
+
+    engine = create_engine(os.environ.get("BENCHMARK_RECORDER_DB_URL", "sqlite://"))
+    Base.metadata.drop_all(engine)
+    Base.metadata.create_all(engine)
+    entity_ids = [f"sensor.benchmark_{idx}" for idx in range(200)]
+    with Session(engine) as session:
+        metadata_ids = {}
+        for entity_id in entity_ids:
+            states_meta = StatesMeta(entity_id=entity_id)
+            session.add(states_meta)
+            session.flush()
+            metadata_ids[entity_id] = states_meta.metadata_id
+        session.commit()
+
+    now = dt_util.utcnow()
+    events = [
+        core.Event(
+            EVENT_STATE_CHANGED,
+            {
+                "entity_id": entity_id,
+                "new_state": core.State(
+                    entity_id, str(idx), {}, now + timedelta(seconds=idx)
+                ),
+            },
+        )
+        for idx in range(100)
+        for entity_id in entity_ids
+    ]
+    states_manager = StatesManager()
+
+    start = timer()
+
+    with Session(engine, expire_on_commit=False) as session:
+        for idx, event in enumerate(events, 1):
+            entity_id = event.data["entity_id"]
+            dbstate = StatesRow(event) if bulk else States.from_event(event)
+            if old_state := states_manager.pop_pending(entity_id):
+                dbstate.old_state = old_state
+            elif old_state_id := states_manager.pop_committed(entity_id):
+                dbstate.old_state_id = old_state_id
+            states_manager.add_pending(entity_id, dbstate)
+            dbstate.entity_id = None
+            dbstate.metadata_id = metadata_ids[entity_id]
+            if bulk:
+                states_manager.add_pending_row(dbstate)
+            else:
+                session.add(dbstate)
+            if idx % 1000 == 0:
+                states_manager.insert_pending_rows(session)
+                session.commit()
+                states_manager.post_commit_pending()
+
+    runtime = timer() - start
+    engine.dispose()
+    return runtime
+
+
+@benchmark
+async def recorder_state_writes_orm(hass):
+    """Write state changes to the database with the ORM."""
+    return await _recorder_state_writes(False)
+
+
+@benchmark
+async def recorder_state_writes_bulk(hass):
+    """Write state changes to the database with bulk inserts."""
+    return await _recorder_state_writes(True)
+
+
+def _decode_shared_attrs(compress: bool) -> float:
+    """Decode the shared attributes of 3000 entities 100 times.
+
+    Prints the size of the shared attributes to compare the size with
+    the decode time of the plain and compressed encoding.
+    """
+    # pylint: disable-next=import-outside-toplevel
+    from homeassistant.components.recorder.models import (
+        STATE_ATTRIBUTES_SQL_KEYS,
+        compress_shared_json,
+    )
+
+    # pylint: disable-next=import-outside-toplevel
+    from homeassistant.components.recorder.models.state_attributes import (
+        decode_attributes_from_source,
+    )
+
+    sources = []
+    for idx in range(3000):
+        attributes = (
+            {
+                "state_class": "measurement",
+                "unit_of_measurement": "°C",
+                "device_class": "temperature",
+                "friendly_name": f"Room {idx} temperature",
+            },
+            {
+                "options": [f"Preset {option}" for option in range(idx % 20)],
+                "device_class": "enum",
+                "icon": "mdi:format-list-bulleted",
+                "friendly_name": f"Room {idx} preset",
+            },
+            {
+                "supported_color_modes": ["color_temp", "hs"],
+                "color_mode": "color_temp",
+                "brightness": idx % 255,
+                "color_temp_kelvin": 2700,
+                "hs_color": [30.0, 60.0],
+                "rgb_color": [255, 166, 87],
+                "xy_color": [0.526, 0.387],
+                "min_color_temp_kelvin": 2000,
+                "max_color_temp_kelvin": 6535,
+                "friendly_name": f"Room {idx} light",
+                "supported_features": 44,
+            },
+        )[idx % 3]
+        source = JSON_DUMP(attributes)
+        if compress:
+            source = compress_shared_json(source, STATE_ATTRIBUTES_SQL_KEYS)
+        sources.append(source)
+    print("Size of the shared attributes:", sum(map(len, sources)), "bytes")
+
+    start = timer()
+
+    for _ in range(100):
+        attr_cache: dict = {}
+        for source in sources:
+            decode_attributes_from_source(source, attr_cache)
+
+    return timer() - start
+
+
+@benchmark
+async def shared_attrs_decode_plain(hass):
+    """Decode shared attributes stored as plain JSON."""
+    return _decode_shared_attrs(False)
+
+
+@benchmark
+async def shared_attrs_decode_compressed(hass):
+    """Decode shared attributes stored compressed."""
+    return _decode_shared_attrs(True)
+
+
+def _logbook_entities_query(days: int, context_rows: bool) -> float:
+    """Query the logbook of 5 lights switched by automations 10 times.
+
+    A week of history of 20 lights switched every 30 minutes by an
+    automation and 100 sensors updated every 10 minutes is in the
+    in-memory SQLite database.
+    """
+    # pylint: disable-next=import-outside-toplevel
+    from sqlalchemy import create_engine, insert
+    from sqlalchemy.orm import Session
+
+    # pylint: disable-next=import-outside-toplevel
+    from homeassistant.components.logbook.queries import statement_for_request
+
+    # pylint: disable-next=import-outside-toplevel
+    from homeassistant.components.recorder.db_schema import (
+        Base,
+        Events,
+        EventTypes,
+        States,
+        StatesMeta,
+    )
+
+    # pylint: disable-next=import-outside-toplevel
+    from homeassistant.util.ulid import ulid_at_time, ulid_to_bytes
+
+    engine = create_engine("sqlite://")
+    Base.metadata.create_all(engine)
+    lights = [f"light.benchmark_{idx}" for idx in range(20)]
+    sensors = [f"sensor.benchmark_{idx}" for idx in range(100)]
+    end = dt_util.utcnow().timestamp()
+    start = end - timedelta(days=7).total_seconds()
+    with Session(engine) as session:
+        metadata_ids = {}
+        for entity_id in (*lights, *sensors):
+            states_meta = StatesMeta(entity_id=entity_id)
+            session.add(states_meta)
+            session.flush()
+            metadata_ids[entity_id] = states_meta.metadata_id
+        event_type_ids = {}
+        for event_type in ("automation_triggered", "call_service"):
+            event_types = EventTypes(event_type=event_type)
+            session.add(event_types)
+            session.flush()
+            event_type_ids[event_type] = event_types.event_type_id
+        events = []
+        states = []
+        for step in range(7 * 24 * 6):
+            time_ts = start + step * 600
+            for entity_id in sensors:
+                states.append(
+                    {
+                        "metadata_id": metadata_ids[entity_id],
+                        "state": str(step),
+                        "last_updated_ts": time_ts,
+                        "context_id_bin": ulid_to_bytes(ulid_at_time(time_ts)),
+                    }
+                )
+            if step % 3:
+                continue
+            for entity_id in lights:
+                context_id_bin = ulid_to_bytes(ulid_at_time(time_ts))
+                for event_type in ("automation_triggered", "call_service"):
+                    events.append(
+                        {
+                            "event_type_id": event_type_ids[event_type],
+                            "time_fired_ts": time_ts,
+                            "context_id_bin": context_id_bin,
+                        }
+                    )
+                states.append(
+                    {
+                        "metadata_id": metadata_ids[entity_id],
+                        "state": "on" if step % 2 else "off",
+                        "last_updated_ts": time_ts,
+                        "context_id_bin": context_id_bin,
+                    }
+                )
+        session.execute(insert(Events), events)
+        session.execute(insert(States), states)
+        session.commit()
+
+    start_time = timer()
+
+    with Session(engine) as session:
+        for _ in range(10):
+            stmt = statement_for_request(
+                dt_util.utc_from_timestamp(end - timedelta(days=days).total_seconds()),
+                dt_util.utc_from_timestamp(end),
+                tuple(event_type_ids.values()),
+                lights[:5],
+                [metadata_ids[entity_id] for entity_id in lights[:5]],
+                context_rows=context_rows,
+            )
+            session.execute(stmt).all()
+
+    runtime = timer() - start_time
+    engine.dispose()
+    return runtime
+
+
+@benchmark
+async def logbook_entities_24h_context_rows(hass):
+    """Query a day of logbook entities with the rows of their contexts."""
+    return _logbook_entities_query(1, True)
+
+
+@benchmark
+async def logbook_entities_24h_context_index(hass):
+    """Query a day of logbook entities for the context index."""
+    return _logbook_entities_query(1, False)
+
+
+@benchmark
+async def logbook_entities_7d_context_rows(hass):
+    """Query a week of logbook entities with the rows of their contexts."""
+    return _logbook_entities_query(7, True)
+
+
+@benchmark
+async def logbook_entities_7d_context_index(hass):
+    """Query a week of logbook entities for the context index."""
+    return _logbook_entities_query(7, False)
+
+
+@benchmark
+async def entity_write_ha_state(hass):
+    """Write 100k states of a power sensor of a device."""
+    # pylint: disable-next=import-outside-toplevel
+    from homeassistant.components.sensor import (
+        SensorDeviceClass,
+        SensorEntity,
+        SensorStateClass,
+    )
+
+    # pylint: disable-next=import-outside-toplevel
+    from homeassistant.helpers import device_registry as dr, entity_registry as er
+
+    # pylint: disable-next=import-outside-toplevel
+    from homeassistant.helpers.entity_platform import EntityPlatform
+
+    class PowerSensor(SensorEntity):
+        """Power sensor of a device."""
+
+        _attr_has_entity_name = True
+        _attr_name = "Power"
+        _attr_device_class = SensorDeviceClass.POWER
+        _attr_state_class = SensorStateClass.MEASUREMENT
+        _attr_native_unit_of_measurement = "W"
+        _attr_should_poll = False
+
+    platform = EntityPlatform(
+        hass=hass,
+        logger=logging.getLogger(__name__),
+        domain="sensor",
+        platform_name="benchmark",
+        platform=None,
+        scan_interval=timedelta(seconds=30),
+        entity_namespace=None,
+    )
+    entity = PowerSensor()
+    entity.hass = hass
+    entity.platform = platform
+    entity.entity_id = "sensor.meter_power"
+    entity.device_entry = dr.DeviceEntry(name="Meter")
+    entity.registry_entry = er.RegistryEntry(
+        entity_id=entity.entity_id,
+        unique_id="meter_power",
+        platform="benchmark",
+        device_id=entity.device_entry.id,
+    )
+
+    start = timer()
+
+    for value in range(100000):
+        entity._attr_native_value = value
+        entity.async_write_ha_state()
+
+    return timer() - start
+
+
 def _create_state_changed_event_from_old_new(
     entity_id, event_time_fired, old_state, new_state
 ):
@@ -0,0 +1,196 @@
+"""Script to profile the cold import of integrations."""
+from __future__ import annotations
+
+import argparse
+from dataclasses import dataclass, field
+import json
+import subprocess
+import sys
+from typing import Any
+
+from homeassistant.loader import FIRST_PARTY_PACKAGES, PACKAGE_BUILTIN
+
+# mypy: allow-untyped-calls, allow-untyped-defs
+
+# The modules every integration needs are imported before the marker
+# so their cost is not attributed to the profiled integration.
+IMPORT_MARKER = "startup_profile: import"
+RSS_MARKER = "startup_profile: rss"
+
+PROFILE_CODE = f"""
+import sys
+
+import homeassistant.core, homeassistant.helpers.entity_platform
+
+
+def rss():
+    try:
+        with open("/proc/self/statm", encoding="ascii") as statm:
+            return int(statm.read().split()[1]) * __import__("os").sysconf("SC_PAGE_SIZE")
+    except (OSError, ValueError, IndexError, AttributeError):
+        return -1
+
+
+before = rss()
+print({IMPORT_MARKER!r}, flush=True, file=sys.stderr)
+__import__(sys.argv[1])
+print({RSS_MARKER!r}, before, rss(), flush=True, file=sys.stderr)
+"""
+
+
+@dataclass(slots=True)
+class ModuleImport:
+    """Import time of a module as reported by -X importtime."""
+
+    name: str
+    self_seconds: float
+    cumulative_seconds: float
+
+
+@dataclass(slots=True)
+class ImportProfile:
+    """Cold import profile of an integration module."""
+
+    module: str
+    modules: list[ModuleImport] = field(default_factory=list)
+    rss_delta: int | None = None
+    error: str | None = None
+
+    def seconds(self, kind: str | None = None) -> float:
+        """Return the time spent importing modules of a kind or all modules."""
+        return sum(
+            module.self_seconds
+            for module in self.modules
+            if kind is None or module_kind(module.name) == kind
+        )
+
+    def as_dict(self, limit: int) -> dict[str, Any]:
+        """Return a dictionary version of the profile."""
+        return {
+            "module": self.module,
+            "error": self.error,
+            "seconds": self.seconds(),
+            "first_party_seconds": self.seconds("first_party"),
+            "requirement_seconds": self.seconds("requirement"),
+            "stdlib_seconds": self.seconds("stdlib"),
+            "rss_delta": self.rss_delta,
+            "slowest_modules": [
+                {
+                    "module": module.name,
+                    "kind": module_kind(module.name),
+                    "self_seconds": module.self_seconds,
+                    "cumulative_seconds": module.cumulative_seconds,
+                }
+                for module in sorted(
+                    self.modules, key=lambda module: module.self_seconds, reverse=True
+                )[:limit]
+            ],
+        }
+
+
+def run(args):
+    """Handle startup profile commandline script."""
+    parser = argparse.ArgumentParser(
+        description="Profile the cold import of integrations or their platforms."
+    )
+    parser.add_argument("--script", choices=["startup_profile"])
+    parser.add_argument(
+        "modules",
+        nargs="+",
+        metavar="integration",
+        help="Integration domain or platform, for example hue or hue.light",
+    )
+    parser.add_argument(
+        "--limit", type=int, default=10, help="Number of slowest modules to show"
+    )
+    parser.add_argument("--json", action="store_true", help="Output JSON")
+
+    args = parser.parse_args(args)
+
+    profiles = sorted(
+        (profile_import(f"{PACKAGE_BUILTIN}.{module}") for module in args.modules),
+        key=lambda profile: profile.seconds(),
+        reverse=True,
+    )
+
+    if args.json:
+        print(json.dumps([profile.as_dict(args.limit) for profile in profiles]))
+        return 0
+
+    for profile in profiles:
+        print_profile(profile.as_dict(args.limit))
+
+    return 0 if all(profile.error is None for profile in profiles) else 1
+
+
+def profile_import(module: str) -> ImportProfile:
+    """Import a module in a new interpreter and return its import profile."""
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", PROFILE_CODE, module],
+        capture_output=True,
+        check=False,
+        text=True,
+    )
+    profile = parse_import_profile(module, result.stderr)
+    if result.returncode != 0:
+        profile.error = result.stderr.strip().rpartition("\n")[-1]
+    return profile
+
+
+def parse_import_profile(module: str, output: str) -> ImportProfile:
+    """Parse the -X importtime output of the profile code."""
+    profile = ImportProfile(module)
+    lines = iter(output.splitlines())
+    for line in lines:
+        if line == IMPORT_MARKER:
+            break
+
+    for line in lines:
+        if line.startswith(RSS_MARKER):
+            before, after = (int(rss) for rss in line[len(RSS_MARKER) :].split())
+            if before >= 0 and after >= 0:
+                profile.rss_delta = after - before
+            continue
+        if not line.startswith("import time:"):
+            continue
+        self_us, cumulative_us, name = line[len("import time:") :].split("|")
+        if not self_us.strip().isdigit():
+            # Header line
+            continue
+        profile.modules.append(
+            ModuleImport(
+                name.strip(), int(self_us) / 1000000, int(cumulative_us) / 1000000
+            )
+        )
+
+    return profile
+
+
+def module_kind(name: str) -> str:
+    """Return if a module is first party, a requirement or in the stdlib."""
+    package = name.partition(".")[0]
+    if package in FIRST_PARTY_PACKAGES:
+        return "first_party"
+    if package in sys.stdlib_module_names:
+        return "stdlib"
+    return "requirement"
+
+
+def print_profile(profile: dict[str, Any]) -> None:
+    """Print an import profile."""
+    print(f"{profile['module']}: {profile['seconds']:.3f}s")
+    if profile["error"]:
+        print(f"  Import failed: {profile['error']}")
+    print(
+        f"  first party {profile['first_party_seconds']:.3f}s,"
+        f" requirements {profile['requirement_seconds']:.3f}s,"
+        f" stdlib {profile['stdlib_seconds']:.3f}s"
+    )
+    if profile["rss_delta"] is not None:
+        print(f"  RSS delta {profile['rss_delta'] / 1048576:.1f} MiB")
+    for module in profile["slowest_modules"]:
+        print(
+            f"  {module['self_seconds']:.4f}s"
+            f" ({module['cumulative_seconds']:.4f}s cumulative)"
+            f" {module['module']} [{module['kind']}]"
+        )
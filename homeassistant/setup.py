@@ -54,6 +54,10 @@ DATA_SETUP_STARTED = "setup_started"
 # setting up a component.
 DATA_SETUP_TIME = "setup_time"
 
+# DATA_SETUP_STAGES is a dict [str, dict[str, tuple[float, float]]], indicating
+# the timer values when each setup stage of a component started and finished.
+DATA_SETUP_STAGES = "setup_stages"
+
 DATA_DEPS_REQS = "deps_reqs_processed"
 
 SLOW_SETUP_WARNING = 10
@@ -212,14 +216,16 @@ async def _async_setup_component(
     # Some integrations fail on import because they call functions incorrectly.
     # So we do it before validating config to catch these errors.
     try:
-        component = integration.get_component()
+        with async_setup_stage(hass, domain, "import"):
+            component = integration.get_component()
     except ImportError as err:
         log_error(f"Unable to import component: {err}", err)
         return False
 
-    processed_config = await conf_util.async_process_component_config(
-        hass, config, integration
-    )
+    with async_setup_stage(hass, domain, "config"):
+        processed_config = await conf_util.async_process_component_config(
+            hass, config, integration
+        )
 
     if processed_config is None:
         log_error("Invalid config.")
@@ -303,6 +309,7 @@ async def _async_setup_component(
             return False
         finally:
             end = timer()
+            _async_record_setup_stage(hass, domain, "setup", start, end)
             if warn_task:
                 warn_task.cancel()
         _LOGGER.info("Setup of domain %s took %.1f seconds", domain, end - start)
@@ -325,15 +332,16 @@ async def _async_setup_component(
         # call to avoid a deadlock when forwarding platforms
         hass.config.components.add(domain)
 
-        await asyncio.gather(
-            *(
-                asyncio.create_task(
-                    entry.async_setup(hass, integration=integration),
-                    name=f"config entry setup {entry.title} {entry.domain} {entry.entry_id}",
+        with async_setup_stage(hass, domain, "config_entries"):
+            await asyncio.gather(
+                *(
+                    asyncio.create_task(
+                        entry.async_setup(hass, integration=integration),
+                        name=f"config entry setup {entry.title} {entry.domain} {entry.entry_id}",
+                    )
+                    for entry in hass.config_entries.async_entries(domain)
                 )
-                for entry in hass.config_entries.async_entries(domain)
             )
-        )
 
     # Cleanup
     if domain in hass.data[DATA_SETUP]:
@@ -413,13 +421,16 @@ async def async_process_deps_reqs(
     elif integration.domain in processed:
         return
 
-    if failed_deps := await _async_process_dependencies(hass, config, integration):
+    with async_setup_stage(hass, integration.domain, "dependencies"):
+        failed_deps = await _async_process_dependencies(hass, config, integration)
+    if failed_deps:
         raise DependencyError(failed_deps)
 
-    async with hass.timeout.async_freeze(integration.domain):
-        await requirements.async_get_integration_with_requirements(
-            hass, integration.domain
-        )
+    with async_setup_stage(hass, integration.domain, "requirements"):
+        async with hass.timeout.async_freeze(integration.domain):
+            await requirements.async_get_integration_with_requirements(
+                hass, integration.domain
+            )
 
     processed.add(integration.domain)
 
@@ -522,3 +533,102 @@ def async_start_setup(
             setup_time[integration] += time_taken
         else:
             setup_time[integration] = time_taken
+
+
+@contextlib.contextmanager
+def async_setup_stage(
+    hass: core.HomeAssistant, domain: str, stage: str
+) -> Generator[None, None, None]:
+    """Keep track of when a setup stage of a component starts and finishes."""
+    start = timer()
+    try:
+        yield
+    finally:
+        _async_record_setup_stage(hass, domain, stage, start, timer())
+
+
+@core.callback
+def _async_record_setup_stage(
+    hass: core.HomeAssistant, domain: str, stage: str, start: float, end: float
+) -> None:
+    """Record the start and end of a setup stage of a component."""
+    stages: dict[str, dict[str, tuple[float, float]]] = hass.data.setdefault(
+        DATA_SETUP_STAGES, {}
+    )
+    stages.setdefault(domain, {})[stage] = (start, end)
+
+
+@core.callback
+def async_get_startup_profile(hass: core.HomeAssistant) -> dict[str, Any]:
+    """Return the setup stages and imports of the components and the critical path.
+
+    Times are in seconds relative to the start of the first recorded stage.
+    The critical path is the chain of components, each waiting on the
+    dependency which finished setting up last, which ends with the component
+    which finished setting up last.
+    """
+    stages: dict[str, dict[str, tuple[float, float]]] = hass.data.get(
+        DATA_SETUP_STAGES, {}
+    )
+    import_profiles: dict[str, loader.ImportProfile] = hass.data.get(
+        loader.DATA_IMPORT_PROFILE, {}
+    )
+    origin = min(
+        (
+            start
+            for domain_stages in stages.values()
+            for start, _ in domain_stages.values()
+        ),
+        default=0,
+    )
+    ends = {
+        domain: max(end for _, end in domain_stages.values())
+        for domain, domain_stages in stages.items()
+        if domain_stages
+    }
+
+    integrations: dict[str, dict[str, Any]] = {}
+    for domain in stages.keys() | import_profiles.keys():
+        integrations[domain] = {
+            "stages": {
+                stage: {"start": start - origin, "seconds": end - start}
+                for stage, (start, end) in stages.get(domain, {}).items()
+            },
+            "import": (
+                import_profile.as_dict()
+                if (import_profile := import_profiles.get(domain))
+                else None
+            ),
+        }
+
+    critical_path: list[str] = []
+    domain = max(ends, key=ends.__getitem__, default=None)
+    while domain is not None and domain not in critical_path:
+        critical_path.append(domain)
+        domain = _async_get_waited_on_dependency(hass, domain, stages[domain], ends)
+    critical_path.reverse()
+
+    return {"integrations": integrations, "critical_path": critical_path}
+
+
+@core.callback
+def _async_get_waited_on_dependency(
+    hass: core.HomeAssistant,
+    domain: str,
+    domain_stages: dict[str, tuple[float, float]],
+    ends: dict[str, float],
+) -> str | None:
+    """Return the dependency a component waited on the longest during setup."""
+    integrations: dict[str, loader.Integration | asyncio.Future[None]] = hass.data.get(
+        loader.DATA_INTEGRATIONS, {}
+    )
+    if not isinstance(
+        integration := integrations.get(domain), loader.Integration
+    ) or not (waited := domain_stages.get("dependencies")):
+        return None
+    dependencies = [
+        dep
+        for dep in (*integration.dependencies, *integration.after_dependencies)
+        if dep in ends and waited[0] <= ends[dep] <= waited[1]
+    ]
+    return max(dependencies, key=ends.__getitem__, default=None)
@@ -635,6 +635,10 @@ _ENTITY_MATCH: list[TypeHintMatch] = [
         function_name="context_recent_time",
         return_type="timedelta",
     ),
+    TypeHintMatch(
+        function_name="coalesce_state_writes",
+        return_type=["timedelta", None],
+    ),
     TypeHintMatch(
         function_name="entity_registry_enabled_default",
         return_type="bool",
@@ -171,6 +171,167 @@ async def test_history_during_period(
     assert sensor_test_history[2]["a"] == {"any": "attr"}
 
 
+async def test_history_during_period_chunked(
+    recorder_mock: Recorder, hass: HomeAssistant, hass_ws_client: WebSocketGenerator
+) -> None:
+    """Test history_during_period streams chunks when chunk_size is set."""
+    now = dt_util.utcnow()
+
+    await async_setup_component(hass, "history", {})
+    await async_setup_component(hass, "sensor", {})
+    await async_recorder_block_till_done(hass)
+    for state in range(150):
+        hass.states.async_set("sensor.one", state)
+        hass.states.async_set("sensor.two", state)
+    await async_wait_recording_done(hass)
+
+    client = await hass_ws_client()
+    await client.send_json(
+        {
+            "id": 1,
+            "type": "history/history_during_period",
+            # Long time ranges are fetched from the database in batches
+            "start_time": (now - timedelta(days=3)).isoformat(),
+            "entity_ids": ["sensor.one", "sensor.two"],
+            "minimal_response": True,
+            "no_attributes": True,
+            "chunk_size": 100,
+        }
+    )
+    response = await client.receive_json()
+    assert response["success"]
+    assert response["id"] == 1
+    assert response["result"] is None
+
+    messages = []
+    while True:
+        response = await client.receive_json()
+        assert response["id"] == 1
+        assert response["type"] == "event"
+        messages.append(response["event"])
+        if not response["event"].get("partial"):
+            break
+
+    assert [
+        {entity_id: len(states) for entity_id, states in message["states"].items()}
+        for message in messages
+    ] == [
+        {"sensor.one": 100},
+        {"sensor.one": 50},
+        {"sensor.two": 100},
+        {"sensor.two": 50},
+    ]
+    assert all(message["partial"] for message in messages[:-1])
+    assert [
+        state["s"]
+        for message in messages
+        for state in message["states"].get("sensor.one", [])
+    ] == [str(state) for state in range(150)]
+
+    # The stream is not a subscription once it is done
+    await client.send_json({"id": 2, "type": "unsubscribe_events", "subscription": 1})
+    response = await client.receive_json()
+    assert not response["success"]
+    assert response["error"]["code"] == "not_found"
+
+    await client.send_json(
+        {
+            "id": 3,
+            "type": "history/history_during_period",
+            "start_time": (now + timedelta(days=1)).isoformat(),
+            "entity_ids": ["sensor.one"],
+            "chunk_size": 100,
+        }
+    )
+    response = await client.receive_json()
+    assert response["success"]
+    assert response["id"] == 3
+    response = await client.receive_json()
+    assert response["id"] == 3
+    assert response["event"] == {"states": {}}
+
+    await client.send_json(
+        {
+            "id": 4,
+            "type": "history/history_during_period",
+            "start_time": now.isoformat(),
+            "entity_ids": ["sensor.one"],
+            "chunk_size": 99,
+        }
+    )
+    response = await client.receive_json()
+    assert not response["success"]
+    assert response["error"]["code"] == "invalid_format"
+
+
+@pytest.mark.parametrize("chunk_size", [None, 100])
+async def test_history_during_period_max_points(
+    recorder_mock: Recorder,
+    hass: HomeAssistant,
+    hass_ws_client: WebSocketGenerator,
+    chunk_size: int | None,
+) -> None:
+    """Test history_during_period downsamples numeric series with max_points."""
+    start = dt_util.utcnow()
+    end = start + timedelta(seconds=100)
+
+    await async_setup_component(hass, "history", {})
+    await async_setup_component(hass, "sensor", {})
+    await async_recorder_block_till_done(hass)
+    values = [(idx * 37) % 101 for idx in range(100)]
+    values[5] = 1000
+    values[60] = -1000
+    with freeze_time(start) as freezer:
+        for idx, value in enumerate(values):
+            freezer.move_to(start + timedelta(seconds=idx + 0.5))
+            hass.states.async_set("sensor.power", "unavailable" if idx == 50 else value)
+            hass.states.async_set("sensor.sparse", value if idx % 25 == 0 else 0)
+            await async_recorder_block_till_done(hass)
+    await async_wait_recording_done(hass)
+
+    client = await hass_ws_client()
+    message = {
+        "id": 1,
+        "type": "history/history_during_period",
+        "start_time": start.isoformat(),
+        "end_time": end.isoformat(),
+        "entity_ids": ["sensor.power", "sensor.sparse"],
+        "minimal_response": True,
+        "no_attributes": True,
+        "max_points": 20,
+    }
+    if chunk_size:
+        message["chunk_size"] = chunk_size
+    await client.send_json(message)
+    response = await client.receive_json()
+    assert response["success"]
+    history_states: dict[str, list[dict]] = {}
+    if not chunk_size:
+        history_states = response["result"]
+    else:
+        while True:
+            response = await client.receive_json()
+            for entity_id, states in response["event"]["states"].items():
+                assert len(states) <= chunk_size
+                history_states.setdefault(entity_id, []).extend(states)
+            if not response["event"].get("partial"):
+                break
+
+    power = [state["s"] for state in history_states["sensor.power"]]
+    # 5 buckets with at most 4 states, the unavailable state splits a bucket
+    assert len(power) <= 25
+    assert power[0] == str(values[0])
+    assert power[-1] == str(values[-1])
+    assert {"1000", "-1000", "unavailable"} <= set(power)
+    last_updated = [state["lu"] for state in history_states["sensor.power"]]
+    assert last_updated == sorted(last_updated)
+
+    # The sparse series has no more than 4 states in a bucket
+    assert [state["s"] for state in history_states["sensor.sparse"]] == [
+        str(value) for value in (0, values[25], 0, values[50], 0, values[75], 0)
+    ]
+
+
 async def test_history_during_period_impossible_conditions(
     recorder_mock: Recorder, hass: HomeAssistant, hass_ws_client: WebSocketGenerator
 ) -> None:
@@ -0,0 +1,118 @@
+"""Test the logbook context origin index."""
+from unittest.mock import patch
+
+from homeassistant.components.logbook import context_index
+from homeassistant.components.logbook.context_index import ContextOriginIndex
+from homeassistant.const import EVENT_CALL_SERVICE, EVENT_STATE_CHANGED
+from homeassistant.core import Context, Event, State
+
+
+def _state_changed_event(entity_id: str, context: Context) -> Event:
+    """Return a state changed event in a context."""
+    return Event(
+        EVENT_STATE_CHANGED,
+        {
+            "entity_id": entity_id,
+            "old_state": State(entity_id, "off", context=context),
+            "new_state": State(entity_id, "on", context=context),
+        },
+        context=context,
+    )
+
+
+def _index() -> ContextOriginIndex:
+    """Return an index which excludes the sensors and the excluded event."""
+    return ContextOriginIndex(
+        {"automation_triggered"},
+        lambda entity_id: not entity_id.startswith("sensor."),
+        {"excluded"},
+    )
+
+
+def test_index_external_events_and_service_calls() -> None:
+    """Test described events and service calls are indexed as they are fired."""
+    index = _index()
+    triggered = Event("automation_triggered", {"name": "Mock"})
+    call_service = Event(EVENT_CALL_SERVICE, {"domain": "light"})
+    index.async_index_event(triggered)
+    index.async_index_event(call_service)
+    # Later events in the context do not replace the origin
+    index.async_index_event(_state_changed_event("light.kitchen", triggered.context))
+
+    assert index.get(triggered.context.id).event_type == "automation_triggered"
+    assert index.get(call_service.context.id).event_type == EVENT_CALL_SERVICE
+    assert index.get(None) is None
+
+
+def test_index_promotes_shared_contexts() -> None:
+    """Test other events are only indexed once their context is shared."""
+    index = _index()
+    lonely = _state_changed_event("light.hallway", Context())
+    shared = _state_changed_event("light.kitchen", Context())
+    parent = Event("custom", context=Context())
+    index.async_index_event(lonely)
+    index.async_index_event(shared)
+    index.async_index_event(parent)
+    assert index.get(shared.context.id) is None
+
+    index.async_index_event(_state_changed_event("light.porch", shared.context))
+    index.async_index_event(
+        Event("child", context=Context(parent_id=parent.context.id))
+    )
+
+    assert index.get(lonely.context.id) is None
+    assert index.get(shared.context.id).entity_id == "light.kitchen"
+    assert index.get(parent.context.id).event_type == "custom"
+
+
+def test_index_skips_events_which_are_not_recorded() -> None:
+    """Test events which are not recorded are not indexed."""
+    index = _index()
+    excluded = Event("excluded")
+    sensor = Event(EVENT_CALL_SERVICE, {"entity_id": "sensor.outside"})
+    removed = Event(
+        EVENT_STATE_CHANGED, {"entity_id": "light.kitchen", "new_state": None}
+    )
+    for event in (excluded, sensor, removed):
+        index.async_index_event(event)
+        index.async_index_event(Event("child", context=event.context))
+        assert index.get(event.context.id) is None
+
+
+def test_index_evicts_oldest_origins() -> None:
+    """Test the coverage moves past the origins which are evicted."""
+    index = _index()
+    assert index.covers(index.covered_since)
+    assert not index.covers(index.covered_since - 1)
+    events = [Event(EVENT_CALL_SERVICE, {"domain": "light"}) for _ in range(3)]
+    with patch.object(context_index, "MAX_CONTEXT_ORIGINS", 2):
+        for event in events:
+            index.async_index_event(event)
+
+    assert index.get(events[0].context.id) is None
+    assert index.get(events[2].context.id) is not None
+    assert index.covered_since == events[0].time_fired.timestamp()
+
+
+def test_index_evicts_oldest_recent_events() -> None:
+    """Test the coverage moves past the recent events which are evicted."""
+    index = _index()
+    events = [
+        _state_changed_event(f"light.kitchen_{number}", Context())
+        for number in range(3)
+    ]
+    with patch.object(context_index, "MAX_RECENT_CONTEXTS", 2):
+        for event in events:
+            index.async_index_event(event)
+    assert index.covered_since == events[0].time_fired.timestamp()
+    assert not index.covers(events[0].time_fired.timestamp() - 1)
+
+    # The evicted event is not promoted when its context turns out to be shared
+    index.async_index_event(
+        _state_changed_event("light.hallway", Context(parent_id=events[0].context.id))
+    )
+    assert index.get(events[0].context.id) is None
+    index.async_index_event(
+        _state_changed_event("light.hallway", Context(parent_id=events[2].context.id))
+    )
+    assert index.get(events[2].context.id) is not None
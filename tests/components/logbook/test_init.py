@@ -15,6 +15,7 @@ from homeassistant.components.alexa.smart_home import EVENT_ALEXA_SMART_HOME
 from homeassistant.components.automation import EVENT_AUTOMATION_TRIGGERED
 from homeassistant.components.logbook.models import LazyEventPartialState
 from homeassistant.components.logbook.processor import EventProcessor
+from homeassistant.components.logbook.queries import statement_for_request
 from homeassistant.components.logbook.queries.common import PSEUDO_EVENT_STATE_CHANGED
 from homeassistant.components.recorder import Recorder
 from homeassistant.components.script import EVENT_SCRIPT_STARTED
@@ -2605,11 +2606,13 @@ async def test_get_events_invalid_filters(
     assert response["error"]["code"] == "invalid_format"
 
 
+@pytest.mark.parametrize("use_context_index", [False, True])
 async def test_get_events_with_device_ids(
     recorder_mock: Recorder,
     hass: HomeAssistant,
     hass_ws_client: WebSocketGenerator,
     device_registry: dr.DeviceRegistry,
+    use_context_index: bool,
 ) -> None:
     """Test logbook get_events for device ids."""
     now = dt_util.utcnow()
@@ -2619,6 +2622,8 @@ async def test_get_events_with_device_ids(
             for comp in ("homeassistant", "logbook")
         ]
     )
+    if use_context_index:
+        hass.data[logbook.DOMAIN].context_index.covered_since = 0
 
     entry = MockConfigEntry(domain="test", data={"first": True}, options=None)
     entry.add_to_hass(hass)
@@ -2746,8 +2751,12 @@ async def test_get_events_with_device_ids(
     assert isinstance(results[3]["when"], float)
 
 
+@pytest.mark.parametrize("use_context_index", [False, True])
 async def test_logbook_select_entities_context_id(
-    recorder_mock: Recorder, hass: HomeAssistant, hass_client: ClientSessionGenerator
+    recorder_mock: Recorder,
+    hass: HomeAssistant,
+    hass_client: ClientSessionGenerator,
+    use_context_index: bool,
 ) -> None:
     """Test the logbook view with end_time and entity with automations and scripts."""
     await asyncio.gather(
@@ -2756,6 +2765,9 @@ async def test_logbook_select_entities_context_id(
             for comp in ("homeassistant", "logbook", "automation", "script")
         ]
     )
+    if use_context_index:
+        # The context index covers the window when it started before the window
+        hass.data[logbook.DOMAIN].context_index.covered_since = 0
 
     await async_recorder_block_till_done(hass)
 
@@ -2849,10 +2861,19 @@ async def test_logbook_select_entities_context_id(
 
     # Test today entries with filter by end_time
     end_time = start + timedelta(hours=24)
-    response = await client.get(
-        f"/api/logbook/{start_date.isoformat()}?end_time={end_time}&entity={entity_id_test},{entity_id_second},{entity_id_third},light.switch"
-    )
+    with patch(
+        "homeassistant.components.logbook.processor.statement_for_request",
+        wraps=statement_for_request,
+    ) as statement_for_request_mock:
+        response = await client.get(
+            f"/api/logbook/{start_date.isoformat()}?end_time={end_time}&entity={entity_id_test},{entity_id_second},{entity_id_third},light.switch"
+        )
     assert response.status == HTTPStatus.OK
+    # The context rows are only selected without the context index
+    assert (
+        statement_for_request_mock.call_args.kwargs["context_rows"]
+        is not use_context_index
+    )
     json_dict = await response.json()
 
     assert json_dict[0]["entity_id"] == entity_id_test
@@ -6,13 +6,15 @@ from unittest.mock import ANY, patch
 
 from freezegun import freeze_time
 import pytest
+from sqlalchemy import func, select, update
 
 from homeassistant import core
 from homeassistant.components import logbook, recorder
 from homeassistant.components.automation import ATTR_SOURCE, EVENT_AUTOMATION_TRIGGERED
 from homeassistant.components.logbook import websocket_api
 from homeassistant.components.recorder import Recorder
-from homeassistant.components.recorder.util import get_instance
+from homeassistant.components.recorder.db_schema import Events, States
+from homeassistant.components.recorder.util import get_instance, session_scope
 from homeassistant.components.script import EVENT_SCRIPT_STARTED
 from homeassistant.components.websocket_api.const import TYPE_RESULT
 from homeassistant.const import (
@@ -359,6 +361,216 @@ async def test_get_events_entities_filtered_away(
     assert len(results) == 0
 
 
+@pytest.mark.parametrize("entity_ids", [None, ["light.kitchen", "light.porch"]])
+async def test_get_events_pages(
+    recorder_mock: Recorder,
+    hass: HomeAssistant,
+    hass_ws_client: WebSocketGenerator,
+    entity_ids: list[str] | None,
+) -> None:
+    """Test logbook get_events pages through the events newest first."""
+    now = dt_util.utcnow()
+    await asyncio.gather(
+        *[
+            async_setup_component(hass, comp, {})
+            for comp in ("homeassistant", "logbook")
+        ]
+    )
+    await async_recorder_block_till_done(hass)
+
+    hass.states.async_set("light.kitchen", STATE_OFF)
+    hass.states.async_set("light.porch", STATE_OFF)
+    await hass.async_block_till_done()
+    for state in (STATE_ON, STATE_OFF, STATE_ON):
+        hass.states.async_set("light.kitchen", state)
+        await hass.async_block_till_done()
+    # The rows fired at the same time are split across pages by their id
+    with freeze_time(dt_util.utcnow() + timedelta(seconds=1)):
+        for state in (STATE_ON, STATE_OFF, STATE_ON, STATE_OFF):
+            hass.states.async_set("light.porch", state)
+            await hass.async_block_till_done()
+    await async_wait_recording_done(hass)
+
+    client = await hass_ws_client()
+    base_msg = {
+        "type": "logbook/get_events",
+        "start_time": now.isoformat(),
+        "end_time": (now + timedelta(hours=1)).isoformat(),
+    }
+    if entity_ids:
+        base_msg["entity_ids"] = entity_ids
+    await client.send_json({"id": 1, **base_msg})
+    response = await client.receive_json()
+    assert response["success"]
+    all_events = response["result"]
+    assert len(all_events) == 7
+
+    pages = []
+    cursor = None
+    for msg_id in range(2, 7):
+        msg = {"id": msg_id, **base_msg, "limit": 2}
+        if cursor:
+            msg["cursor"] = cursor
+        await client.send_json(msg)
+        response = await client.receive_json()
+        assert response["success"]
+        pages.append(response["result"]["events"])
+        if (cursor := response["result"]["cursor"]) is None:
+            break
+
+    assert [len(page) for page in pages] == [2, 2, 2, 1]
+    assert [event for page in reversed(pages) for event in page] == all_events
+
+    await client.send_json({"id": 10, **base_msg, "limit": 3})
+    response = await client.receive_json()
+    assert response["success"]
+    assert response["result"]["events"] == all_events[-3:]
+
+
+async def test_get_events_pages_events_and_states_with_the_same_id(
+    recorder_mock: Recorder, hass: HomeAssistant, hass_ws_client: WebSocketGenerator
+) -> None:
+    """Test logbook get_events pages an event and a state sharing a time and an id."""
+    now = dt_util.utcnow()
+    await asyncio.gather(
+        *[
+            async_setup_component(hass, comp, {})
+            for comp in ("homeassistant", "logbook")
+        ]
+    )
+    await async_recorder_block_till_done(hass)
+
+    hass.states.async_set("light.kitchen", STATE_OFF)
+    await hass.async_block_till_done()
+    with freeze_time(dt_util.utcnow() + timedelta(seconds=1)):
+        hass.states.async_set("light.kitchen", STATE_ON)
+        hass.bus.async_fire(
+            logbook.EVENT_LOGBOOK_ENTRY,
+            {ATTR_NAME: "Kitchen", logbook.ATTR_MESSAGE: "is cooking"},
+        )
+        await hass.async_block_till_done()
+    await async_wait_recording_done(hass)
+
+    def _give_the_newest_rows_the_same_id() -> None:
+        with session_scope(hass=hass) as session:
+            session.execute(
+                update(States)
+                .where(
+                    States.state_id
+                    == select(func.max(States.state_id)).scalar_subquery()
+                )
+                .values(state_id=10000)
+            )
+            session.execute(
+                update(Events)
+                .where(
+                    Events.event_id
+                    == select(func.max(Events.event_id)).scalar_subquery()
+                )
+                .values(event_id=10000)
+            )
+
+    await recorder_mock.async_add_executor_job(_give_the_newest_rows_the_same_id)
+
+    client = await hass_ws_client()
+    base_msg = {
+        "type": "logbook/get_events",
+        "start_time": now.isoformat(),
+        "end_time": (now + timedelta(hours=1)).isoformat(),
+    }
+    await client.send_json({"id": 1, **base_msg})
+    response = await client.receive_json()
+    assert response["success"]
+    all_events = response["result"]
+    assert len(all_events) == 2
+
+    pages = []
+    cursor = None
+    for msg_id in range(2, 5):
+        msg = {"id": msg_id, **base_msg, "limit": 1}
+        if cursor:
+            msg["cursor"] = cursor
+        await client.send_json(msg)
+        response = await client.receive_json()
+        assert response["success"]
+        pages.append(response["result"]["events"])
+        if (cursor := response["result"]["cursor"]) is None:
+            break
+
+    assert [len(page) for page in pages] == [1, 1, 0]
+    assert [event for page in reversed(pages) for event in page] == all_events
+
+
+async def test_get_events_page_context_origin(
+    recorder_mock: Recorder, hass: HomeAssistant, hass_ws_client: WebSocketGenerator
+) -> None:
+    """Test logbook get_events pages describe contexts which originated before them."""
+    now = dt_util.utcnow()
+    await asyncio.gather(
+        *[
+            async_setup_component(hass, comp, {})
+            for comp in ("homeassistant", "logbook")
+        ]
+    )
+    await async_recorder_block_till_done(hass)
+
+    hass.states.async_set("switch.origin", STATE_OFF)
+    hass.states.async_set("light.kitchen", STATE_OFF)
+    await hass.async_block_till_done()
+    context = core.Context(id="01GTDGKBCH00GW0X276W5TEDDD")
+    hass.states.async_set("switch.origin", STATE_ON, context=context)
+    await hass.async_block_till_done()
+    hass.states.async_set("light.kitchen", STATE_ON, context=context)
+    await async_wait_recording_done(hass)
+
+    client = await hass_ws_client()
+    await client.send_json(
+        {
+            "id": 1,
+            "type": "logbook/get_events",
+            "start_time": now.isoformat(),
+            "limit": 1,
+        }
+    )
+    response = await client.receive_json()
+    assert response["success"]
+    assert response["result"]["events"] == [
+        {
+            "entity_id": "light.kitchen",
+            "state": "on",
+            "when": ANY,
+            "context_entity_id": "switch.origin",
+            "context_state": "on",
+        }
+    ]
+    assert response["result"]["cursor"] == {
+        "time_fired_ts": response["result"]["events"][0]["when"],
+        "row_id": ANY,
+        "is_state": True,
+    }
+
+
+async def test_get_events_cursor_without_limit(
+    recorder_mock: Recorder, hass: HomeAssistant, hass_ws_client: WebSocketGenerator
+) -> None:
+    """Test logbook get_events with a cursor and without a limit."""
+    await async_setup_component(hass, "logbook", {})
+    await async_recorder_block_till_done(hass)
+
+    client = await hass_ws_client()
+    await client.send_json(
+        {
+            "id": 1,
+            "type": "logbook/get_events",
+            "start_time": dt_util.utcnow().isoformat(),
+            "cursor": {"time_fired_ts": 0.0, "row_id": 1, "is_state": False},
+        }
+    )
+    response = await client.receive_json()
+    assert not response["success"]
+    assert response["error"]["code"] == "invalid_cursor"
+
+
 async def test_get_events_future_start_time(
     recorder_mock: Recorder, hass: HomeAssistant, hass_ws_client: WebSocketGenerator
 ) -> None:
@@ -1740,6 +1952,81 @@ async def test_subscribe_unsubscribe_logbook_stream_entities_past_only(
     ) == listeners_without_writes(init_listeners)
 
 
+@patch("homeassistant.components.logbook.websocket_api.EVENT_COALESCE_TIME", 0)
+async def test_subscribe_logbook_stream_with_limit(
+    recorder_mock: Recorder, hass: HomeAssistant, hass_ws_client: WebSocketGenerator
+) -> None:
+    """Test logbook stream with a limit only sends the newest page of the past."""
+    now = dt_util.utcnow()
+    await asyncio.gather(
+        *[
+            async_setup_component(hass, comp, {})
+            for comp in ("homeassistant", "logbook")
+        ]
+    )
+    await async_recorder_block_till_done(hass)
+
+    for state in (STATE_OFF, STATE_ON, STATE_OFF, STATE_ON):
+        hass.states.async_set("light.small", state)
+        await hass.async_block_till_done()
+    await async_wait_recording_done(hass)
+
+    websocket_client = await hass_ws_client()
+    await websocket_client.send_json(
+        {
+            "id": 7,
+            "type": "logbook/event_stream",
+            "start_time": now.isoformat(),
+            "entity_ids": ["light.small"],
+            "limit": 2,
+        }
+    )
+
+    msg = await asyncio.wait_for(websocket_client.receive_json(), 2)
+    assert msg["id"] == 7
+    assert msg["type"] == TYPE_RESULT
+    assert msg["success"]
+
+    msg = await asyncio.wait_for(websocket_client.receive_json(), 2)
+    assert msg["id"] == 7
+    assert msg["type"] == "event"
+    assert [event["state"] for event in msg["event"]["events"]] == ["off", "on"]
+    assert msg["event"]["partial"] is True
+    cursor = msg["event"]["cursor"]
+    assert cursor["time_fired_ts"] == msg["event"]["events"][0]["when"]
+
+    # Only the rows after the page are fetched once the recorder caught up
+    msg = await asyncio.wait_for(websocket_client.receive_json(), 2)
+    assert msg["id"] == 7
+    assert msg["type"] == "event"
+    assert msg["event"]["events"] == []
+    assert "partial" not in msg["event"]
+    assert "cursor" not in msg["event"]
+
+    await websocket_client.send_json(
+        {
+            "id": 8,
+            "type": "logbook/get_events",
+            "start_time": now.isoformat(),
+            "entity_ids": ["light.small"],
+            "limit": 2,
+            "cursor": cursor,
+        }
+    )
+    msg = await asyncio.wait_for(websocket_client.receive_json(), 2)
+    assert msg["id"] == 8
+    assert msg["success"]
+    assert [event["state"] for event in msg["result"]["events"]] == ["on"]
+    assert msg["result"]["cursor"] is None
+
+    await websocket_client.send_json(
+        {"id": 9, "type": "unsubscribe_events", "subscription": 7}
+    )
+    msg = await asyncio.wait_for(websocket_client.receive_json(), 2)
+    assert msg["id"] == 9
+    assert msg["success"]
+
+
 @patch("homeassistant.components.logbook.websocket_api.EVENT_COALESCE_TIME", 0)
 async def test_subscribe_unsubscribe_logbook_stream_big_query(
     recorder_mock: Recorder, hass: HomeAssistant, hass_ws_client: WebSocketGenerator
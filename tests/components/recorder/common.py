@@ -422,6 +422,8 @@ def old_db_schema(schema_version_postfix: str) -> Iterator[None]:
         core, "StateAttributes", old_db_schema.StateAttributes
     ), patch.object(
         core, "EntityIDMigrationTask", core.RecorderTask
+    ), patch.object(
+        core, "supports_bulk_state_writes", return_value=False
     ), patch(
         CREATE_ENGINE_TARGET,
         new=partial(
@@ -522,6 +522,43 @@ def test_get_significant_states_minimal_response(
     )
 
 
+@pytest.mark.parametrize("minimal_response", [True, False])
+def test_get_significant_state_chunks(
+    hass_recorder: Callable[..., HomeAssistant], minimal_response: bool
+) -> None:
+    """Test chunks of significant states add up to the significant states."""
+    hass = hass_recorder()
+    zero, four, states = record_states(hass)
+    hist = history.get_significant_states(
+        hass,
+        zero,
+        four,
+        entity_ids=list(states),
+        minimal_response=minimal_response,
+        compressed_state_format=True,
+    )
+    with session_scope(hass=hass, read_only=True) as session:
+        chunks = list(
+            history.get_significant_state_chunks_with_session(
+                hass,
+                session,
+                zero,
+                four,
+                entity_ids=list(states),
+                minimal_response=minimal_response,
+                compressed_state_format=True,
+                chunk_size=2,
+            )
+        )
+
+    assert all(0 < len(entity_states) <= 2 for _, entity_states in chunks)
+    chunked_hist: dict[str, list[dict]] = {}
+    for entity_id, entity_states in chunks:
+        chunked_hist.setdefault(entity_id, []).extend(entity_states)
+    assert chunked_hist == hist
+    assert len(chunks) > len(hist)
+
+
 @pytest.mark.parametrize("time_zone", ["Europe/Berlin", "US/Hawaii", "UTC"])
 def test_get_significant_states_with_initial(
     time_zone, hass_recorder: Callable[..., HomeAssistant]
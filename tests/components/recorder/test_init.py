@@ -12,6 +12,8 @@ from unittest.mock import MagicMock, Mock, patch
 
 from freezegun.api import FrozenDateTimeFactory
 import pytest
+from sqlalchemy import select, text
+from sqlalchemy.engine import Engine
 from sqlalchemy.exc import DatabaseError, OperationalError, SQLAlchemyError
 
 from homeassistant.components import recorder
@@ -19,6 +21,7 @@ from homeassistant.components.recorder import (
     CONF_AUTO_PURGE,
     CONF_AUTO_REPACK,
     CONF_COMMIT_INTERVAL,
+    CONF_COMPRESS_SHARED_DATA,
     CONF_DB_MAX_RETRIES,
     CONF_DB_RETRY_WAIT,
     CONF_DB_URL,
@@ -38,6 +41,7 @@ from homeassistant.components.recorder.const import (
     SupportedDialect,
 )
 from homeassistant.components.recorder.db_schema import (
+    ENTITY_ID_IN_EVENT,
     SCHEMA_VERSION,
     EventData,
     Events,
@@ -48,7 +52,9 @@ from homeassistant.components.recorder.db_schema import (
     StatesMeta,
     StatisticsRuns,
 )
+from homeassistant.components.recorder.history import get_significant_states
 from homeassistant.components.recorder.models import process_timestamp
+from homeassistant.components.recorder.models.shared_json import COMPRESSED_JSON_PREFIX
 from homeassistant.components.recorder.queries import select_event_type_ids
 from homeassistant.components.recorder.services import (
     SERVICE_DISABLE,
@@ -56,29 +62,35 @@ from homeassistant.components.recorder.services import (
     SERVICE_PURGE,
     SERVICE_PURGE_ENTITIES,
 )
+from homeassistant.components.recorder.spool import EventSpool
 from homeassistant.components.recorder.table_managers import (
     state_attributes as state_attributes_table_manager,
     states_meta as states_meta_table_manager,
 )
-from homeassistant.components.recorder.util import session_scope
+from homeassistant.components.recorder.util import (
+    session_scope,
+    supports_bulk_state_writes,
+)
 from homeassistant.const import (
     EVENT_COMPONENT_LOADED,
     EVENT_HOMEASSISTANT_CLOSE,
     EVENT_HOMEASSISTANT_FINAL_WRITE,
     EVENT_HOMEASSISTANT_STARTED,
     EVENT_HOMEASSISTANT_STOP,
+    EVENT_STATE_CHANGED,
     MATCH_ALL,
     STATE_LOCKED,
     STATE_UNLOCKED,
 )
-from homeassistant.core import Context, CoreState, Event, HomeAssistant, callback
+from homeassistant.core import Context, CoreState, Event, HomeAssistant, State, callback
 from homeassistant.helpers import entity_registry as er, recorder as recorder_helper
 from homeassistant.setup import async_setup_component, setup_component
-from homeassistant.util import dt as dt_util
+from homeassistant.util import dt as dt_util, ulid as ulid_util
 from homeassistant.util.json import json_loads
 
 from .common import (
     async_block_recorder,
+    async_recorder_block_till_done,
     async_wait_recording_done,
     convert_pending_states_to_meta,
     corrupt_db_file,
@@ -313,6 +325,62 @@ async def test_saving_state_with_nul(
     assert state.as_dict() == expected.as_dict()
 
 
+async def test_saving_state_and_event_compressed(
+    async_setup_recorder_instance: RecorderInstanceGenerator, hass: HomeAssistant
+) -> None:
+    """Test saving compressed shared attributes and event data."""
+    instance = await async_setup_recorder_instance(
+        hass, {CONF_COMPRESS_SHARED_DATA: True}
+    )
+    entity_id = "select.preset"
+    attributes = {
+        "options": [f"Preset {option}" for option in range(20)],
+        "icon": "mdi:format-list-bulleted",
+        "friendly_name": "Living room preset",
+    }
+    event_data = {"entity_id": entity_id, "options": attributes["options"]}
+    start = dt_util.utcnow()
+
+    hass.states.async_set(entity_id, "Preset 1", attributes)
+    hass.bus.async_fire("test_compressed", event_data)
+    await async_wait_recording_done(hass)
+    # The attributes are found in the database when they are not cached
+    instance.state_attributes_manager.reset()
+    hass.states.async_set(entity_id, "Preset 2", attributes)
+    await async_wait_recording_done(hass)
+
+    with session_scope(hass=hass, read_only=True) as session:
+        db_state_attributes = session.query(StateAttributes).one()
+        assert db_state_attributes.shared_attrs.startswith(COMPRESSED_JSON_PREFIX)
+        assert db_state_attributes.to_native() == attributes
+        db_event_data = (
+            session.query(EventData)
+            .filter(EventData.shared_data.startswith(COMPRESSED_JSON_PREFIX))
+            .one()
+        )
+        assert db_event_data.shared_data.startswith(COMPRESSED_JSON_PREFIX)
+        assert db_event_data.to_native() == event_data
+        # The keys used in SQL are still found in the compressed data
+        assert session.execute(
+            select(StateAttributes.shared_attrs).where(
+                StateAttributes.shared_attrs.like('%"icon":%')
+            )
+        ).all()
+        assert (
+            session.execute(
+                select(ENTITY_ID_IN_EVENT).where(
+                    EventData.data_id == db_event_data.data_id
+                )
+            ).scalar()
+            == entity_id
+        )
+
+    states = await instance.async_add_executor_job(
+        get_significant_states, hass, start, None, [entity_id]
+    )
+    assert [state.attributes for state in states[entity_id]] == [attributes] * 2
+
+
 async def test_saving_many_states(
     async_setup_recorder_instance: RecorderInstanceGenerator, hass: HomeAssistant
 ) -> None:
@@ -378,11 +446,11 @@ def test_saving_state_with_exception(
     attributes = {"test_attr": 5, "test_attr_10": "nice"}
 
     def _throw_if_state_in_session(*args, **kwargs):
-        for obj in get_instance(hass).event_session:
-            if isinstance(obj, States):
-                raise OperationalError(
-                    "insert the state", "fake params", "forced to fail"
-                )
+        instance = get_instance(hass)
+        if instance.states_manager._pending_rows or any(
+            isinstance(obj, States) for obj in instance.event_session
+        ):
+            raise OperationalError("insert the state", "fake params", "forced to fail")
 
     with patch("time.sleep"), patch.object(
         get_instance(hass).event_session,
@@ -1390,6 +1458,430 @@ def test_saving_sets_old_state(hass_recorder: Callable[..., HomeAssistant]) -> N
         assert states_by_state["s4"].old_state_id == states_by_state["s2"].state_id
 
 
+@pytest.mark.parametrize("bulk_state_writes", [True, False])
+async def test_saving_states_in_one_commit_sets_old_state(
+    async_setup_recorder_instance: RecorderInstanceGenerator,
+    hass: HomeAssistant,
+    recorder_db_url: str,
+    tmp_path: Path,
+    bulk_state_writes: bool,
+) -> None:
+    """Test states saved in the same commit are linked to their old state."""
+    if recorder_db_url == "sqlite://":
+        # On-disk database because the MutexPool is held by the event session
+        # until the commit
+        recorder_db_url = "sqlite:///" + str(tmp_path / "pytest.db")
+    with patch(
+        "homeassistant.components.recorder.core.supports_bulk_state_writes",
+        return_value=bulk_state_writes,
+    ):
+        instance = await async_setup_recorder_instance(
+            hass,
+            {
+                recorder.CONF_DB_URL: recorder_db_url,
+                recorder.CONF_COMMIT_INTERVAL: 30,
+            },
+        )
+
+    hass.states.async_set("test.one", "s1", {"attr": 1})
+    await async_recorder_block_till_done(hass)
+    await async_wait_recording_done(hass)
+    for state in ("s2", "s3", "s4"):
+        hass.states.async_set("test.one", state, {"attr": 2})
+    hass.states.async_set("test.two", "s5", {"attr": 2})
+    hass.states.async_remove("test.two")
+    await async_recorder_block_till_done(hass)
+    await async_wait_recording_done(hass)
+
+    def _get_states():
+        with session_scope(hass=hass, read_only=True) as session:
+            return list(
+                session.query(
+                    StatesMeta.entity_id,
+                    States.state_id,
+                    States.old_state_id,
+                    States.state,
+                    StateAttributes.shared_attrs,
+                )
+                .outerjoin(StatesMeta, States.metadata_id == StatesMeta.metadata_id)
+                .outerjoin(
+                    StateAttributes,
+                    States.attributes_id == StateAttributes.attributes_id,
+                )
+            )
+
+    states = await instance.async_add_executor_job(_get_states)
+    states_by_state = {state.state: state for state in states}
+    assert states_by_state.keys() == {"s1", "s2", "s3", "s4", "s5", None}
+    assert states_by_state["s1"].old_state_id is None
+    for old_state, state in (("s1", "s2"), ("s2", "s3"), ("s3", "s4")):
+        assert states_by_state[state].entity_id == "test.one"
+        assert (
+            states_by_state[state].old_state_id == states_by_state[old_state].state_id
+        )
+    assert states_by_state["s2"].shared_attrs == '{"attr":2}'
+    assert states_by_state["s4"].shared_attrs == '{"attr":2}'
+    assert states_by_state["s5"].old_state_id is None
+    assert states_by_state[None].entity_id == "test.two"
+    assert states_by_state[None].old_state_id == states_by_state["s5"].state_id
+
+
+async def test_read_executor_jobs(
+    async_setup_recorder_instance: RecorderInstanceGenerator,
+    hass: HomeAssistant,
+    recorder_db_url: str,
+    tmp_path: Path,
+) -> None:
+    """Test read jobs use read only connections and are timed."""
+    if recorder_db_url.startswith(("mysql://", "postgresql://")):
+        return pytest.skip("This test uses SQLite pragmas")
+    if recorder_db_url == "sqlite://":
+        # The in-memory database has a single connection
+        recorder_db_url = "sqlite:///" + str(tmp_path / "pytest.db")
+    instance = await async_setup_recorder_instance(
+        hass, {recorder.CONF_DB_URL: recorder_db_url}
+    )
+
+    def _query_only() -> tuple[str, int]:
+        with session_scope(hass=hass, read_only=True) as session:
+            return (
+                threading.current_thread().name,
+                session.execute(text("PRAGMA query_only")).scalar(),
+            )
+
+    thread_name, query_only = await instance.async_add_read_executor_job(_query_only)
+    assert thread_name.startswith(recorder.const.DB_READER_PREFIX)
+    assert query_only == 1
+    thread_name, query_only = await instance.async_add_executor_job(_query_only)
+    assert thread_name.startswith(recorder.const.DB_WORKER_PREFIX)
+    assert query_only == 0
+
+    stats = instance.get_read_query_stats()
+    assert list(stats) == ["test_read_executor_jobs.<locals>._query_only"]
+    assert stats["test_read_executor_jobs.<locals>._query_only"]["count"] == 1
+    assert stats["test_read_executor_jobs.<locals>._query_only"]["total_seconds"] > 0
+
+
+async def test_events_prepared_ahead_of_recorder_thread(
+    async_setup_recorder_instance: RecorderInstanceGenerator,
+    hass: HomeAssistant,
+) -> None:
+    """Test events are serialized by the serializer while the recorder is busy."""
+    with patch.object(recorder.core, "SERIALIZER_QUEUE_BACKLOG", 0):
+        instance = await async_setup_recorder_instance(hass)
+    await async_wait_recording_done(hass)
+
+    prepared_before_processing: list[bool] = []
+    process_one_event = instance._process_one_event
+
+    def _process_one_event(task: recorder.tasks.EventTask) -> None:
+        prepared_before_processing.append(task.prepared is not None)
+        process_one_event(task)
+
+    with patch.object(instance, "_process_one_event", _process_one_event):
+        await async_block_recorder(hass, 0.2)
+        hass.states.async_set("test.one", "s1", {"attr": 1})
+        hass.states.async_set("test.one", "s2", {"attr": 2})
+        hass.bus.async_fire("custom_event", {"value": 1})
+        await async_wait_recording_done(hass)
+
+    assert prepared_before_processing == [True, True, True]
+
+    def _get_states():
+        with session_scope(hass=hass, read_only=True) as session:
+            return list(
+                session.query(
+                    States.state_id,
+                    States.old_state_id,
+                    States.state,
+                    StateAttributes.shared_attrs,
+                )
+                .outerjoin(
+                    StateAttributes,
+                    States.attributes_id == StateAttributes.attributes_id,
+                )
+                .order_by(States.state_id)
+            )
+
+    def _get_event_data():
+        with session_scope(hass=hass, read_only=True) as session:
+            return [
+                event_data.shared_data
+                for event_data in session.query(EventData).join(
+                    Events, Events.data_id == EventData.data_id
+                )
+            ]
+
+    states = await instance.async_add_executor_job(_get_states)
+    assert [(state.state, state.shared_attrs) for state in states] == [
+        ("s1", '{"attr":1}'),
+        ("s2", '{"attr":2}'),
+    ]
+    assert states[1].old_state_id == states[0].state_id
+    assert '{"value":1}' in await instance.async_add_executor_job(_get_event_data)
+
+
+async def test_spooling_events_while_backlog_is_large(
+    async_setup_recorder_instance: RecorderInstanceGenerator,
+    hass: HomeAssistant,
+    tmp_path: Path,
+) -> None:
+    """Test events are spooled to disk and recorded in order."""
+    with patch.object(recorder.core, "SPOOL_QUEUE_BACKLOG", 0), patch.object(
+        recorder.core, "SPOOL_DIR", str(tmp_path / "spool")
+    ):
+        instance = await async_setup_recorder_instance(hass)
+
+    context = Context(parent_id=ulid_util.ulid())
+    for state in ("s1", "s2", "s3"):
+        hass.states.async_set("test.one", state, {"attr": state}, context=context)
+    hass.bus.async_fire("custom_event", {"value": 1}, context=context)
+    assert instance.spooled_backlog > 0
+    while instance.spooled_backlog:
+        await async_wait_recording_done(hass)
+    await async_wait_recording_done(hass)
+
+    def _get_states():
+        with session_scope(hass=hass, read_only=True) as session:
+            return list(
+                session.query(
+                    States.state_id,
+                    States.old_state_id,
+                    States.state,
+                    States.context_parent_id_bin,
+                ).order_by(States.state_id)
+            )
+
+    def _get_events():
+        with session_scope(hass=hass, read_only=True) as session:
+            return list(
+                session.query(Events).filter(
+                    Events.event_type_id.in_(select_event_type_ids(("custom_event",)))
+                )
+            )
+
+    states = await instance.async_add_executor_job(_get_states)
+    assert [state.state for state in states] == ["s1", "s2", "s3"]
+    assert states[0].old_state_id is None
+    assert states[1].old_state_id == states[0].state_id
+    assert states[2].old_state_id == states[1].state_id
+    assert states[0].context_parent_id_bin == ulid_util.ulid_to_bytes(context.parent_id)
+    events = await instance.async_add_executor_job(_get_events)
+    assert len(events) == 1
+    assert instance.spooled_backlog == 0
+
+
+async def test_recording_resumes_when_the_spool_cannot_be_read(
+    async_setup_recorder_instance: RecorderInstanceGenerator,
+    hass: HomeAssistant,
+    tmp_path: Path,
+    caplog: pytest.LogCaptureFixture,
+) -> None:
+    """Test events are kept in memory when the spooled events cannot be read."""
+    with patch.object(recorder.core, "SPOOL_QUEUE_BACKLOG", 0), patch.object(
+        recorder.core, "SPOOL_DIR", str(tmp_path / "spool")
+    ):
+        instance = await async_setup_recorder_instance(hass)
+
+    with patch.object(instance.spool, "read", side_effect=OSError("read failed")):
+        hass.bus.async_fire("spooled_event")
+        await async_wait_recording_done(hass)
+        await async_wait_recording_done(hass)
+
+    assert "Error replaying the events spooled to disk" in caplog.text
+    assert instance.spool.failed
+    assert instance.spooled_backlog == 0
+
+    for state in ("s1", "s2", "s3"):
+        hass.states.async_set("test.one", state)
+    await async_wait_recording_done(hass)
+
+    def _get_states():
+        with session_scope(hass=hass, read_only=True) as session:
+            return list(session.query(States.state).order_by(States.state_id))
+
+    states = await instance.async_add_executor_job(_get_states)
+    assert [state.state for state in states] == ["s1", "s2", "s3"]
+
+
+async def test_replaying_events_spooled_before_shutdown(
+    async_setup_recorder_instance: RecorderInstanceGenerator,
+    hass: HomeAssistant,
+    tmp_path: Path,
+) -> None:
+    """Test events spooled before the last shutdown are recorded first."""
+    spool_dir = str(tmp_path / "spool")
+    spool = EventSpool(spool_dir)
+    for state in ("s1", "s2"):
+        spool.put(
+            Event(
+                EVENT_STATE_CHANGED,
+                {
+                    "entity_id": "test.one",
+                    "old_state": None,
+                    "new_state": State("test.one", state),
+                },
+            )
+        )
+    spool.close()
+
+    with patch.object(recorder.core, "SPOOL_DIR", spool_dir):
+        instance = await async_setup_recorder_instance(hass)
+    hass.states.async_set("test.one", "s3")
+    while instance.spooled_backlog:
+        await async_wait_recording_done(hass)
+    await async_wait_recording_done(hass)
+
+    def _get_states():
+        with session_scope(hass=hass, read_only=True) as session:
+            return list(session.query(States.state).order_by(States.state_id))
+
+    states = await instance.async_add_executor_job(_get_states)
+    assert [state.state for state in states] == ["s1", "s2", "s3"]
+
+
+async def test_spooled_states_keep_unrecorded_attributes_out(
+    async_setup_recorder_instance: RecorderInstanceGenerator,
+    hass: HomeAssistant,
+    tmp_path: Path,
+) -> None:
+    """Test the unrecorded attributes of spooled states are not recorded."""
+    with patch.object(recorder.core, "SPOOL_QUEUE_BACKLOG", 0), patch.object(
+        recorder.core, "SPOOL_DIR", str(tmp_path / "spool")
+    ):
+        instance = await async_setup_recorder_instance(hass)
+
+    class EntityWithExcludedAttributes(MockEntity):
+        _entity_component_unrecorded_attributes = frozenset({"excluded_component"})
+        _unrecorded_attributes = frozenset({"excluded_integration"})
+
+    entity_platform = MockEntityPlatform(hass, platform_name="fake_integration")
+    entity = EntityWithExcludedAttributes(
+        entity_id="test.spooled",
+        extra_state_attributes={
+            "test_attr": 5,
+            "excluded_component": 10,
+            "excluded_integration": 20,
+        },
+    )
+    await entity_platform.async_add_entities([entity])
+    assert instance.spool.put_count > 0
+    while instance.spooled_backlog:
+        await async_wait_recording_done(hass)
+    await async_wait_recording_done(hass)
+
+    def _get_shared_attrs():
+        with session_scope(hass=hass, read_only=True) as session:
+            return [
+                shared_attrs
+                for (shared_attrs,) in session.query(StateAttributes.shared_attrs)
+                .join(States, States.attributes_id == StateAttributes.attributes_id)
+                .join(StatesMeta, States.metadata_id == StatesMeta.metadata_id)
+                .filter(StatesMeta.entity_id == "test.spooled")
+            ]
+
+    assert await instance.async_add_executor_job(_get_shared_attrs) == [
+        '{"test_attr":5}'
+    ]
+
+
+async def test_bulk_state_writes_decided_after_connecting(
+    async_setup_recorder_instance: RecorderInstanceGenerator,
+    hass: HomeAssistant,
+) -> None:
+    """Test bulk state writes are decided once the dialect is initialized."""
+    server_versions = []
+
+    def _supports_bulk_state_writes(engine: Engine) -> bool:
+        server_versions.append(engine.dialect.server_version_info)
+        return supports_bulk_state_writes(engine)
+
+    with patch(
+        "homeassistant.components.recorder.core.supports_bulk_state_writes",
+        side_effect=_supports_bulk_state_writes,
+    ):
+        instance = await async_setup_recorder_instance(hass)
+
+    # The server version is only known once the first connection initialized
+    # the dialect
+    assert server_versions
+    assert None not in server_versions
+    assert instance._bulk_state_writes
+
+
+async def test_saving_states_retried_after_failed_commit(
+    async_setup_recorder_instance: RecorderInstanceGenerator,
+    hass: HomeAssistant,
+    recorder_db_url: str,
+    tmp_path: Path,
+) -> None:
+    """Test states inserted in bulk are written once when the commit is retried."""
+    if recorder_db_url == "sqlite://":
+        # On-disk database because the MutexPool is held by the event session
+        # until the commit
+        recorder_db_url = "sqlite:///" + str(tmp_path / "pytest.db")
+    with patch(
+        "homeassistant.components.recorder.core.supports_bulk_state_writes",
+        return_value=True,
+    ):
+        instance = await async_setup_recorder_instance(
+            hass,
+            {
+                recorder.CONF_DB_URL: recorder_db_url,
+                recorder.CONF_COMMIT_INTERVAL: 30,
+            },
+        )
+
+    hass.states.async_set("test.one", "s1")
+    await async_recorder_block_till_done(hass)
+    await async_wait_recording_done(hass)
+
+    dialect = instance.engine.dialect
+    do_commit = dialect.do_commit
+    failed_commits = 0
+
+    def _fail_first_commit(dbapi_connection) -> None:
+        """Fail the first DBAPI commit of the states inserted in bulk."""
+        nonlocal failed_commits
+        if instance.states_manager._pending_rows and not failed_commits:
+            failed_commits += 1
+            raise dialect.loaded_dbapi.OperationalError("forced to fail")
+        do_commit(dbapi_connection)
+
+    with patch("time.sleep"), patch.object(
+        dialect, "do_commit", side_effect=_fail_first_commit
+    ):
+        for state in ("s2", "s3"):
+            hass.states.async_set("test.one", state, {"attr": state})
+        await async_recorder_block_till_done(hass)
+        await async_wait_recording_done(hass)
+
+    assert failed_commits == 1
+
+    def _get_states():
+        with session_scope(hass=hass, read_only=True) as session:
+            return list(
+                session.query(
+                    States.state_id,
+                    States.old_state_id,
+                    States.state,
+                    StateAttributes.shared_attrs,
+                ).outerjoin(
+                    StateAttributes,
+                    States.attributes_id == StateAttributes.attributes_id,
+                )
+            )
+
+    states = await instance.async_add_executor_job(_get_states)
+    assert sorted(state.state for state in states) == ["s1", "s2", "s3"]
+    states_by_state = {state.state: state for state in states}
+    # The attributes added before the failed commit are written by the retry
+    assert states_by_state["s2"].shared_attrs == '{"attr":"s2"}'
+    assert states_by_state["s3"].shared_attrs == '{"attr":"s3"}'
+    assert states_by_state["s2"].old_state_id == states_by_state["s1"].state_id
+    assert states_by_state["s3"].old_state_id == states_by_state["s2"].state_id
+
+
 def test_saving_state_with_serializable_data(
     hass_recorder: Callable[..., HomeAssistant], caplog: pytest.LogCaptureFixture
 ) -> None:
@@ -13,18 +13,26 @@ from homeassistant.components.recorder.db_schema import (
     States,
 )
 from homeassistant.components.recorder.models import (
+    STATE_ATTRIBUTES_SQL_KEYS,
     LazyState,
     bytes_to_ulid_or_none,
+    compress_shared_json,
+    decompress_shared_json,
     process_datetime_to_timestamp,
     process_timestamp,
     process_timestamp_to_utc_isoformat,
     ulid_to_bytes_or_none,
 )
+from homeassistant.components.recorder.models.state_attributes import (
+    decode_attributes_from_source,
+)
 from homeassistant.const import EVENT_STATE_CHANGED
 import homeassistant.core as ha
 from homeassistant.core import HomeAssistant
 from homeassistant.exceptions import InvalidEntityFormatError
+from homeassistant.helpers.json import json_bytes
 from homeassistant.util import dt as dt_util
+from homeassistant.util.json import json_loads
 
 
 def test_from_event_to_db_event() -> None:
@@ -464,3 +472,40 @@ def test_bytes_to_ulid_or_none(caplog: pytest.LogCaptureFixture) -> None:
     assert bytes_to_ulid_or_none(b"invalid") is None
     assert "invalid" in caplog.text
     assert bytes_to_ulid_or_none(None) is None
+
+
+def test_compress_shared_json() -> None:
+    """Test compressing and decompressing shared attributes."""
+    attributes = {
+        "options": [f"Preset {option}" for option in range(20)],
+        "device_class": "enum",
+        "icon": "mdi:format-list-bulleted",
+        "friendly_name": "Living room preset",
+    }
+    shared_attrs = json_bytes(attributes).decode("utf-8")
+
+    compressed = compress_shared_json(shared_attrs, STATE_ATTRIBUTES_SQL_KEYS)
+    assert len(compressed) < len(shared_attrs)
+    assert decompress_shared_json(compressed) == shared_attrs
+    # The compressed value stays valid JSON with the keys used in SQL
+    envelope = json_loads(compressed)
+    assert envelope["icon"] == "mdi:format-list-bulleted"
+    assert "unit_of_measurement" not in envelope
+    assert "options" not in envelope
+    assert decode_attributes_from_source(compressed, {}) == attributes
+    assert StateAttributes(shared_attrs=compressed).to_native() == attributes
+    assert EventData(shared_data=compressed).to_native() == attributes
+
+    # Short JSON is not compressed
+    short_attrs = json_bytes({"friendly_name": "Kitchen"}).decode("utf-8")
+    assert compress_shared_json(short_attrs, STATE_ATTRIBUTES_SQL_KEYS) == short_attrs
+    assert decompress_shared_json(short_attrs) == short_attrs
+
+
+def test_decompress_shared_json_invalid(caplog: pytest.LogCaptureFixture) -> None:
+    """Test decompressing invalid compressed shared attributes."""
+    invalid = '{"\\u0001zd1":"aW52YWxpZA=="}'
+    with pytest.raises(ValueError):
+        decompress_shared_json(invalid)
+    assert StateAttributes(shared_attrs=invalid).to_native() == {}
+    assert "Error converting row to state attributes" in caplog.text
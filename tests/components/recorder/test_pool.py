@@ -5,7 +5,7 @@ import pytest
 from sqlalchemy import create_engine
 from sqlalchemy.orm import sessionmaker
 
-from homeassistant.components.recorder.const import DB_WORKER_PREFIX
+from homeassistant.components.recorder.const import DB_READER_PREFIX, DB_WORKER_PREFIX
 from homeassistant.components.recorder.pool import RecorderPool
 
 
@@ -57,10 +57,17 @@ def test_recorder_pool(caplog: pytest.LogCaptureFixture) -> None:
     assert "accesses the database without the database executor" not in caplog.text
     assert connections[4] == connections[5]
 
+    caplog.clear()
+    new_thread = threading.Thread(target=_get_connection_twice, name=DB_READER_PREFIX)
+    new_thread.start()
+    new_thread.join()
+    assert "accesses the database without the database executor" not in caplog.text
+    assert connections[6] == connections[7]
+
     shutdown = True
     caplog.clear()
     new_thread = threading.Thread(target=_get_connection_twice, name=DB_WORKER_PREFIX)
     new_thread.start()
     new_thread.join()
     assert "accesses the database without the database executor" not in caplog.text
-    assert connections[6] != connections[7]
+    assert connections[8] != connections[9]
@@ -16,6 +16,7 @@ from homeassistant.components.recorder.const import (
     SupportedDialect,
 )
 from homeassistant.components.recorder.db_schema import (
+    EventData,
     Events,
     EventTypes,
     RecorderRuns,
@@ -293,6 +294,88 @@ async def test_purge_old_events(
         assert events.count() == 2
 
 
+@pytest.mark.parametrize("use_sqlite", (True, False), indirect=True)
+async def test_purge_old_states_and_events_by_day(
+    async_setup_recorder_instance: RecorderInstanceGenerator,
+    hass: HomeAssistant,
+    use_sqlite: bool,
+) -> None:
+    """Test purging old states and events one day at a time."""
+    instance = await async_setup_recorder_instance(hass, {"purge_by_day": True})
+    assert instance.purge_by_day
+
+    await _add_test_states(hass)
+    await _add_test_events(hass)
+
+    with session_scope(hass=hass) as session:
+        states = session.query(States)
+        state_attributes = session.query(StateAttributes)
+        events = session.query(Events).filter(
+            Events.event_type_id.in_(select_event_type_ids(TEST_EVENT_TYPES))
+        )
+        event_data = session.query(EventData)
+        assert states.count() == 6
+        assert state_attributes.count() == 3
+        assert events.count() == 6
+
+        purge_before = dt_util.utcnow() - timedelta(days=4)
+
+        # The states and events of eleven days ago are purged first
+        finished = purge_old_data(instance, purge_before, repack=False)
+        assert not finished
+        assert states.count() == 4
+        assert state_attributes.count() == 2
+        assert events.count() == 4
+        # The state linked to a purged state is disconnected
+        state_map_by_state = {state.state: state for state in states}
+        assert state_map_by_state["purgeme_2"].old_state_id is None
+        assert (
+            state_map_by_state["purgeme_3"].old_state_id
+            == state_map_by_state["purgeme_2"].state_id
+        )
+
+        for _ in range(3):
+            if finished := purge_old_data(instance, purge_before, repack=False):
+                break
+        assert finished
+        assert states.count() == 2
+        assert state_attributes.count() == 1
+        assert events.count() == 2
+        state_map_by_state = {state.state: state for state in states}
+        assert state_map_by_state["dontpurgeme_4"].old_state_id is None
+        assert (
+            state_map_by_state["dontpurgeme_5"].old_state_id
+            == state_map_by_state["dontpurgeme_4"].state_id
+        )
+        assert "test.recorder2" in instance.states_manager._last_committed_id
+
+        # Purge everything
+        purge_old_data(instance, dt_util.utcnow() + timedelta(seconds=1), repack=False)
+        assert states.count() == 0
+        assert state_attributes.count() == 0
+        assert events.count() == 0
+        assert event_data.count() == 0
+        assert "test.recorder2" not in instance.states_manager._last_committed_id
+
+
+def test_purge_day_slice_ends() -> None:
+    """Test the oldest day is purged in slices."""
+    day = purge.PURGE_DAY_SECONDS
+    hour = purge.PURGE_SLICE_SECONDS
+    assert purge._purge_day_slice_ends(None, 10 * day) == []
+    assert purge._purge_day_slice_ends(10 * day, 10 * day) == []
+    # The slices start with the one of the oldest row
+    assert purge._purge_day_slice_ends(day + 2.5 * hour, 10 * day) == [
+        day + slice_hour * hour for slice_hour in range(3, 25)
+    ]
+    # The last slice ends at purge_before
+    assert purge._purge_day_slice_ends(day + 2.5 * hour, day + 4.5 * hour) == [
+        day + 3 * hour,
+        day + 4 * hour,
+        day + 4.5 * hour,
+    ]
+
+
 async def test_purge_old_recorder_runs(
     async_setup_recorder_instance: RecorderInstanceGenerator, hass: HomeAssistant
 ) -> None:
@@ -0,0 +1,169 @@
+"""Test spooling recorder events to disk."""
+from pathlib import Path
+from unittest.mock import patch
+
+from homeassistant.components.recorder import spool
+from homeassistant.components.recorder.spool import EventSpool
+from homeassistant.const import EVENT_STATE_CHANGED
+from homeassistant.core import Context, Event, EventOrigin, State
+
+
+def _state_changed_event(entity_id: str, old: str | None, new: str) -> Event:
+    """Return a state changed event."""
+    context = Context(user_id="user", parent_id="parent")
+    old_state = State(entity_id, old, {"attr": old}, context=context) if old else None
+    new_state = State(entity_id, new, {"attr": new}, context=context)
+    return Event(
+        EVENT_STATE_CHANGED,
+        {"entity_id": entity_id, "old_state": old_state, "new_state": new_state},
+        EventOrigin.local,
+        context=context,
+    )
+
+
+def _read_all(event_spool: EventSpool, until: int | None = None) -> list[Event]:
+    """Read events from the spool until it caught up."""
+    events: list[Event] = []
+    while not event_spool.caught_up(until):
+        events.extend(event_spool.read(10, until))
+    return events
+
+
+def test_spool_put_and_read(tmp_path: Path) -> None:
+    """Test events are read back from the spool in order."""
+    event_spool = EventSpool(str(tmp_path / "spool"))
+    state_changed = _state_changed_event("test.one", "off", "on")
+    custom = Event("custom", {"value": [1, 2]}, EventOrigin.remote)
+    with patch.object(spool, "SEGMENT_MAX_EVENTS", 2):
+        assert event_spool.put(state_changed)
+        assert event_spool.put(custom)
+        for state in range(3):
+            assert event_spool.put(Event("counter", {"value": state}))
+        assert event_spool.backlog == 5
+
+        events = _read_all(event_spool)
+    event_spool.close()
+
+    assert event_spool.backlog == 0
+    assert event_spool.caught_up()
+    assert [event.event_type for event in events] == [
+        EVENT_STATE_CHANGED,
+        "custom",
+        "counter",
+        "counter",
+        "counter",
+    ]
+    replayed = events[0]
+    assert replayed.time_fired == state_changed.time_fired
+    assert replayed.context == state_changed.context
+    assert replayed.context.user_id == "user"
+    assert replayed.context.parent_id == "parent"
+    for key in ("old_state", "new_state"):
+        assert replayed.data[key].as_dict() == state_changed.data[key].as_dict()
+    assert replayed.data["new_state"].context is replayed.context
+    assert events[1].origin is EventOrigin.remote
+    assert events[1].data == {"value": [1, 2]}
+    assert [event.data["value"] for event in events[2:]] == [0, 1, 2]
+    # The segments which have been read are removed
+    assert list((tmp_path / "spool").iterdir()) == []
+
+
+def test_spool_keeps_unrecorded_attributes(tmp_path: Path) -> None:
+    """Test the unrecorded attributes of the new state are read back."""
+    event_spool = EventSpool(str(tmp_path / "spool"))
+    state_changed = _state_changed_event("test.one", "off", "on")
+    state_changed.data["new_state"].state_info = {
+        "unrecorded_attributes": frozenset({"attr", "secret"})
+    }
+    assert event_spool.put(state_changed)
+    assert event_spool.put(_state_changed_event("test.one", "on", "off"))
+    events = _read_all(event_spool)
+    event_spool.close()
+
+    assert events[0].data["new_state"].state_info == {
+        "unrecorded_attributes": frozenset({"attr", "secret"})
+    }
+    assert events[1].data["new_state"].state_info is None
+
+
+def test_spool_read_until(tmp_path: Path) -> None:
+    """Test only the events before the until position are read."""
+    event_spool = EventSpool(str(tmp_path / "spool"))
+    for value in range(4):
+        event_spool.put(Event("counter", {"value": value}))
+
+    events = _read_all(event_spool, until=3)
+    assert [event.data["value"] for event in events] == [0, 1, 2]
+    assert event_spool.caught_up(3)
+    assert not event_spool.caught_up()
+    event_spool.close()
+
+
+def test_spool_skips_events_which_cannot_be_serialized(tmp_path: Path, caplog) -> None:
+    """Test events which cannot be serialized are skipped."""
+    event_spool = EventSpool(str(tmp_path / "spool"))
+    event_spool.put(Event("bad", {"value": object()}))
+    event_spool.put(Event("good"))
+
+    events = _read_all(event_spool)
+    event_spool.close()
+
+    assert [event.event_type for event in events] == ["good"]
+    assert event_spool.caught_up()
+    assert "cannot be spooled" in caplog.text
+
+
+def test_spool_keeps_unread_events_after_close(tmp_path: Path) -> None:
+    """Test events which were not read are loaded by the next spool."""
+    path = str(tmp_path / "spool")
+    event_spool = EventSpool(path)
+    with patch.object(spool, "SEGMENT_MAX_EVENTS", 2):
+        for value in range(5):
+            event_spool.put(Event("counter", {"value": value}))
+        assert [event.data["value"] for event in _read_all(event_spool, 3)] == [
+            0,
+            1,
+            2,
+        ]
+    event_spool.close()
+    assert not event_spool.put(Event("counter", {"value": 5}))
+
+    event_spool = EventSpool(path)
+    event_spool.load()
+    assert event_spool.backlog == 2
+    event_spool.put(Event("counter", {"value": 6}))
+    events = _read_all(event_spool)
+    event_spool.close()
+
+    assert [event.data["value"] for event in events] == [3, 4, 6]
+    assert event_spool.caught_up()
+
+
+def test_spool_load_without_spool(tmp_path: Path) -> None:
+    """Test loading when nothing was spooled."""
+    event_spool = EventSpool(str(tmp_path / "spool"))
+    event_spool.load()
+    assert event_spool.backlog == 0
+    assert event_spool.read(10) == []
+    event_spool.close()
+
+
+def test_spool_abandon(tmp_path: Path) -> None:
+    """Test an abandoned spool is caught up and does not accept events."""
+    event_spool = EventSpool(str(tmp_path / "spool"))
+    for state in range(3):
+        assert event_spool.put(Event("counter", {"value": state}))
+    assert [event.data["value"] for event in event_spool.read(1)] == [0]
+
+    assert event_spool.abandon() == 2
+    assert event_spool.failed
+    assert event_spool.caught_up()
+    assert event_spool.backlog == 0
+    assert not event_spool.put(Event("counter", {"value": 3}))
+    event_spool.close()
+
+    # The events which were not read are recorded after the next start
+    event_spool = EventSpool(str(tmp_path / "spool"))
+    event_spool.load()
+    assert [event.data["value"] for event in _read_all(event_spool)] == [1, 2]
+    event_spool.close()
@@ -1,13 +1,18 @@
 """The tests for sensor recorder platform."""
 from collections.abc import Callable
 from datetime import timedelta
-from unittest.mock import patch
+from unittest.mock import ANY, patch
 
 import pytest
 from sqlalchemy import select
 
 from homeassistant.components import recorder
-from homeassistant.components.recorder import Recorder, history, statistics
+from homeassistant.components.recorder import (
+    Recorder,
+    get_instance,
+    history,
+    statistics,
+)
 from homeassistant.components.recorder.db_schema import StatisticsShortTerm
 from homeassistant.components.recorder.models import (
     datetime_to_timestamp_or_none,
@@ -1721,6 +1726,171 @@ def test_monthly_statistics_sum(
     dt_util.set_default_time_zone(dt_util.get_time_zone("UTC"))
 
 
+@pytest.mark.parametrize("timezone", ["America/Regina", "Europe/Vienna", "UTC"])
+@pytest.mark.parametrize("period", ["day", "week", "month"])
+@pytest.mark.freeze_time("2022-12-31 00:00:00+00:00")
+def test_statistics_reduced_in_database(
+    hass_recorder: Callable[..., HomeAssistant], timezone: str, period: str
+) -> None:
+    """Test statistics reduced in the database match the ones reduced in Python."""
+    dt_util.set_default_time_zone(dt_util.get_time_zone(timezone))
+
+    hass = hass_recorder()
+    wait_recording_done(hass)
+
+    # Hourly statistics across the end of daylight saving time
+    start = dt_util.as_utc(dt_util.parse_datetime("2022-09-20 00:00:00"))
+    hours = [start + timedelta(hours=hour) for hour in range(24 * 70)]
+    async_add_external_statistics(
+        hass,
+        {
+            "has_mean": True,
+            "has_sum": False,
+            "name": "Temperature",
+            "source": "test",
+            "statistic_id": "test:temperature",
+            "unit_of_measurement": "°C",
+        },
+        [
+            {
+                "start": hour,
+                "mean": index % 17 + 0.1,
+                "min": index % 13 - 5.3,
+                "max": index % 19 + 7.7,
+            }
+            for index, hour in enumerate(hours)
+        ],
+    )
+    async_add_external_statistics(
+        hass,
+        {
+            "has_mean": False,
+            "has_sum": True,
+            "name": "Total imported energy",
+            "source": "test",
+            "statistic_id": "test:total_energy_import",
+            "unit_of_measurement": "kWh",
+        },
+        [
+            {"start": hour, "last_reset": None, "state": index % 23, "sum": index}
+            for index, hour in enumerate(hours)
+        ],
+    )
+    wait_recording_done(hass)
+
+    statistic_ids = {"test:temperature", "test:total_energy_import"}
+    for start_time, end_time, units in (
+        (start, None, None),
+        (start + timedelta(days=3), hours[-1] - timedelta(days=5), None),
+        (start, hours[-1], {"temperature": "°F", "energy": "Wh"}),
+    ):
+        stats = statistics_during_period(
+            hass, start_time, end_time, statistic_ids, period, units
+        )
+        with patch.object(statistics, "MAX_PERIODS_REDUCED_IN_DATABASE", 0):
+            python_stats = statistics_during_period(
+                hass, start_time, end_time, statistic_ids, period, units
+            )
+        assert stats["test:temperature"]
+        assert stats["test:total_energy_import"]
+        assert stats == {
+            statistic_id: [
+                {key: pytest.approx(value) for key, value in row.items()}
+                for row in rows
+            ]
+            for statistic_id, rows in python_stats.items()
+        }
+
+    dt_util.set_default_time_zone(dt_util.get_time_zone("UTC"))
+
+
+@pytest.mark.freeze_time("2022-10-10 00:00:00+00:00")
+def test_statistics_during_period_cache(
+    hass_recorder: Callable[..., HomeAssistant],
+) -> None:
+    """Test statistics of periods which can no longer change are cached."""
+    hass = hass_recorder()
+    wait_recording_done(hass)
+    # Statistics are not compiled in the tests
+    cache = statistics.get_statistics_during_period_cache(hass)
+    assert cache.compiled_until is None
+    cache.compiled_until = dt_util.utcnow().timestamp()
+
+    start = dt_util.as_utc(dt_util.parse_datetime("2022-10-01 00:00:00"))
+    metadata = {
+        "has_mean": False,
+        "has_sum": True,
+        "name": "Total imported energy",
+        "source": "test",
+        "statistic_id": "test:total_energy_import",
+        "unit_of_measurement": "kWh",
+    }
+    async_add_external_statistics(
+        hass,
+        metadata,
+        [
+            {"start": start + timedelta(hours=hour), "state": hour, "sum": hour}
+            for hour in range(24 * 3)
+        ],
+    )
+    wait_recording_done(hass)
+
+    statistic_ids = {"test:total_energy_import"}
+    end = start + timedelta(days=3)
+    with patch.object(
+        statistics,
+        "_query_statistics_during_period",
+        wraps=statistics._query_statistics_during_period,
+    ) as query_mock:
+        stats = statistics_during_period(hass, start, end, statistic_ids, "day")
+        assert query_mock.call_count == 1
+        assert [row["sum"] for row in stats["test:total_energy_import"]] == [
+            23,
+            47,
+            71,
+        ]
+        assert statistics_during_period(
+            hass, start, end, statistic_ids, "day", types={"change"}
+        ) == {
+            "test:total_energy_import": [
+                {"start": ANY, "end": ANY, "change": change} for change in (23, 24, 24)
+            ]
+        }
+        assert query_mock.call_count == 2
+        assert statistics_during_period(hass, start, end, statistic_ids, "day") == (
+            stats
+        )
+        assert query_mock.call_count == 2
+        # The periods until the compiled statistics are cached and the
+        # open periods after them are queried
+        statistics_during_period(hass, start, None, statistic_ids, "day")
+        assert query_mock.call_count == 4
+        assert query_mock.call_args[0][2] == start + timedelta(days=8)
+
+        # Importing statistics invalidates the cached periods
+        async_add_external_statistics(
+            hass, metadata, [{"start": start, "state": 100, "sum": 100}]
+        )
+        wait_recording_done(hass)
+        query_mock.reset_mock()
+        stats = statistics_during_period(hass, start, end, statistic_ids, "day")
+        assert query_mock.call_count == 1
+        assert stats["test:total_energy_import"][0]["state"] == 23
+
+        # Adjusting statistics invalidates the cached periods
+        get_instance(hass).async_adjust_statistics(
+            "test:total_energy_import", start + timedelta(hours=12), 1000, "kWh"
+        )
+        wait_recording_done(hass)
+        stats = statistics_during_period(hass, start, end, statistic_ids, "day")
+        assert query_mock.call_count == 2
+        assert [row["sum"] for row in stats["test:total_energy_import"]] == [
+            1023,
+            1047,
+            1071,
+        ]
+
+
 def test_cache_key_for_generate_statistics_during_period_stmt() -> None:
     """Test cache key for _generate_statistics_during_period_stmt."""
     stmt = _generate_statistics_during_period_stmt(
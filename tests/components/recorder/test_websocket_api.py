@@ -2139,8 +2139,10 @@ async def test_recorder_info(
     assert response["result"] == {
         "backlog": 0,
         "max_backlog": 65000,
+        "spooled_backlog": 0,
         "migration_in_progress": False,
         "migration_is_live": False,
+        "read_queries": {},
         "recording": True,
         "thread_running": True,
     }
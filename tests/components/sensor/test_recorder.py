@@ -3,7 +3,7 @@ from collections.abc import Callable
 from datetime import datetime, timedelta
 import math
 from statistics import mean
-from unittest.mock import patch
+from unittest.mock import ANY, patch
 
 from freezegun import freeze_time
 from freezegun.api import FrozenDateTimeFactory
@@ -24,15 +24,21 @@ from homeassistant.components.recorder.db_schema import (
 from homeassistant.components.recorder.models import (
     StatisticData,
     StatisticMetaData,
+    StatisticResult,
     process_timestamp,
 )
 from homeassistant.components.recorder.statistics import (
+    PlatformCompiledStatistics,
     async_import_statistics,
     get_metadata,
     list_statistic_ids,
 )
 from homeassistant.components.recorder.util import get_instance, session_scope
-from homeassistant.components.sensor import ATTR_OPTIONS, SensorDeviceClass
+from homeassistant.components.sensor import (
+    ATTR_OPTIONS,
+    SensorDeviceClass,
+    recorder as sensor_recorder,
+)
 from homeassistant.const import ATTR_FRIENDLY_NAME, STATE_UNAVAILABLE
 from homeassistant.core import HomeAssistant, State
 from homeassistant.setup import async_setup_component, setup_component
@@ -195,6 +201,161 @@ def test_compile_hourly_statistics(
     assert "Error while processing event StatisticsTask" not in caplog.text
 
 
+def test_compile_statistics_from_columns(
+    hass_recorder: Callable[..., HomeAssistant],
+) -> None:
+    """Test compiling measurement statistics from columns matches using states."""
+    zero = dt_util.utcnow()
+    hass = hass_recorder()
+    setup_component(hass, "sensor", {})
+    wait_recording_done(hass)  # Wait for the sensor recorder platform to be added
+    with freeze_time(zero) as freezer:
+        record_states(hass, freezer, zero, "sensor.power", POWER_SENSOR_ATTRIBUTES)
+        record_states(
+            hass,
+            freezer,
+            zero,
+            "sensor.temperature",
+            TEMPERATURE_SENSOR_ATTRIBUTES,
+            seq=[21.5, "unavailable", 23],
+        )
+        record_states(hass, freezer, zero, "sensor.energy", ENERGY_SENSOR_ATTRIBUTES)
+        # The unit of this sensor changes, it's compiled from the states
+        _, states = record_states(
+            hass, freezer, zero, "sensor.battery", BATTERY_SENSOR_ATTRIBUTES
+        )
+        freezer.move_to(zero + timedelta(minutes=4, seconds=40))
+        hass.states.set("sensor.battery", "20", NONE_SENSOR_ATTRIBUTES)
+        wait_recording_done(hass)
+
+    end = zero + timedelta(minutes=5)
+    with session_scope(hass=hass, read_only=True) as session:
+        columns = history.get_significant_state_columns_with_session(
+            hass,
+            session,
+            zero,
+            end,
+            ["sensor.power", "sensor.temperature", "sensor.missing"],
+        )
+    assert columns == {
+        "sensor.power": (
+            ("-10", "15", "30"),
+            tuple(state.last_updated.timestamp() for state in states["sensor.battery"]),
+            (ANY, ANY, ANY),
+        ),
+        "sensor.temperature": (
+            ("21.5", "unavailable", "23"),
+            tuple(state.last_updated.timestamp() for state in states["sensor.battery"]),
+            (ANY, ANY, ANY),
+        ),
+    }
+
+    from_columns = sensor_recorder.compile_statistics(hass, zero, end)
+    with patch.object(
+        history, "get_significant_state_columns_with_session", return_value=None
+    ):
+        from_states = sensor_recorder.compile_statistics(hass, zero, end)
+
+    assert _by_statistic_id(from_columns).keys() == {
+        "sensor.battery",
+        "sensor.energy",
+        "sensor.power",
+        "sensor.temperature",
+    }
+    _assert_compiled_equal(from_columns, from_states)
+
+
+def test_compile_sum_statistics_from_columns(
+    hass_recorder: Callable[..., HomeAssistant], caplog: pytest.LogCaptureFixture
+) -> None:
+    """Test compiling sum statistics from columns matches using states."""
+    period0 = dt_util.utcnow()
+    hass = hass_recorder()
+    setup_component(hass, "sensor", {})
+    wait_recording_done(hass)  # Wait for the sensor recorder platform to be added
+    with freeze_time(period0) as freezer:
+        for entity_id, attributes, seq in (
+            (
+                "sensor.total_increasing",
+                {**ENERGY_SENSOR_ATTRIBUTES, "state_class": "total_increasing"},
+                [10, 15, 20, 19, 30, 40, 3, -1, 70],
+            ),
+            (
+                "sensor.total",
+                ENERGY_SENSOR_ATTRIBUTES,
+                [10, 15, 20, 10, 30, 40, 50, "unavailable", 70],
+            ),
+            (
+                "sensor.total_last_reset",
+                {**ENERGY_SENSOR_ATTRIBUTES, "last_reset": None},
+                [10, 15, 20, 10, 30, 40, 50, 60, 70],
+            ),
+        ):
+            record_meter_states(hass, freezer, period0, entity_id, attributes, seq)
+    wait_recording_done(hass)
+
+    for period in range(3):
+        start = period0 + timedelta(minutes=5 * period)
+        end = start + timedelta(minutes=5)
+        with patch.object(
+            history,
+            "get_full_significant_states_with_session",
+            wraps=history.get_full_significant_states_with_session,
+        ) as get_full_significant_states_mock:
+            from_columns = sensor_recorder.compile_statistics(hass, start, end)
+        get_full_significant_states_mock.assert_not_called()
+        with patch.object(
+            history, "get_significant_state_columns_with_session", return_value=None
+        ):
+            from_states = sensor_recorder.compile_statistics(hass, start, end)
+
+        assert _by_statistic_id(from_columns).keys() == {
+            "sensor.total",
+            "sensor.total_increasing",
+            "sensor.total_last_reset",
+        }
+        _assert_compiled_equal(from_columns, from_states)
+        # The next period continues from the statistics of this one
+        do_adhoc_statistics(hass, start=start)
+        wait_recording_done(hass)
+
+    assert (
+        "Entity sensor.total_increasing has state class total_increasing, but its "
+        "state is negative."
+    ) in caplog.text
+    assert "Detected new cycle for sensor.total_last_reset, last_reset set to" in (
+        caplog.text
+    )
+    assert "Detected new cycle for sensor.total_increasing, value dropped" in (
+        caplog.text
+    )
+
+
+def _by_statistic_id(
+    compiled: PlatformCompiledStatistics,
+) -> dict[str, StatisticResult]:
+    """Return the compiled statistics by statistic_id."""
+    return {
+        result["meta"]["statistic_id"]: result for result in compiled.platform_stats
+    }
+
+
+def _assert_compiled_equal(
+    compiled: PlatformCompiledStatistics, expected: PlatformCompiledStatistics
+) -> None:
+    """Assert statistics compiled in different ways are equal."""
+    compiled_by_id = _by_statistic_id(compiled)
+    expected_by_id = _by_statistic_id(expected)
+    assert compiled_by_id.keys() == expected_by_id.keys()
+    for statistic_id, result in compiled_by_id.items():
+        expected_result = expected_by_id[statistic_id]
+        assert result["meta"] == expected_result["meta"]
+        assert result["stat"] == {
+            key: pytest.approx(value) if isinstance(value, float) else value
+            for key, value in expected_result["stat"].items()
+        }
+
+
 @pytest.mark.parametrize(
     (
         "device_class",
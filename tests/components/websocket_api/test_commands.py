@@ -3,6 +3,7 @@ import asyncio
 from copy import deepcopy
 import datetime
 import logging
+from typing import Any
 from unittest.mock import ANY, AsyncMock, Mock, patch
 
 import pytest
@@ -30,8 +31,10 @@ from tests.common import (
     MockConfigEntry,
     MockEntity,
     MockEntityPlatform,
+    MockModule,
     MockUser,
     async_mock_service,
+    mock_integration,
     mock_platform,
 )
 from tests.typing import (
@@ -559,6 +562,56 @@ async def test_get_states(
     assert msg["result"] == states
 
 
+async def test_get_states_after_state_changes(
+    hass: HomeAssistant,
+    websocket_client: MockHAClientWebSocket,
+    hass_admin_user: MockUser,
+) -> None:
+    """Test get_states and subscribe_entities follow state changes."""
+    hass.states.async_set("greeting.hello", "world")
+    hass.states.async_set("light.kitchen", "on")
+    hass.states.async_set("light.hidden", "on")
+
+    async def _get_states(msg_id: int) -> list[dict[str, Any]]:
+        await websocket_client.send_json({"id": msg_id, "type": "get_states"})
+        msg = await websocket_client.receive_json()
+        assert msg["id"] == msg_id
+        assert msg["success"]
+        return msg["result"]
+
+    def _expected_states(*entity_ids: str) -> list[dict[str, Any]]:
+        return [hass.states.get(entity_id).as_dict() for entity_id in entity_ids]
+
+    assert await _get_states(1) == _expected_states(
+        "greeting.hello", "light.kitchen", "light.hidden"
+    )
+    hass.states.async_set("light.kitchen", "off")
+    hass.states.async_remove("greeting.hello")
+    hass.states.async_set("switch.new", "on")
+    assert await _get_states(2) == _expected_states(
+        "light.kitchen", "light.hidden", "switch.new"
+    )
+
+    hass_admin_user.groups = []
+    hass_admin_user.mock_policy(
+        {
+            "entities": {
+                "domains": {"switch": True},
+                "entity_ids": {"light.kitchen": True},
+            }
+        }
+    )
+    assert await _get_states(3) == _expected_states("light.kitchen", "switch.new")
+
+    await websocket_client.send_json({"id": 4, "type": "subscribe_entities"})
+    msg = await websocket_client.receive_json()
+    assert msg["success"]
+    msg = await websocket_client.receive_json()
+    assert msg["id"] == 4
+    assert set(msg["event"]["a"]) == {"light.kitchen", "switch.new"}
+    assert msg["event"]["a"]["light.kitchen"]["s"] == "off"
+
+
 async def test_get_services(
     hass: HomeAssistant, websocket_client: MockHAClientWebSocket
 ) -> None:
@@ -2317,6 +2370,37 @@ async def test_integration_setup_info(
     ]
 
 
+async def test_integration_startup_profile(
+    hass: HomeAssistant,
+    websocket_client: MockHAClientWebSocket,
+    hass_admin_user: MockUser,
+) -> None:
+    """Test integration/startup_profile command."""
+    mock_integration(hass, MockModule("comp_a"))
+    mock_integration(hass, MockModule("comp_b", dependencies=["comp_a"]))
+    assert await async_setup_component(hass, "comp_b", {})
+
+    await websocket_client.send_json({"id": 7, "type": "integration/startup_profile"})
+
+    msg = await websocket_client.receive_json()
+    assert msg["id"] == 7
+    assert msg["type"] == const.TYPE_RESULT
+    assert msg["success"]
+    assert msg["result"]["critical_path"] == ["comp_a", "comp_b"]
+    assert msg["result"]["integrations"]["comp_b"]["stages"]["setup"] == {
+        "start": ANY,
+        "seconds": ANY,
+    }
+
+    hass_admin_user.groups = []
+    await websocket_client.send_json({"id": 8, "type": "integration/startup_profile"})
+
+    msg = await websocket_client.receive_json()
+    assert msg["id"] == 8
+    assert not msg["success"]
+    assert msg["error"]["code"] == const.ERR_UNAUTHORIZED
+
+
 @pytest.mark.parametrize(
     ("key", "config"),
     (
@@ -709,6 +709,42 @@ async def test_removing_area_id(
     assert entry_w_area != entry_wo_area
 
 
+async def test_entries_for_indexes_follow_updates(
+    hass: HomeAssistant,
+    device_registry: dr.DeviceRegistry,
+    mock_config_entry: MockConfigEntry,
+) -> None:
+    """Test the config entry and area lookups follow registry changes."""
+    other_config_entry = MockConfigEntry()
+    other_config_entry.add_to_hass(hass)
+    config_entry_1 = mock_config_entry.entry_id
+    config_entry_2 = other_config_entry.entry_id
+    entry = device_registry.async_get_or_create(
+        config_entry_id=config_entry_1,
+        connections={(dr.CONNECTION_NETWORK_MAC, "12:34:56:AB:CD:EF")},
+        identifiers={("bridgeid", "0123")},
+    )
+    assert dr.async_entries_for_config_entry(device_registry, config_entry_1) == [entry]
+
+    entry = device_registry.async_update_device(
+        entry.id, area_id="12345A", add_config_entry_id=config_entry_2
+    )
+    assert dr.async_entries_for_area(device_registry, "12345A") == [entry]
+    assert dr.async_entries_for_config_entry(device_registry, config_entry_1) == [entry]
+    assert dr.async_entries_for_config_entry(device_registry, config_entry_2) == [entry]
+
+    entry = device_registry.async_update_device(
+        entry.id, area_id="67890B", remove_config_entry_id=config_entry_1
+    )
+    assert dr.async_entries_for_area(device_registry, "12345A") == []
+    assert dr.async_entries_for_area(device_registry, "67890B") == [entry]
+    assert dr.async_entries_for_config_entry(device_registry, config_entry_1) == []
+
+    device_registry.async_remove_device(entry.id)
+    assert dr.async_entries_for_area(device_registry, "67890B") == []
+    assert dr.async_entries_for_config_entry(device_registry, config_entry_2) == []
+
+
 async def test_specifying_via_device_create(
     hass: HomeAssistant, device_registry: dr.DeviceRegistry
 ) -> None:
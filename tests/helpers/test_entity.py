@@ -15,6 +15,8 @@ from homeassistant.const import (
     ATTR_ATTRIBUTION,
     ATTR_DEVICE_CLASS,
     ATTR_FRIENDLY_NAME,
+    ATTR_ICON,
+    EVENT_STATE_CHANGED,
     STATE_UNAVAILABLE,
     STATE_UNKNOWN,
 )
@@ -22,6 +24,7 @@ from homeassistant.core import Context, HomeAssistant, HomeAssistantError
 from homeassistant.helpers import device_registry as dr, entity, entity_registry as er
 from homeassistant.helpers.entity_component import async_update_entity
 from homeassistant.helpers.typing import UNDEFINED, UndefinedType
+import homeassistant.util.dt as dt_util
 
 from tests.common import (
     MockConfigEntry,
@@ -29,6 +32,8 @@ from tests.common import (
     MockEntityPlatform,
     MockModule,
     MockPlatform,
+    async_capture_events,
+    async_fire_time_changed,
     get_test_home_assistant,
     mock_integration,
     mock_registry,
@@ -120,11 +125,9 @@ class TestHelpersEntity:
         """Test device class attribute."""
         state = self.hass.states.get(self.entity.entity_id)
         assert state.attributes.get(ATTR_DEVICE_CLASS) is None
-        with patch(
-            "homeassistant.helpers.entity.Entity.device_class", new="test_class"
-        ):
-            self.entity.schedule_update_ha_state()
-            self.hass.block_till_done()
+        self.entity._attr_device_class = "test_class"
+        self.entity.schedule_update_ha_state()
+        self.hass.block_till_done()
         state = self.hass.states.get(self.entity.entity_id)
         assert state.attributes.get(ATTR_DEVICE_CLASS) == "test_class"
 
@@ -651,6 +654,91 @@ async def test_set_context_expired(hass: HomeAssistant) -> None:
     assert ent._context_set is None
 
 
+async def test_coalesce_state_writes(hass: HomeAssistant) -> None:
+    """Test the state writes of the same event loop iteration are coalesced."""
+    events = async_capture_events(hass, EVENT_STATE_CHANGED)
+    ent = entity.Entity()
+    ent.hass = hass
+    ent.entity_id = "hello.world"
+    ent._attr_coalesce_state_writes = timedelta(0)
+
+    for value in range(50):
+        ent._attr_state = value
+        ent.async_write_ha_state()
+    # The first state is written immediately
+    assert len(events) == 1
+    assert hass.states.get("hello.world").state == "0"
+
+    await hass.async_block_till_done()
+    assert len(events) == 2
+    assert hass.states.get("hello.world").state == "49"
+    assert ent._coalesced_state_writes == 48
+
+    ent._attr_state = 50
+    ent.async_write_ha_state()
+    await hass.async_block_till_done()
+    assert len(events) == 3
+    assert hass.states.get("hello.world").state == "50"
+
+
+async def test_coalesce_state_writes_window(hass: HomeAssistant) -> None:
+    """Test the state writes within a window are written at its end."""
+    events = async_capture_events(hass, EVENT_STATE_CHANGED)
+    ent = entity.Entity()
+    ent.hass = hass
+    ent.entity_id = "hello.world"
+    ent._attr_coalesce_state_writes = timedelta(seconds=1)
+
+    ent._attr_state = "on"
+    ent.async_write_ha_state()
+    assert len(events) == 1
+    assert hass.states.get("hello.world").state == "on"
+
+    ent._attr_state = "off"
+    ent.async_write_ha_state()
+    await hass.async_block_till_done()
+    ent._attr_state = "unavailable"
+    ent.async_write_ha_state()
+    await hass.async_block_till_done()
+    assert hass.states.get("hello.world").state == "on"
+
+    async_fire_time_changed(hass, dt_util.utcnow() + timedelta(seconds=1))
+    await hass.async_block_till_done()
+    assert len(events) == 2
+    assert hass.states.get("hello.world").state == "unavailable"
+    assert ent._coalesced_state_writes == 1
+
+    # Updating the entity writes the state and the pending write
+    ent._attr_state = "on"
+    ent.async_write_ha_state()
+    await ent.async_update_ha_state(True)
+    assert len(events) == 3
+    assert hass.states.get("hello.world").state == "on"
+
+    async_fire_time_changed(hass, dt_util.utcnow() + timedelta(seconds=2))
+    await hass.async_block_till_done()
+    assert len(events) == 3
+
+
+async def test_coalesce_state_writes_removed(hass: HomeAssistant) -> None:
+    """Test the pending state write is cancelled when the entity is removed."""
+    platform = MockEntityPlatform(hass)
+    ent = entity.Entity()
+    ent.entity_id = "hello.world"
+    ent._attr_coalesce_state_writes = timedelta(seconds=1)
+    await platform.async_add_entities([ent])
+    await hass.async_block_till_done()
+    # The state is written immediately when the entity is added
+    assert hass.states.get("hello.world").state == STATE_UNKNOWN
+
+    ent._attr_state = "on"
+    ent.async_write_ha_state()
+    await platform.async_remove_entity(ent.entity_id)
+    async_fire_time_changed(hass, dt_util.utcnow() + timedelta(seconds=1))
+    await hass.async_block_till_done()
+    assert hass.states.get("hello.world") is None
+
+
 async def test_warn_disabled(
     hass: HomeAssistant, caplog: pytest.LogCaptureFixture
 ) -> None:
@@ -1392,6 +1480,57 @@ async def test_friendly_name_updated(
     assert state.attributes.get(ATTR_FRIENDLY_NAME) == expected_friendly_name3
 
 
+async def test_cached_state_attributes(hass: HomeAssistant) -> None:
+    """Test state attributes are cached until an attribute they read is set."""
+
+    class CachedEntity(entity.Entity):
+        """Entity which does not override the properties."""
+
+        _attr_icon = "mdi:one"
+        _attr_name = "Cached"
+
+    class DynamicIconEntity(CachedEntity):
+        """Entity which overrides the icon property."""
+
+        dynamic_icon = "mdi:dynamic"
+
+        @property
+        def icon(self) -> str:
+            """Return the icon."""
+            return self.dynamic_icon
+
+    ent = CachedEntity()
+    ent.hass = hass
+    ent.entity_id = "test.cached"
+    ent.async_write_ha_state()
+    state = hass.states.get("test.cached")
+    assert state.attributes[ATTR_ICON] == "mdi:one"
+    assert state.attributes[ATTR_FRIENDLY_NAME] == "Cached"
+
+    ent._attr_icon = "mdi:two"
+    ent._attr_name = "Renamed"
+    ent.async_write_ha_state()
+    state = hass.states.get("test.cached")
+    assert state.attributes[ATTR_ICON] == "mdi:two"
+    assert state.attributes[ATTR_FRIENDLY_NAME] == "Renamed"
+
+    del ent._attr_icon
+    ent.async_write_ha_state()
+    assert hass.states.get("test.cached").attributes[ATTR_ICON] == "mdi:one"
+
+    ent = DynamicIconEntity()
+    ent.hass = hass
+    ent.entity_id = "test.dynamic"
+    ent.async_write_ha_state()
+    assert hass.states.get("test.dynamic").attributes[ATTR_ICON] == "mdi:dynamic"
+
+    ent.dynamic_icon = "mdi:changed"
+    ent.async_write_ha_state()
+    state = hass.states.get("test.dynamic")
+    assert state.attributes[ATTR_ICON] == "mdi:changed"
+    assert state.attributes[ATTR_FRIENDLY_NAME] == "Cached"
+
+
 async def test_translation_key(hass: HomeAssistant) -> None:
     """Test translation key property."""
     mock_entity1 = entity.Entity()
@@ -7,6 +7,7 @@ from typing import Any
 from unittest.mock import ANY, Mock, patch
 
 import pytest
+import voluptuous as vol
 
 from homeassistant.const import EVENT_HOMEASSISTANT_STARTED, PERCENTAGE
 from homeassistant.core import CoreState, HomeAssistant, callback
@@ -16,6 +17,7 @@ from homeassistant.helpers import (
     entity_platform,
     entity_registry as er,
     issue_registry as ir,
+    service,
 )
 from homeassistant.helpers.entity import (
     DeviceInfo,
@@ -1491,6 +1493,112 @@ async def test_platforms_sharing_services(hass: HomeAssistant) -> None:
     assert entity2 in entities
 
 
+async def test_platform_batch_entity_service_call(hass: HomeAssistant) -> None:
+    """Test a platform can handle an entity service call with one command."""
+    batched = []
+
+    async def async_batch_entity_service_call(hass, entities, call, data):
+        batched.append((call.service, list(entities), data))
+        return entities[:2]
+
+    platform = MockPlatform()
+    platform.async_batch_entity_service_call = async_batch_entity_service_call
+    entity_platform = MockEntityPlatform(
+        hass,
+        domain="mock_integration",
+        platform_name="mock_platform",
+        platform=platform,
+    )
+    called = []
+
+    class HelloEntity(MockEntity):
+        async def async_hello(self, value: int) -> None:
+            called.append((self, value))
+
+    entities = [
+        HelloEntity(entity_id=f"mock_integration.entity_{idx}") for idx in range(3)
+    ]
+    await entity_platform.async_add_entities(entities)
+
+    entity_platform.async_register_entity_service(
+        "hello", {vol.Required("value"): vol.Coerce(int)}, "async_hello"
+    )
+
+    await hass.services.async_call(
+        "mock_platform", "hello", {"entity_id": "all", "value": "1"}, blocking=True
+    )
+
+    # The batch gets the data the entities are called with
+    assert batched == [("hello", entities, {"value": 1})]
+    assert called == [(entities[2], 1)]
+    stats = service.async_get_entity_service_call_stats(hass)["mock_platform"]
+    assert stats.calls == 1
+    assert stats.entities == 3
+    assert stats.max_time == stats.total_time > 0
+
+    # A single entity is called directly
+    await hass.services.async_call(
+        "mock_platform",
+        "hello",
+        {"entity_id": entities[0].entity_id, "value": 2},
+        blocking=True,
+    )
+    assert len(batched) == 1
+    assert called == [(entities[2], 1), (entities[0], 2)]
+
+
+async def test_platform_parallel_service_calls(hass: HomeAssistant) -> None:
+    """Test a platform can limit the entity service calls which run in parallel."""
+    platform = MockPlatform()
+    platform.PARALLEL_SERVICE_CALLS = 2
+    entity_platform = MockEntityPlatform(
+        hass,
+        domain="mock_integration",
+        platform_name="mock_platform",
+        platform=platform,
+    )
+    await entity_platform.async_add_entities(
+        [MockEntity(entity_id=f"mock_integration.entity_{idx}") for idx in range(5)]
+    )
+
+    running = 0
+    max_running = 0
+    called = 0
+
+    async def handle_service(entity, data):
+        nonlocal running, max_running, called
+        running += 1
+        max_running = max(max_running, running)
+        await asyncio.sleep(0)
+        running -= 1
+        called += 1
+
+    entity_platform.async_register_entity_service("hello", {}, handle_service)
+
+    await hass.services.async_call(
+        "mock_platform", "hello", {"entity_id": "all"}, blocking=True
+    )
+
+    assert called == 5
+    assert max_running == 2
+
+    # Calls which each target a single entity are limited as well
+    max_running = 0
+    await asyncio.gather(
+        *(
+            hass.services.async_call(
+                "mock_platform",
+                "hello",
+                {"entity_id": f"mock_integration.entity_{idx}"},
+                blocking=True,
+            )
+            for idx in range(5)
+        )
+    )
+    assert called == 10
+    assert max_running == 2
+
+
 async def test_invalid_entity_id(hass: HomeAssistant) -> None:
     """Test specifying an invalid entity id."""
     platform = MockEntityPlatform(hass)
@@ -1370,6 +1370,50 @@ async def test_disabled_entities_excluded_from_entity_list(
     assert entries == [entry1, entry2]
 
 
+async def test_entries_for_indexes_follow_updates(
+    hass: HomeAssistant,
+    device_registry: dr.DeviceRegistry,
+    entity_registry: er.EntityRegistry,
+) -> None:
+    """Test the config entry, device and area lookups follow registry changes."""
+    config_entry = MockConfigEntry(domain="light")
+    config_entry.add_to_hass(hass)
+    device_entry = device_registry.async_get_or_create(
+        config_entry_id=config_entry.entry_id,
+        connections={(dr.CONNECTION_NETWORK_MAC, "12:34:56:AB:CD:EF")},
+    )
+
+    entry = entity_registry.async_get_or_create(
+        "light",
+        "hue",
+        "5678",
+        config_entry=config_entry,
+        device_id=device_entry.id,
+    )
+    assert er.async_entries_for_config_entry(
+        entity_registry, config_entry.entry_id
+    ) == [entry]
+    assert er.async_entries_for_device(entity_registry, device_entry.id) == [entry]
+    assert er.async_entries_for_area(entity_registry, "mock-area") == []
+
+    entry = entity_registry.async_update_entity(
+        entry.entity_id, area_id="mock-area", device_id=None
+    )
+    assert er.async_entries_for_device(entity_registry, device_entry.id) == []
+    assert er.async_entries_for_area(entity_registry, "mock-area") == [entry]
+
+    entry = entity_registry.async_update_entity(
+        entry.entity_id, new_entity_id="light.renamed"
+    )
+    assert er.async_entries_for_area(entity_registry, "mock-area") == [entry]
+
+    entity_registry.async_remove(entry.entity_id)
+    assert (
+        er.async_entries_for_config_entry(entity_registry, config_entry.entry_id) == []
+    )
+    assert er.async_entries_for_area(entity_registry, "mock-area") == []
+
+
 async def test_entity_max_length_exceeded(entity_registry: er.EntityRegistry) -> None:
     """Test that an exception is raised when the max character length is exceeded."""
 
@@ -13,7 +13,7 @@ from freezegun.api import FrozenDateTimeFactory
 import jinja2
 import pytest
 
-from homeassistant.const import MATCH_ALL
+from homeassistant.const import EVENT_STATE_CHANGED, MATCH_ALL
 import homeassistant.core as ha
 from homeassistant.core import HomeAssistant, callback
 from homeassistant.exceptions import TemplateError
@@ -24,6 +24,7 @@ from homeassistant.helpers.event import (
     TrackStates,
     TrackTemplate,
     TrackTemplateResult,
+    TrackTemplateResultInfo,
     async_call_later,
     async_track_device_registry_updated_event,
     async_track_entity_registry_updated_event,
@@ -1896,6 +1897,62 @@ async def test_track_template_result_complex(hass: HomeAssistant) -> None:
     }
 
 
+async def test_track_template_result_shared_dispatch(hass: HomeAssistant) -> None:
+    """Test template trackers only re-render for state changes they depend on."""
+    hass.states.async_set("light.one", "on")
+    hass.states.async_set("sensor.one", "1")
+    listeners_before = hass.bus.async_listeners().get(EVENT_STATE_CHANGED, 0)
+
+    @callback
+    def run_callback(
+        event: EventType[EventStateChangedData] | None,
+        updates: list[TrackTemplateResult],
+    ) -> None:
+        pass
+
+    def track(template_str: str) -> TrackTemplateResultInfo:
+        return async_track_template_result(
+            hass,
+            [TrackTemplate(Template(template_str, hass), None, timedelta(seconds=0))],
+            run_callback,
+        )
+
+    light_info = track("{{ states.light | count }}")
+    sensor_info = track("{{ states('sensor.one') }}")
+    all_infos = [
+        track("{{ states | map(attribute='state') | list }}") for _ in range(3)
+    ]
+    await hass.async_block_till_done()
+
+    # Domain and all states trackers share one listener
+    assert hass.bus.async_listeners()[EVENT_STATE_CHANGED] == listeners_before + 2
+
+    def rerenders(info: TrackTemplateResultInfo) -> int:
+        return sum(info.rerenders.values())
+
+    hass.states.async_set("light.two", "on")
+    await hass.async_block_till_done()
+    assert rerenders(light_info) == 1
+    assert rerenders(sensor_info) == 0
+    assert [rerenders(info) for info in all_infos] == [1, 1, 1]
+
+    hass.states.async_set("sensor.one", "2")
+    await hass.async_block_till_done()
+    assert rerenders(light_info) == 1
+    assert rerenders(sensor_info) == 1
+    assert [rerenders(info) for info in all_infos] == [2, 2, 2]
+
+    hass.states.async_set("switch.one", "on")
+    await hass.async_block_till_done()
+    assert rerenders(light_info) == 1
+    assert rerenders(sensor_info) == 1
+    assert [rerenders(info) for info in all_infos] == [3, 3, 3]
+
+    for info in (light_info, sensor_info, *all_infos):
+        info.async_remove()
+    assert hass.bus.async_listeners().get(EVENT_STATE_CHANGED, 0) == listeners_before
+
+
 async def test_track_template_result_with_wildcard(hass: HomeAssistant) -> None:
     """Test tracking template with a wildcard."""
     specific_runs = []
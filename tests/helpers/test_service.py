@@ -21,6 +21,7 @@ from homeassistant.const import (
 )
 from homeassistant.core import Context, HomeAssistant, ServiceCall, SupportsResponse
 from homeassistant.helpers import (
+    area_registry as ar,
     device_registry as dr,
     entity_registry as er,
     service,
@@ -30,6 +31,7 @@ import homeassistant.helpers.config_validation as cv
 from homeassistant.setup import async_setup_component
 
 from tests.common import (
+    MockConfigEntry,
     MockEntity,
     MockUser,
     async_mock_service,
@@ -545,6 +547,48 @@ async def test_extract_entity_ids_from_devices(hass: HomeAssistant, area_mock) -
     )
 
 
+async def test_extract_entity_ids_follows_registry_updates(
+    hass: HomeAssistant,
+    area_registry: ar.AreaRegistry,
+    device_registry: dr.DeviceRegistry,
+    entity_registry: er.EntityRegistry,
+) -> None:
+    """Test extract_entity_ids finds the entities of areas and devices as they move."""
+    config_entry = MockConfigEntry(domain="test")
+    config_entry.add_to_hass(hass)
+    kitchen = area_registry.async_create("Kitchen")
+    hallway = area_registry.async_create("Hallway")
+    device = device_registry.async_get_or_create(
+        config_entry_id=config_entry.entry_id,
+        identifiers={("test", "lamp")},
+    )
+    entity_registry.async_get_or_create(
+        "light", "test", "lamp", device_id=device.id, config_entry=config_entry
+    )
+    kitchen_call = ServiceCall("light", "turn_on", {"area_id": kitchen.id})
+    hallway_call = ServiceCall("light", "turn_on", {"area_id": hallway.id})
+    assert await service.async_extract_entity_ids(hass, kitchen_call) == set()
+
+    device_registry.async_update_device(device.id, area_id=kitchen.id)
+    assert await service.async_extract_entity_ids(hass, kitchen_call) == {
+        "light.test_lamp"
+    }
+
+    entity_registry.async_update_entity("light.test_lamp", area_id=hallway.id)
+    assert await service.async_extract_entity_ids(hass, kitchen_call) == set()
+    assert await service.async_extract_entity_ids(hass, hallway_call) == {
+        "light.test_lamp"
+    }
+    assert await service.async_extract_entity_ids(
+        hass, ServiceCall("light", "turn_on", {"device_id": device.id})
+    ) == {"light.test_lamp"}
+
+    entity_registry.async_update_entity(
+        "light.test_lamp", hidden_by=er.RegistryEntryHider.USER
+    )
+    assert await service.async_extract_entity_ids(hass, hallway_call) == set()
+
+
 async def test_async_get_all_descriptions(hass: HomeAssistant) -> None:
     """Test async_get_all_descriptions."""
     group = hass.components.group
@@ -4073,27 +4073,50 @@ def test_iif(hass: HomeAssistant) -> None:
     assert tpl.async_render() == "no"
 
 
-async def test_cache_garbage_collection() -> None:
-    """Test caching a template."""
+async def test_compiled_code_cache(hass: HomeAssistant) -> None:
+    """Test templates with the same source share their compiled code."""
+    template.TEMPLATE_CODE_CACHE.clear()
     template_string = (
         "{% set dict = {'foo': 'x&y', 'bar': 42} %} {{ dict | urlencode }}"
     )
-    tpl = template.Template(
-        (template_string),
-    )
+    tpl = template.Template(template_string)
     tpl.ensure_valid()
-    assert template._NO_HASS_ENV.template_cache.get(template_string)
+    assert template.TEMPLATE_CODE_CACHE.misses == 1
+    assert template.TEMPLATE_CODE_CACHE.hits == 0
 
-    tpl2 = template.Template(
-        (template_string),
-    )
+    tpl2 = template.Template(template_string)
     tpl2.ensure_valid()
-    assert template._NO_HASS_ENV.template_cache.get(template_string)
-
-    del tpl
-    assert template._NO_HASS_ENV.template_cache.get(template_string)
-    del tpl2
-    assert not template._NO_HASS_ENV.template_cache.get(template_string)
+    assert template.TEMPLATE_CODE_CACHE.misses == 1
+    assert template.TEMPLATE_CODE_CACHE.hits == 1
+    assert tpl._compiled_code is tpl2._compiled_code
+
+    # The code is kept after the templates are gone
+    del tpl, tpl2
+    tpl3 = template.Template(template_string)
+    tpl3.ensure_valid()
+    assert template.TEMPLATE_CODE_CACHE.misses == 1
+    assert template.TEMPLATE_CODE_CACHE.hits == 2
+
+    # Environments of other flavors compile the source separately
+    tpl4 = template.Template(template_string, hass)
+    tpl4.ensure_valid()
+    assert template.TEMPLATE_CODE_CACHE.misses == 2
+    assert len(template.TEMPLATE_CODE_CACHE) == 2
+    assert tpl4.async_render() == "foo=x%26y&bar=42"
+
+
+async def test_compiled_code_cache_is_bounded() -> None:
+    """Test the compiled code cache evicts the least recently used code."""
+    with patch.object(
+        template,
+        "TEMPLATE_CODE_CACHE",
+        template.TemplateCodeCache(2),
+    ):
+        for idx in range(3):
+            template.Template(f"{{{{ {idx} }}}}").ensure_valid()
+        assert len(template.TEMPLATE_CODE_CACHE) == 2
+        template.Template("{{ 0 }}").ensure_valid()
+        assert template.TEMPLATE_CODE_CACHE.misses == 4
 
 
 def test_is_template_string() -> None:
@@ -0,0 +1,57 @@
+"""Test the startup profile script."""
+import pytest
+
+from homeassistant.scripts import startup_profile
+
+IMPORTTIME_OUTPUT = f"""\
+import time: self [us] | cumulative | imported package
+import time:       120 |        120 | homeassistant.core
+{startup_profile.IMPORT_MARKER}
+import time:       200 |        200 |     json.decoder
+import time:      1000 |       1200 |   fake_requirement
+import time:       500 |       1700 | homeassistant.components.fake
+{startup_profile.RSS_MARKER} 1000 5096
+"""
+
+
+def test_parse_import_profile() -> None:
+    """Test parsing the import profile of a module."""
+    profile = startup_profile.parse_import_profile(
+        "homeassistant.components.fake", IMPORTTIME_OUTPUT
+    )
+
+    assert profile.rss_delta == 4096
+    assert profile.as_dict(2) == pytest.approx(
+        {
+            "module": "homeassistant.components.fake",
+            "error": None,
+            "seconds": 0.0017,
+            "first_party_seconds": 0.0005,
+            "requirement_seconds": 0.001,
+            "stdlib_seconds": 0.0002,
+            "rss_delta": 4096,
+            "slowest_modules": [
+                {
+                    "module": "fake_requirement",
+                    "kind": "requirement",
+                    "self_seconds": 0.001,
+                    "cumulative_seconds": 0.0012,
+                },
+                {
+                    "module": "homeassistant.components.fake",
+                    "kind": "first_party",
+                    "self_seconds": 0.0005,
+                    "cumulative_seconds": 0.0017,
+                },
+            ],
+        }
+    )
+
+
+def test_run(capsys) -> None:
+    """Test running the script on an integration."""
+    assert startup_profile.run(["sun", "--limit", "1"]) == 0
+
+    captured = capsys.readouterr()
+    assert captured.out.startswith("homeassistant.components.sun: ")
+    assert "requirements" in captured.out
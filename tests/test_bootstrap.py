@@ -958,3 +958,94 @@ async def test_bootstrap_dependencies(
     assert (
         f"Dependency {integration} will wait for dependencies ['mqtt']" in caplog.text
     )
+
+
+async def test_preload_integrations(hass: HomeAssistant) -> None:
+    """Test the modules of integrations are preloaded in the executor."""
+    integrations = {
+        domain: mock_integration(hass, MockModule(domain))
+        for domain in ("comp_yaml", "comp_entry", "sensor")
+    }
+    mock_integration(hass, MockModule("comp_platform"))
+    MockConfigEntry(domain="comp_entry").add_to_hass(hass)
+    preloaded: dict[str, set[str]] = {}
+
+    def _import_modules(integration: Integration, platform_names: Iterable[str]):
+        preloaded[integration.domain] = set(platform_names)
+
+    with patch.object(Integration, "import_modules", _import_modules):
+        await bootstrap._async_preload_integrations(
+            hass,
+            integrations,
+            {"comp_yaml": {}, "sensor": [{"platform": "comp_platform"}]},
+        )
+
+    assert preloaded == {
+        "comp_yaml": set(),
+        "comp_entry": bootstrap.BASE_PLATFORMS,
+        "sensor": set(),
+        "comp_platform": {"sensor"},
+    }
+
+
+async def test_setup_waits_for_preload(hass: HomeAssistant) -> None:
+    """Test stage 1 waits only for the preload of its own integrations."""
+    mock_integration(hass, MockModule("comp"))
+    mock_integration(hass, MockModule("cloud"))
+    order: list[Any] = []
+
+    async def _async_preload_integrations(
+        hass: HomeAssistant, integrations: dict[str, Integration], config: ConfigType
+    ) -> None:
+        await asyncio.sleep(0)
+        order.append(("preload", set(integrations)))
+
+    async def _async_setup_multi_components(hass, domains, config) -> None:
+        order.append(("setup", domains))
+
+    with patch(
+        "homeassistant.bootstrap._async_preload_integrations",
+        side_effect=_async_preload_integrations,
+    ), patch(
+        "homeassistant.bootstrap.async_setup_multi_components",
+        side_effect=_async_setup_multi_components,
+    ):
+        await bootstrap._async_set_up_integrations(
+            hass, {"logger": {}, "comp": {}, "cloud": {}}
+        )
+
+    # Logging is set up during the preload of stage 1 and stage 2 is only
+    # preloaded once stage 1 is set up
+    assert order == [
+        ("setup", {"logger"}),
+        ("preload", {"cloud"}),
+        ("setup", {"cloud"}),
+        ("setup", {"comp"}),
+        ("preload", {"comp"}),
+    ]
+
+
+async def test_preload_skips_integrations_with_missing_requirements(
+    hass: HomeAssistant,
+) -> None:
+    """Test integrations whose requirements are not installed are not preloaded."""
+    integrations = {
+        "comp_installed": mock_integration(
+            hass, MockModule("comp_installed", requirements=["installed==1.0"])
+        ),
+        "comp_upgraded": mock_integration(
+            hass, MockModule("comp_upgraded", requirements=["upgraded==2.0"])
+        ),
+    }
+    preloaded: list[str] = []
+
+    def _import_modules(integration: Integration, platform_names: Iterable[str]):
+        preloaded.append(integration.domain)
+
+    with patch.object(Integration, "import_modules", _import_modules), patch(
+        "homeassistant.bootstrap.is_installed",
+        side_effect=lambda requirement: requirement == "installed==1.0",
+    ):
+        await bootstrap._async_preload_integrations(hass, integrations, {})
+
+    assert preloaded == ["comp_installed"]
@@ -931,6 +931,80 @@ async def test_eventbus_coroutine_event_listener(hass: HomeAssistant) -> None:
     assert len(coroutine_calls) == 1
 
 
+async def test_eventbus_match_all_listener(hass: HomeAssistant) -> None:
+    """Test MATCH_ALL listeners get all events except the close event."""
+    calls = []
+
+    @ha.callback
+    def listener(event):
+        calls.append(event.event_type)
+
+    unsub = hass.bus.async_listen(MATCH_ALL, listener)
+    unsub_test = hass.bus.async_listen("test", lambda event: None)
+
+    hass.bus.async_fire("test")
+    hass.bus.async_fire("no_listeners")
+    hass.bus.async_fire(EVENT_HOMEASSISTANT_CLOSE)
+    await hass.async_block_till_done()
+    assert calls == ["test", "no_listeners"]
+
+    unsub()
+    hass.bus.async_fire("test")
+    hass.bus.async_fire("no_listeners")
+    await hass.async_block_till_done()
+    assert calls == ["test", "no_listeners"]
+
+    unsub_test()
+
+
+async def test_eventbus_batched_listener(hass: HomeAssistant) -> None:
+    """Test batched listeners receive the events of a loop iteration at once."""
+    batches = []
+
+    @ha.callback
+    def listener(events):
+        batches.append([event.data["idx"] for event in events])
+
+    @ha.callback
+    def event_filter(event):
+        return event.data["idx"] != 1
+
+    unsub = hass.bus.async_listen_batched("test", listener, event_filter)
+
+    for idx in range(4):
+        hass.bus.async_fire("test", {"idx": idx})
+    hass.bus.async_fire("other", {"idx": 5})
+    assert batches == []
+    await hass.async_block_till_done()
+    assert batches == [[0, 2, 3]]
+
+    hass.bus.async_fire("test", {"idx": 4})
+    await hass.async_block_till_done()
+    assert batches == [[0, 2, 3], [4]]
+
+    unsub()
+    hass.bus.async_fire("test", {"idx": 6})
+    await hass.async_block_till_done()
+    assert batches == [[0, 2, 3], [4]]
+
+
+async def test_eventbus_batched_listener_with_thread(hass: HomeAssistant) -> None:
+    """Test batched listeners can run in the executor."""
+    batches = []
+
+    def listener(events):
+        batches.append(len(events))
+
+    unsub = await hass.async_add_executor_job(hass.bus.listen_batched, "test", listener)
+    hass.bus.async_fire("test")
+    hass.bus.async_fire("test")
+    await hass.async_block_till_done()
+    assert batches == [2]
+
+    await hass.async_add_executor_job(unsub)
+    assert "test" not in hass.bus.async_listeners()
+
+
 async def test_eventbus_max_length_exceeded(hass: HomeAssistant) -> None:
     """Test that an exception is raised when the max character length is exceeded."""
 
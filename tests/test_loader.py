@@ -1,4 +1,6 @@
 """Test to verify that we can load components."""
+import sys
+from types import ModuleType
 from unittest.mock import patch
 
 import pytest
@@ -744,3 +746,64 @@ async def test_loggers(hass: HomeAssistant) -> None:
         },
     )
     assert integration.loggers == ["name1", "name2"]
+
+
+async def test_import_profile(hass: HomeAssistant) -> None:
+    """Test imports of integration modules are recorded in the import profile."""
+    integration = mock_integration(hass, MockModule("comp_profile"))
+
+    def _import_module(name: str) -> ModuleType:
+        sys.modules["comp_profile_requirement"] = ModuleType("comp_profile_requirement")
+        sys.modules[name] = module = ModuleType(name)
+        return module
+
+    with patch.dict(sys.modules), patch(
+        "homeassistant.loader.importlib.import_module", side_effect=_import_module
+    ):
+        integration._import_module("homeassistant.components.comp_profile.light")
+        # Imported modules are not recorded again
+        integration._import_module("homeassistant.components.comp_profile.light")
+        await hass.async_add_executor_job(
+            integration._import_module, "homeassistant.components.comp_profile.sensor"
+        )
+
+    profile = hass.data[loader.DATA_IMPORT_PROFILE]["comp_profile"]
+    assert profile.modules.keys() == {
+        "homeassistant.components.comp_profile.light",
+        "homeassistant.components.comp_profile.sensor",
+    }
+    assert (
+        profile.loop_seconds
+        == profile.modules["homeassistant.components.comp_profile.light"]
+    )
+    assert (
+        profile.executor_seconds
+        == profile.modules["homeassistant.components.comp_profile.sensor"]
+    )
+    assert profile.first_party_modules == 2
+    assert profile.requirement_modules == 1
+    assert profile.requirements == {"comp_profile_requirement"}
+
+
+async def test_import_modules(hass: HomeAssistant) -> None:
+    """Test importing the component and existing platforms of an integration."""
+    integration = await loader.async_get_integration(hass, "sun")
+
+    await hass.async_add_executor_job(
+        integration.import_modules, ["sensor", "not_a_platform"]
+    )
+
+    assert "homeassistant.components.sun" in sys.modules
+    assert "homeassistant.components.sun.sensor" in sys.modules
+    assert "homeassistant.components.sun.not_a_platform" not in sys.modules
+
+
+async def test_import_modules_ignores_errors(hass: HomeAssistant) -> None:
+    """Test import errors are ignored when importing the modules."""
+    integration = await loader.async_get_integration(hass, "sun")
+
+    with patch(
+        "homeassistant.loader.importlib.import_module", side_effect=ImportError
+    ), patch.dict(sys.modules):
+        sys.modules.pop("homeassistant.components.sun", None)
+        await hass.async_add_executor_job(integration.import_modules, ["sensor"])
@@ -782,3 +782,38 @@ async def test_setup_config_entry_from_yaml(
     caplog.clear()
     hass.data.pop(setup.DATA_SETUP)
     hass.config.components.remove("test_integration_only_entry")
+
+
+async def test_async_get_startup_profile(hass: HomeAssistant) -> None:
+    """Test the startup profile records the setup stages and critical path."""
+    mock_integration(hass, MockModule("comp_a"))
+    mock_integration(hass, MockModule("comp_b", dependencies=["comp_a"]))
+    mock_integration(hass, MockModule("comp_c"))
+
+    assert await setup.async_setup_component(hass, "comp_c", {})
+    assert await setup.async_setup_component(hass, "comp_b", {})
+
+    profile = setup.async_get_startup_profile(hass)
+    assert profile["critical_path"] == ["comp_a", "comp_b"]
+    assert profile["integrations"].keys() == {"comp_a", "comp_b", "comp_c"}
+    stages = profile["integrations"]["comp_b"]["stages"]
+    assert list(stages) == [
+        "dependencies",
+        "requirements",
+        "import",
+        "config",
+        "setup",
+        "config_entries",
+    ]
+    assert all(stage["start"] >= 0 for stage in stages.values())
+    assert all(stage["seconds"] >= 0 for stage in stages.values())
+    # Mocked components are not imported
+    assert profile["integrations"]["comp_b"]["import"] is None
+
+
+async def test_async_get_startup_profile_empty(hass: HomeAssistant) -> None:
+    """Test the startup profile before any component is set up."""
+    assert setup.async_get_startup_profile(hass) == {
+        "integrations": {},
+        "critical_path": [],
+    }